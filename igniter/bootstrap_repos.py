@@ -10,7 +10,9 @@ import tempfile
 from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
+import json
 import platform
+from concurrent.futures import ThreadPoolExecutor
 
 from zipfile import ZipFile, BadZipFile
 
@@ -33,6 +35,9 @@ LOG_INFO = 0
 LOG_WARNING = 1
 LOG_ERROR = 3
 
+# count of threads calculating checksums during validation
+VALIDATION_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
 
 def sha256sum(filename):
     """Calculate sha256 for content of the file.
@@ -53,6 +58,132 @@ def sha256sum(filename):
     return h.hexdigest()
 
 
+def _validate_checksums(checksums: list, get_checksum: Callable) -> tuple:
+    """Calculate checksums of files in parallel and compare them.
+
+    Args:
+        checksums (list): Tuples with expected checksum and file name.
+        get_checksum (callable): Return checksum of file name. Should raise
+            `FileNotFoundError` for missing file.
+
+    Returns:
+        tuple(bool, str): with validity as first item
+            and string with reason as second.
+
+    """
+    with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+        futures = [
+            (
+                file_checksum,
+                file_name,
+                executor.submit(get_checksum, file_name)
+            )
+            for file_checksum, file_name in checksums
+        ]
+        try:
+            for file_checksum, file_name, future in futures:
+                try:
+                    current = future.result()
+                except FileNotFoundError:
+                    return False, f"Missing file [ {file_name} ]"
+
+                if file_checksum != current:
+                    return False, f"Invalid checksum on {file_name}"
+        finally:
+            # don't wait for rest of files if validation failed
+            for _, _, future in futures:
+                future.cancel()
+
+    return True, "All ok"
+
+
+class VersionValidationCache:
+    """Cache of successful validation of OpenPype version.
+
+    Validation is stored with fingerprint of validated files made from
+    their paths, count, sizes and modification times. Cache is stored next
+    to the version (inside version directory or next to zip file). If that
+    location is not writable, cache is stored in `fallback_dir`.
+
+    Args:
+        path (Path): Path to OpenPype version directory or zip file.
+        fallback_dir (Path, optional): Directory used if cache can't be
+            stored next to version.
+
+    """
+    cache_name = ".validation_cache.json"
+
+    def __init__(self, path: Path, fallback_dir: Path = None):
+        self.path = path
+        self.fallback_dir = fallback_dir
+
+    def get_cache_paths(self) -> List[Path]:
+        """Possible paths of cache file ordered by priority."""
+        if self.path.is_dir():
+            paths = [self.path / self.cache_name]
+        else:
+            paths = [self.path.with_name(self.path.name + self.cache_name)]
+
+        if self.fallback_dir:
+            path_hash = hashlib.sha256(
+                str(self.path.resolve()).encode("utf-8")
+            ).hexdigest()
+            paths.append(
+                self.fallback_dir / "validation_cache" / f"{path_hash}.json")
+        return paths
+
+    def get_fingerprint(self, files: List[Path]) -> Union[str, None]:
+        """Fingerprint of files based on their paths, sizes and mtimes.
+
+        Returns:
+            str: Fingerprint or None if any of files is missing.
+
+        """
+        h = hashlib.sha256()
+        h.update(str(self.path.resolve()).encode("utf-8"))
+        h.update(str(len(files)).encode("utf-8"))
+        for file in files:
+            try:
+                stat = file.stat()
+            except OSError:
+                return None
+            h.update(
+                f"{file.as_posix()}:{stat.st_size}:{stat.st_mtime_ns}\n"
+                .encode("utf-8")
+            )
+        return h.hexdigest()
+
+    def is_valid(self, fingerprint: Union[str, None]) -> bool:
+        """Version with fingerprint was already validated."""
+        if fingerprint is None:
+            return False
+
+        for cache_path in self.get_cache_paths():
+            try:
+                with open(cache_path, "r") as stream:
+                    data = json.load(stream)
+            except (OSError, ValueError):
+                continue
+            if data.get("fingerprint") == fingerprint:
+                return True
+        return False
+
+    def store(self, fingerprint: Union[str, None]) -> None:
+        """Store successful validation of version with fingerprint."""
+        if fingerprint is None:
+            return
+
+        data = {"fingerprint": fingerprint}
+        for cache_path in self.get_cache_paths():
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, "w") as stream:
+                    json.dump(data, stream)
+                return
+            except OSError:
+                continue
+
+
 class OpenPypeVersion(semver.VersionInfo):
     """Class for storing information about OpenPype version.
 
@@ -940,6 +1071,9 @@ class BootstrapRepos:
         of existing files in given path and compare. It will also compare
         lists of files together for missing files.
 
+        Successful validation is cached (see :class:`VersionValidationCache`)
+        so unchanged version is not validated again.
+
         Args:
             path (Path): Path to OpenPype version to validate.
 
@@ -954,16 +1088,21 @@ class BootstrapRepos:
             return False, "Path doesn't exist"
 
         if path.is_file():
-            return self._validate_zip(path)
-        return self._validate_dir(path)
+            return self._validate_zip(path, self.data_dir)
+        return self._validate_dir(path, self.data_dir)
 
     @staticmethod
-    def _validate_zip(path: Path) -> tuple:
+    def _validate_zip(path: Path, cache_dir: Path = None) -> tuple:
         """Validate content of zip file."""
+        cache = VersionValidationCache(path, cache_dir)
+        fingerprint = cache.get_fingerprint([path])
+        if cache.is_valid(fingerprint):
+            return True, "All ok (cached)"
+
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
-                checksums_data = str(zip_file.read("checksums"))
+                checksums_data = zip_file.read("checksums").decode("utf-8")
             except IOError:
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
@@ -985,22 +1124,23 @@ class BootstrapRepos:
             if diff:
                 return False, f"Missing files {diff}"
 
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
-                h = hashlib.sha256()
+            def get_checksum(file_name):
+                # zip members always use '/' as separator
                 try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
-                    return False, f"Invalid checksum on {file_name}"
+                    data = zip_file.read(file_name)
+                except KeyError:
+                    raise FileNotFoundError(file_name)
+                return hashlib.sha256(data).hexdigest()
+
+            # calculate and compare checksums in the zip file
+            result = _validate_checksums(checksums, get_checksum)
 
-        return True, "All ok"
+        if result[0]:
+            cache.store(fingerprint)
+        return result
 
     @staticmethod
-    def _validate_dir(path: Path) -> tuple:
+    def _validate_dir(path: Path, cache_dir: Path = None) -> tuple:
         checksums_file = Path(path / "checksums")
         if not checksums_file.exists():
             # FIXME: This should be set to False sometimes in the future
@@ -1018,25 +1158,30 @@ class BootstrapRepos:
             for file in path.iterdir() if file.is_file()
         )
         files_in_dir.remove("checksums")
+        files_in_dir.discard(VersionValidationCache.cache_name)
         files_in_checksum = {file[1] for file in checksums}
 
         diff = files_in_dir.difference(files_in_checksum)
         if diff:
             return False, f"Missing files {diff}"
 
-        # calculate and compare checksums
-        for file_checksum, file_name in checksums:
+        cache = VersionValidationCache(path, cache_dir)
+        fingerprint = cache.get_fingerprint(
+            [checksums_file] + [path / file[1] for file in checksums]
+        )
+        if cache.is_valid(fingerprint):
+            return True, "All ok (cached)"
+
+        def get_checksum(file_name):
             if platform.system().lower() == "windows":
                 file_name = file_name.replace("/", "\\")
-            try:
-                current = sha256sum((path / file_name).as_posix())
-            except FileNotFoundError:
-                return False, f"Missing file [ {file_name} ]"
-
-            if file_checksum != current:
-                return False, f"Invalid checksum on {file_name}"
+            return sha256sum((path / file_name).as_posix())
 
-        return True, "All ok"
+        # calculate and compare checksums
+        result = _validate_checksums(checksums, get_checksum)
+        if result[0]:
+            cache.store(fingerprint)
+        return result
 
     @staticmethod
     def add_paths_from_archive(archive: Path) -> None:
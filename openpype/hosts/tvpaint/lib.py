@@ -1,6 +1,9 @@
 import os
+import math
 import shutil
 import collections
+from concurrent.futures import ThreadPoolExecutor
+
 from PIL import Image, ImageDraw
 
 
@@ -543,7 +546,7 @@ def cleanup_rendered_layers(filepaths_by_layer_id):
 def composite_rendered_layers(
     layers_data, filepaths_by_layer_id,
     range_start, range_end,
-    dst_filepaths_by_frame, cleanup=True
+    dst_filepaths_by_frame, cleanup=True, workers=None
 ):
     """Composite multiple rendered layers by their position.
 
@@ -554,6 +557,11 @@ def composite_rendered_layers(
     Function can be used even if single layer was created to fill transparent
     filepaths.
 
+    Frames with same source files (held exposures are hardlinks of the same
+    file) are composited only once and the result is linked to the other
+    frames. Unique frames are composited in threads by chunks of following
+    frames so layer images which did not change are not loaded again.
+
     Args:
         layers_data(list): Layers data loaded from TVPaint.
         filepaths_by_layer_id(dict): Rendered filepaths stored by frame index
@@ -564,6 +572,8 @@ def composite_rendered_layers(
             image after compositing will be stored. Path must not clash with
             source filepaths.
         cleanup(bool): Remove all source filepaths when done with compositing.
+        workers(int): Count of compositing threads. Count of CPUs is used
+            if not passed.
     """
     # Prepare layers by their position
     #   - position tells in which order will compositing happen
@@ -577,8 +587,11 @@ def composite_rendered_layers(
     # Prepare variable where filepaths without any rendered content
     #   - transparent will be created
     transparent_filepaths = set()
-    # Store first final filepath
-    first_dst_filepath = None
+    # Source filepaths of unique frames and destinations of the frames
+    #   - key is identity of source files
+    src_filepaths_by_key = collections.OrderedDict()
+    dst_filepaths_by_key = collections.defaultdict(list)
+    identity_by_filepath = {}
     for frame_idx in range(range_start, range_end + 1):
         dst_filepath = dst_filepaths_by_frame[frame_idx]
         src_filepaths = []
@@ -593,19 +606,45 @@ def composite_rendered_layers(
             transparent_filepaths.add(dst_filepath)
             continue
 
-        # Store first destination filepath to be used for transparent images
+        key = []
+        for src_filepath in src_filepaths:
+            identity = identity_by_filepath.get(src_filepath)
+            if identity is None:
+                identity = _get_file_identity(src_filepath)
+                identity_by_filepath[src_filepath] = identity
+            key.append(identity)
+        key = tuple(key)
+
+        if key not in src_filepaths_by_key:
+            src_filepaths_by_key[key] = src_filepaths
+        dst_filepaths_by_key[key].append(dst_filepath)
+
+    # Store first final filepath to be used for transparent images
+    first_dst_filepath = None
+    composite_jobs = []
+    for key, src_filepaths in src_filepaths_by_key.items():
+        dst_filepath = dst_filepaths_by_key[key][0]
         if first_dst_filepath is None:
             first_dst_filepath = dst_filepath
 
-        if len(src_filepaths) == 1:
-            src_filepath = src_filepaths[0]
-            if cleanup:
-                os.rename(src_filepath, dst_filepath)
-            else:
-                copy_render_file(src_filepath, dst_filepath)
+        if len(src_filepaths) > 1:
+            composite_jobs.append(
+                (tuple(zip(key, src_filepaths)), dst_filepath)
+            )
+            continue
 
+        src_filepath = src_filepaths[0]
+        if cleanup:
+            os.rename(src_filepath, dst_filepath)
         else:
-            composite_images(src_filepaths, dst_filepath)
+            copy_render_file(src_filepath, dst_filepath)
+
+    _composite_jobs(composite_jobs, workers)
+
+    # Link result of unique frame to frames with same sources
+    for dst_filepaths in dst_filepaths_by_key.values():
+        for dst_filepath in dst_filepaths[1:]:
+            copy_render_file(dst_filepaths[0], dst_filepath)
 
     # Store first transparent filepath to be able copy it
     transparent_filepath = None
@@ -623,6 +662,104 @@ def composite_rendered_layers(
         cleanup_rendered_layers(filepaths_by_layer_id)
 
 
+def _get_file_identity(filepath):
+    """Identity of file which is same for hardlinks of the file."""
+    stat = os.stat(filepath)
+    if stat.st_ino:
+        return (stat.st_dev, stat.st_ino)
+    return os.path.normpath(filepath)
+
+
+def _composite_jobs(composite_jobs, workers=None):
+    """Composite jobs in threads by chunks of following jobs.
+
+    Pillow releases GIL during decoding, encoding and compositing of images
+    so threads can run in parallel.
+
+    Args:
+        composite_jobs(list): Tuples of source items and output filepath.
+            Source item is tuple of file identity and filepath.
+        workers(int): Count of threads.
+    """
+    if not composite_jobs:
+        return
+
+    if not workers:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(composite_jobs))
+    chunk_size = int(math.ceil(len(composite_jobs) / float(workers)))
+    chunks = [
+        composite_jobs[idx:idx + chunk_size]
+        for idx in range(0, len(composite_jobs), chunk_size)
+    ]
+    if len(chunks) == 1:
+        _composite_chunk(chunks[0])
+        return
+
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        for future in [
+            executor.submit(_composite_chunk, chunk)
+            for chunk in chunks
+        ]:
+            # Re-raise exceptions from threads
+            future.result()
+
+
+def _composite_chunk(composite_jobs):
+    compositor = _LayersCompositor()
+    for src_items, output_filepath in composite_jobs:
+        compositor.composite(src_items, output_filepath)
+
+
+class _LayersCompositor:
+    """Composite images reusing images and partial results of last frame.
+
+    Compositing happens from bottom layer so partial result of layers which
+    did not change since last frame is reused.
+    """
+
+    def __init__(self):
+        self._images = {}
+        self._partial_results = {}
+
+    def composite(self, src_items, output_filepath):
+        images = {}
+        partial_results = {}
+        prefix = ()
+        result = None
+        for identity, filepath in src_items:
+            prefix += (identity, )
+            partial_result = self._partial_results.get(prefix)
+            if partial_result is not None:
+                if identity in self._images:
+                    images[identity] = self._images[identity]
+            else:
+                img_obj = self._images.get(identity)
+                if img_obj is None:
+                    img_obj = _open_rgba_image(filepath)
+                images[identity] = img_obj
+
+                if result is None:
+                    partial_result = img_obj
+                else:
+                    partial_result = Image.alpha_composite(result, img_obj)
+
+            partial_results[prefix] = partial_result
+            result = partial_result
+
+        self._images = images
+        self._partial_results = partial_results
+        result.save(output_filepath)
+
+
+def _open_rgba_image(filepath):
+    img_obj = Image.open(filepath)
+    if img_obj.mode != "RGBA":
+        return img_obj.convert("RGBA")
+    img_obj.load()
+    return img_obj
+
+
 def composite_images(input_image_paths, output_filepath):
     """Composite images in order from passed list.
 
@@ -632,14 +769,10 @@ def composite_images(input_image_paths, output_filepath):
     if not input_image_paths:
         raise ValueError("Nothing to composite.")
 
-    img_obj = None
-    for image_filepath in input_image_paths:
-        _img_obj = Image.open(image_filepath)
-        if img_obj is None:
-            img_obj = _img_obj
-        else:
-            img_obj.alpha_composite(_img_obj)
-    img_obj.save(output_filepath)
+    _LayersCompositor().composite(
+        [(filepath, filepath) for filepath in input_image_paths],
+        output_filepath
+    )
 
 
 def rename_filepaths_by_frame_start(
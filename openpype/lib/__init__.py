@@ -51,7 +51,9 @@ from .vendor_bin_utils import (
     get_vendor_bin_path,
     get_oiio_tools_path,
     get_ffmpeg_tool_path,
+    get_ffprobe_data,
     ffprobe_streams,
+    ffprobe_streams_for_inputs,
     is_oiio_supported
 )
 
@@ -70,8 +72,25 @@ from .profiles_filtering import (
 
 from .transcoding import (
     get_transcode_temp_directory,
+    get_oiio_info_for_input,
+    get_oiio_info_for_inputs,
     should_convert_for_ffmpeg,
-    convert_for_ffmpeg
+    convert_for_ffmpeg,
+    convert_files_for_ffmpeg,
+    run_oiio_batch,
+    run_oiio_for_files
+)
+from .burnin import (
+    get_burnin_options,
+    get_burnin_profile,
+    filter_burnin_defs,
+    get_repre_burnin_defs,
+    prepare_basic_burnin_data,
+    prepare_repre_burnin_data,
+    fill_burnin_data,
+    get_burnin_values,
+    run_burnin_script,
+    get_burnin_filters
 )
 from .avalon_context import (
     CURRENT_DOC_SCHEMAS,
@@ -200,7 +219,9 @@ __all__ = [
     "get_vendor_bin_path",
     "get_oiio_tools_path",
     "get_ffmpeg_tool_path",
+    "get_ffprobe_data",
     "ffprobe_streams",
+    "ffprobe_streams_for_inputs",
     "is_oiio_supported",
 
     "import_filepath",
@@ -210,8 +231,24 @@ __all__ = [
     "import_module_from_dirpath",
 
     "get_transcode_temp_directory",
+    "get_oiio_info_for_input",
+    "get_oiio_info_for_inputs",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
+    "convert_files_for_ffmpeg",
+    "run_oiio_batch",
+    "run_oiio_for_files",
+
+    "get_burnin_options",
+    "get_burnin_profile",
+    "filter_burnin_defs",
+    "get_repre_burnin_defs",
+    "prepare_basic_burnin_data",
+    "prepare_repre_burnin_data",
+    "fill_burnin_data",
+    "get_burnin_values",
+    "run_burnin_script",
+    "get_burnin_filters",
 
     "CURRENT_DOC_SCHEMAS",
     "PROJECT_NAME_ALLOWED_SYMBOLS",
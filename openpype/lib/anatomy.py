@@ -174,6 +174,10 @@ class Anatomy:
         """Wrap `format_all` method of Anatomy's `templates_obj`."""
         return self._templates_obj.format_all(*args, **kwargs)
 
+    def format_batch(self, *args, **kwargs):
+        """Wrap `format_batch` method of Anatomy's `templates_obj`."""
+        return self._templates_obj.format_batch(*args, **kwargs)
+
     @property
     def roots(self):
         """Wrap `roots` property of Anatomy's `roots_obj`."""
@@ -454,6 +458,34 @@ class TemplateResult(str):
         return new_obj
 
 
+class TemplateBatchResult(TemplateResult):
+    """Result of template formatted for multiple frames.
+
+    String value and all attributes of `TemplateResult` are related to the
+    first frame. Filled paths of all frames are stored in `paths` and
+    `rootless_paths` in order of `frames`.
+
+    Args:
+        frames (list): Frames used to fill the template.
+        paths (list): Filled template for each frame.
+        rootless_paths (list): Rootless path for each frame.
+    """
+
+    def __new__(
+        cls, filled_template, template, solved, rootless_path,
+        used_values, missing_keys, invalid_types,
+        frames, paths, rootless_paths
+    ):
+        new_obj = super(TemplateBatchResult, cls).__new__(
+            cls, filled_template, template, solved, rootless_path,
+            used_values, missing_keys, invalid_types
+        )
+        new_obj.frames = frames
+        new_obj.paths = paths
+        new_obj.rootless_paths = rootless_paths
+        return new_obj
+
+
 class TemplatesDict(dict):
     """Holds and wrap TemplateResults for easy bug report."""
 
@@ -559,6 +591,156 @@ class TemplatesDict(dict):
         return self.__class__(result, key=self.key, parent=self.parent)
 
 
+class LazyTemplatesDict(TemplatesDict):
+    """TemplatesDict which formats templates on first access.
+
+    Values are `CompiledTemplate` objects until they're accessed. Accessed
+    template is formatted using `solver` and result is stored so each
+    template is formatted at most once.
+
+    Filling data are not copied deeply so they should not be modified
+    until all required templates are accessed.
+
+    Args:
+        solver (callable): Function formatting `CompiledTemplate` into
+            `TemplateResult`. Taken from parent if not passed.
+    """
+
+    def __init__(
+        self, in_data, key=None, parent=None, strict=None, solver=None
+    ):
+        if solver is None and parent is not None:
+            solver = getattr(parent, "_solver", None)
+        self._solver = solver
+        super(LazyTemplatesDict, self).__init__(in_data, key, parent, strict)
+
+    def _solve_key(self, key):
+        value = dict.get(self, key)
+        if isinstance(value, CompiledTemplate):
+            value = self._solver(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def solve_all(self):
+        """Format all templates which were not accessed yet."""
+        for key in tuple(self.keys()):
+            value = self._solve_key(key)
+            if isinstance(value, LazyTemplatesDict):
+                value.solve_all()
+
+    def __getitem__(self, key):
+        if key in self:
+            self._solve_key(key)
+        return super(LazyTemplatesDict, self).__getitem__(key)
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self._solve_key(key)
+
+    def values(self):
+        for key in tuple(self.keys()):
+            self._solve_key(key)
+        return super(LazyTemplatesDict, self).values()
+
+    def items(self):
+        for key in tuple(self.keys()):
+            self._solve_key(key)
+        return super(LazyTemplatesDict, self).items()
+
+
+class CompiledTemplate(object):
+    """Anatomy template parsed for repeated formatting.
+
+    Regex parsing of keys, padding specifications, optional groups and
+    subdictionary keys is done only once. Template variants with resolved
+    optional groups are cached by validity of the groups, so formatting of
+    the same template with different data does not parse the template again.
+
+    Args:
+        template (str): Anatomy template.
+    """
+
+    def __init__(self, template):
+        self.template = template
+        self.expects_task_dict = "{task[name]}" in template
+
+        optional_groups = []
+        for optional_group in Templates.optional_pattern.findall(template):
+            optional_groups.append(
+                (optional_group, self._parse_keys(optional_group))
+            )
+        self.optional_groups = tuple(optional_groups)
+        self._variants = {}
+
+    def __repr__(self):
+        return "<{} \"{}\">".format(self.__class__.__name__, self.template)
+
+    @staticmethod
+    def _parse_keys(template):
+        """Parse keys from template.
+
+        Returns:
+            tuple: Tuple of (group, key, subdict keys) where group is the
+                full key with curly brackets and padding, key is without
+                padding specification.
+        """
+        output = []
+        for group in Templates.key_pattern.findall(template):
+            key = str(group[1:-1])
+            key_padding = Templates.key_padding_pattern.findall(key)
+            if key_padding:
+                key = key_padding[0]
+            key_subdict = tuple(Templates.sub_dict_pattern.findall(key))
+            output.append((group, key, key_subdict))
+        return tuple(output)
+
+    def get_key_groups(self, key):
+        """Full key groups (with padding) of a key used in template.
+
+        Keys in optional groups are included.
+
+        Args:
+            key (str): Key without padding specification.
+
+        Returns:
+            set: Groups with curly brackets e.g. `{"{frame:0>4}"}`.
+        """
+        valid_mask = tuple(True for _ in self.optional_groups)
+        _, key_items = self.get_variant(valid_mask)
+        return {
+            group
+            for group, _key, _ in key_items
+            if _key == key
+        }
+
+    def get_variant(self, valid_mask):
+        """Template with resolved optional groups and it's keys.
+
+        Args:
+            valid_mask (tuple): Validity of each optional group in order of
+                `optional_groups`. Valid groups are kept without optional
+                identificators ("<" and ">"), invalid are removed.
+
+        Returns:
+            tuple: Template string and it's parsed keys.
+        """
+        variant = self._variants.get(valid_mask)
+        if variant is None:
+            template = self.template
+            for (optional_group, _), valid in zip(
+                self.optional_groups, valid_mask
+            ):
+                replacement = ""
+                if valid:
+                    replacement = optional_group[1:-1]
+                template = template.replace(optional_group, replacement)
+
+            variant = (template, self._parse_keys(template))
+            self._variants[valid_mask] = variant
+        return variant
+
+
 class Templates:
     key_pattern = re.compile(r"(\{.*?[^{0]*\})")
     key_padding_pattern = re.compile(r"([^:]+)\S+[><]\S+")
@@ -568,10 +750,15 @@ class Templates:
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
     inner_key_name_pattern = re.compile(r"\{@(.*?[^{}0]*)\}")
 
+    # Placeholder of frame value used in batch formatting
+    frame_indicator = "@__frame__@"
+
     def __init__(self, anatomy):
         self.anatomy = anatomy
         self.loaded_project = None
         self._templates = None
+        self._compiled_templates = None
+        self._compiled_source = None
 
     def __getitem__(self, key):
         return self.templates[key]
@@ -581,6 +768,8 @@ class Templates:
 
     def reset(self):
         self._templates = None
+        self._compiled_templates = None
+        self._compiled_source = None
 
     @property
     def project_name(self):
@@ -600,6 +789,18 @@ class Templates:
             self.loaded_project = self.project_name
         return self._templates
 
+    @property
+    def compiled_templates(self):
+        """Templates parsed into `CompiledTemplate` objects.
+
+        Templates are parsed only once and reused until templates change.
+        """
+        templates = self.templates
+        if self._compiled_source is not templates:
+            self._compiled_templates = self.compile_templates(templates)
+            self._compiled_source = templates
+        return self._compiled_templates
+
     def default_templates(self):
         """Return default templates data with solved inner keys."""
         return Templates.solve_template_inner_links(
@@ -806,23 +1007,35 @@ class Templates:
                 about missing optional keys and invalid types of optional keys.
 
         """
+        if not isinstance(template, CompiledTemplate):
+            template = CompiledTemplate(template)
 
-        # Remove optional missing keys
+        valid_mask, missing_keys, invalid_types = (
+            self._validate_optional_groups(template, data)
+        )
+        filtered_template, _ = template.get_variant(valid_mask)
+        return (filtered_template, missing_keys, invalid_types)
+
+    def _validate_optional_groups(self, compiled_template, data):
+        """Validate optional groups of compiled template against data.
+
+        Args:
+            compiled_template (CompiledTemplate): Parsed anatomy template.
+            data (dict): Containing keys to be filled into template.
+
+        Returns:
+            tuple: Validity of each optional group, missing optional keys and
+                invalid types of optional keys.
+        """
+        valid_mask = []
         missing_keys = []
         invalid_types = []
-        for optional_group in self.optional_pattern.findall(template):
+        for _, key_items in compiled_template.optional_groups:
             _missing_keys = []
             _invalid_types = []
-            for optional_key in self.key_pattern.findall(optional_group):
-                key = str(optional_key[1:-1])
-                key_padding = list(
-                    self.key_padding_pattern.findall(key)
-                )
-                if key_padding:
-                    key = key_padding[0]
-
+            for optional_key, key, key_subdict in key_items:
                 validation_result = self._validate_data_key(
-                    key, data
+                    key, data, key_subdict
                 )
                 missing_key = validation_result["missing_key"]
                 invalid_type = validation_result["invalid_type"]
@@ -846,22 +1059,26 @@ class Templates:
             valid = len(_invalid_types) == 0 and len(_missing_keys) == 0
             missing_keys.extend(_missing_keys)
             invalid_types.extend(_invalid_types)
-            replacement = ""
-            if valid:
-                replacement = optional_group[1:-1]
+            valid_mask.append(valid)
+        return tuple(valid_mask), missing_keys, invalid_types
 
-            template = template.replace(optional_group, replacement)
-        return (template, missing_keys, invalid_types)
+    def _validate_data_key(self, key, data, key_subdict=None):
+        """Check and prepare missing keys and invalid types of template.
 
-    def _validate_data_key(self, key, data):
-        """Check and prepare missing keys and invalid types of template."""
+        Args:
+            key (str): Key without padding specification.
+            data (dict): Containing keys to be filled into template.
+            key_subdict (list): Already parsed subdictionary keys of the key.
+                Parsed from key if not passed.
+        """
         result = {
             "missing_key": None,
             "invalid_type": None
         }
 
         # check if key expects subdictionary keys (e.g. project[name])
-        key_subdict = list(self.sub_dict_pattern.findall(key))
+        if key_subdict is None:
+            key_subdict = self.sub_dict_pattern.findall(key)
         used_keys = []
         if len(key_subdict) <= 1:
             if key not in data:
@@ -1003,54 +1220,57 @@ class Templates:
         be formatted separatelly in case of missing or incomplete keys in data.
 
         Args:
-            template (str): Anatomy template which will be formatted.
+            orig_template (Union[str, CompiledTemplate]): Anatomy template
+                which will be formatted.
             data (dict): Containing keys to be filled into template.
 
         Returns:
             TemplateResult: Filled or partially filled template containing all
                 data needed or missing for filling template.
         """
+        if isinstance(orig_template, CompiledTemplate):
+            compiled_template = orig_template
+        else:
+            compiled_template = CompiledTemplate(orig_template)
+        orig_template = compiled_template.template
+
         task_data = data.get("task")
         if (
-            isinstance(task_data, StringType)
-            and "{task[name]}" in orig_template
+            compiled_template.expects_task_dict
+            and isinstance(task_data, StringType)
         ):
             # Change task to dictionary if template expect dictionary
             data["task"] = {"name": task_data}
 
-        template, missing_optional, invalid_optional = (
-            self._filter_optional(orig_template, data)
+        valid_mask, missing_optional, invalid_optional = (
+            self._validate_optional_groups(compiled_template, data)
         )
         # Remove optional missing keys
+        template, key_items = compiled_template.get_variant(valid_mask)
         used_values = {}
         invalid_required = []
         missing_required = []
         replace_keys = []
 
-        for group in self.key_pattern.findall(template):
-            orig_key = group[1:-1]
-            key = str(orig_key)
-            key_padding = list(self.key_padding_pattern.findall(key))
-            if key_padding:
-                key = key_padding[0]
-
-            validation_result = self._validate_data_key(key, data)
+        for group, key, key_subdict in key_items:
+            validation_result = self._validate_data_key(
+                key, data, key_subdict
+            )
             missing_key = validation_result["missing_key"]
             invalid_type = validation_result["invalid_type"]
 
             if invalid_type is not None:
                 invalid_required.append(invalid_type)
-                replace_keys.append(key)
+                replace_keys.append((key, key_subdict))
                 continue
 
             if missing_key is not None:
                 missing_required.append(missing_key)
-                replace_keys.append(key)
+                replace_keys.append((key, key_subdict))
                 continue
 
             try:
                 value = group.format(**data)
-                key_subdict = list(self.sub_dict_pattern.findall(key))
                 if len(key_subdict) <= 1:
                     used_values[key] = value
 
@@ -1061,11 +1281,12 @@ class Templates:
 
             except (TypeError, KeyError):
                 missing_required.append(key)
-                replace_keys.append(key)
+                replace_keys.append((key, key_subdict))
 
-        final_data = copy.deepcopy(data)
-        for key in replace_keys:
-            key_subdict = list(self.sub_dict_pattern.findall(key))
+        # Only top level keys of the data are changed so shallow copy
+        #   is enough (deepcopy would copy Roots and all the entities)
+        final_data = dict(data)
+        for key, key_subdict in replace_keys:
             if len(key_subdict) <= 1:
                 final_data[key] = "{" + key + "}"
                 continue
@@ -1098,11 +1319,41 @@ class Templates:
         )
         return result
 
+    @classmethod
+    def compile_templates(cls, templates):
+        """Parse all string templates into `CompiledTemplate` objects.
+
+        Args:
+            templates (dict): Anatomy templates (may be nested).
+
+        Returns:
+            dict: Same hierarchy as passed templates where string values are
+                replaced with `CompiledTemplate`. Other values are kept.
+        """
+        output = {}
+        for key, value in templates.items():
+            if isinstance(value, StringType):
+                # Replace {task} by '{task[name]}' for backward compatibility
+                output[key] = CompiledTemplate(
+                    value.replace("{task}", "{task[name]}")
+                )
+
+            elif hasattr(value, "items"):
+                # Empty groups would not be in formatting output
+                compiled_value = cls.compile_templates(value)
+                if compiled_value:
+                    output[key] = compiled_value
+
+            else:
+                output[key] = value
+        return output
+
     def solve_dict(self, templates, data):
         """ Solves templates with entered data.
 
         Args:
             templates (dict): All Anatomy templates which will be formatted.
+                Values may be strings or already compiled templates.
             data (dict): Containing keys to be filled into template.
 
         Returns:
@@ -1111,6 +1362,10 @@ class Templates:
         """
         output = collections.defaultdict(dict)
         for key, orig_value in templates.items():
+            if isinstance(orig_value, CompiledTemplate):
+                output[key] = self._format(orig_value, data)
+                continue
+
             if isinstance(orig_value, StringType):
                 # Replace {task} by '{task[name]}' for backward compatibility
                 if '{task}' in orig_value:
@@ -1130,52 +1385,174 @@ class Templates:
 
         return output
 
-    def format_all(self, in_data, only_keys=True):
+    def format_all(self, in_data, only_keys=True, lazy=False):
         """ Solves templates based on entered data.
 
         Args:
             data (dict): Containing keys to be filled into template.
             only_keys (bool, optional): Decides if environ will be used to
                 fill templates or only keys in data.
+            lazy (bool, optional): Templates are formatted on first access
+                instead of formatting all of them at once.
 
         Returns:
             TemplatesDict: Output `TemplateResult` have `strict` attribute
                 set to False so accessing unfilled keys in templates won't
                 raise any exceptions.
         """
-        output = self.format(in_data, only_keys)
+        output = self.format(in_data, only_keys, lazy)
         output.strict = False
         return output
 
-    def format(self, in_data, only_keys=True):
+    def _prepare_format_data(self, in_data, only_keys):
+        # Create a copy of inserted data
+        # - only top level keys are modified during formatting
+        data = dict(in_data)
+
+        # Add environment variable to data
+        if only_keys is False:
+            for key, val in os.environ.items():
+                data["$" + key] = val
+
+        # override root value
+        roots = self.roots
+        if roots:
+            data["root"] = roots
+        return data
+
+    def format(self, in_data, only_keys=True, lazy=False):
         """ Solves templates based on entered data.
 
         Args:
             data (dict): Containing keys to be filled into template.
             only_keys (bool, optional): Decides if environ will be used to
                 fill templates or only keys in data.
+            lazy (bool, optional): Templates are formatted on first access
+                instead of formatting all of them at once. Result is
+                `LazyTemplatesDict`, passed data must not be modified until
+                required templates are accessed.
 
         Returns:
             TemplatesDict: Output `TemplateResult` have `strict` attribute
                 set to True so accessing unfilled keys in templates will
                 raise exceptions with explaned error.
         """
-        # Create a copy of inserted data
-        data = copy.deepcopy(in_data)
+        data = self._prepare_format_data(in_data, only_keys)
+        if lazy:
+            def solver(compiled_template):
+                return self._format(compiled_template, data)
 
-        # Add environment variable to data
-        if only_keys is False:
-            for key, val in os.environ.items():
-                data["$" + key] = val
+            return LazyTemplatesDict(self.compiled_templates, solver=solver)
 
-        # override root value
-        roots = self.roots
-        if roots:
-            data["root"] = roots
-        solved = self.solve_dict(self.templates, data)
+        solved = self.solve_dict(self.compiled_templates, data)
 
         return TemplatesDict(solved)
 
+    def format_batch(
+        self, in_data, frames, only_keys=True, frame_key="frame"
+    ):
+        """Solve templates for multiple frames at once.
+
+        Template is formatted only once with frame indicator and paths of
+        all frames are created by replacing the indicator with formatted
+        frame value. Templates are formatted lazily on first access.
+
+        Templates where frame indicator can't be used (e.g. different
+        padding of frame key in one template) are formatted for each frame.
+
+        Args:
+            in_data (dict): Containing keys to be filled into template.
+            frames (list): Frame values filled into `frame_key`.
+            only_keys (bool, optional): Decides if environ will be used to
+                fill templates or only keys in data.
+            frame_key (str, optional): Key in data which is filled with
+                frame values.
+
+        Returns:
+            LazyTemplatesDict: Values are `TemplateBatchResult` with filled
+                paths of all frames in `paths` attribute.
+        """
+        frames = list(frames)
+        if not frames:
+            raise ValueError("Frames for batch formatting are not set.")
+
+        data = self._prepare_format_data(in_data, only_keys)
+
+        def solver(compiled_template):
+            return self._format_batch(
+                compiled_template, data, frames, frame_key
+            )
+
+        return LazyTemplatesDict(self.compiled_templates, solver=solver)
+
+    def _format_batch(self, compiled_template, data, frames, frame_key):
+        frame_groups = compiled_template.get_key_groups(frame_key)
+        if not frame_groups and frame_key not in compiled_template.template:
+            # Frame is not used in template
+            result = self._format(compiled_template, data)
+            return TemplateBatchResult(
+                result, result.template, result.solved, result.rootless,
+                result.used_values, result.missing_keys,
+                [result.invalid_types],
+                frames,
+                [str(result)] * len(frames),
+                [result.rootless] * len(frames)
+            )
+
+        result = None
+        frame_values_valid = all(
+            isinstance(frame, (numbers.Number, StringType))
+            for frame in frames
+        )
+        if len(frame_groups) == 1 and frame_values_valid:
+            frame_group = tuple(frame_groups)[0]
+            indicator_data = dict(data)
+            indicator_data[frame_key] = self.frame_indicator
+            try:
+                result = self._format(compiled_template, indicator_data)
+            except ValueError:
+                # Padding specification can't be used with string
+                pass
+
+        if result is not None and self.frame_indicator in result:
+            frame_strings = [
+                frame_group.format(**{frame_key: frame})
+                for frame in frames
+            ]
+            paths = [
+                result.replace(self.frame_indicator, frame_string)
+                for frame_string in frame_strings
+            ]
+            rootless_paths = [
+                result.rootless.replace(self.frame_indicator, frame_string)
+                for frame_string in frame_strings
+            ]
+            used_values = copy.deepcopy(result.used_values)
+            used_values[frame_key] = frame_strings[0]
+            return TemplateBatchResult(
+                paths[0], result.template, result.solved, rootless_paths[0],
+                used_values, result.missing_keys, [result.invalid_types],
+                frames, paths, rootless_paths
+            )
+
+        # Fallback to formatting of each frame
+        results = []
+        for frame in frames:
+            frame_data = dict(data)
+            frame_data[frame_key] = frame
+            results.append(self._format(compiled_template, frame_data))
+
+        first_result = results[0]
+        return TemplateBatchResult(
+            first_result, first_result.template,
+            all(result.solved for result in results),
+            first_result.rootless, first_result.used_values,
+            first_result.missing_keys, [first_result.invalid_types],
+            frames,
+            [str(result) for result in results],
+            [result.rootless for result in results]
+        )
+
 
 class RootItem:
     """Represents one item or roots.
@@ -600,7 +600,7 @@ def get_workdir_with_workdir_data(
             project_name=workdir_data["project"]["name"]
         )
 
-    anatomy_filled = anatomy.format(workdir_data)
+    anatomy_filled = anatomy.format(workdir_data, lazy=True)
     # Output is TemplateResult object which contain useful data
     return anatomy_filled[template_key]["folder"]
 
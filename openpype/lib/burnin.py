@@ -0,0 +1,527 @@
+"""Preparation of burnins shared by ExtractBurnin and ExtractReview.
+
+Burnins are rendered by 'otio_burnin.py' script which is launched in
+separate OpenPype process.
+"""
+import os
+import copy
+import json
+import logging
+import platform
+import tempfile
+
+import six
+
+from .execute import (
+    run_openpype_process,
+    CREATE_NO_WINDOW
+)
+from .profiles_filtering import filter_profiles
+
+log = logging.getLogger(__name__)
+
+BURNIN_POSITIONS = (
+    "top_left", "top_centered", "top_right",
+    "bottom_right", "bottom_centered", "bottom_left"
+)
+# Default options for burnins for cases that are not set in presets.
+DEFAULT_BURNIN_OPTIONS = {
+    "font_size": 42,
+    "font_color": [255, 255, 255, 255],
+    "bg_color": [0, 0, 0, 127],
+    "bg_padding": 5,
+    "x_offset": 5,
+    "y_offset": 5
+}
+
+
+def get_burnin_script_path():
+    """Return path to python script for burnin processing."""
+    from openpype import PACKAGE_DIR
+
+    return os.path.normpath(
+        os.path.join(PACKAGE_DIR, "scripts", "otio_burnin.py")
+    )
+
+
+def run_burnin_script(script_data, logger=None):
+    """Run burnin script with data in separated process."""
+    if logger is None:
+        logger = log
+
+    logger.debug(
+        "script_data: {}".format(json.dumps(script_data, indent=4))
+    )
+
+    # Store dumped json to temporary file
+    temporary_json_file = tempfile.NamedTemporaryFile(
+        mode="w", suffix=".json", delete=False
+    )
+    temporary_json_file.write(json.dumps(script_data))
+    temporary_json_file.close()
+    temporary_json_filepath = temporary_json_file.name.replace("\\", "/")
+
+    # Prepare subprocess arguments
+    args = ["run", get_burnin_script_path(), temporary_json_filepath]
+    logger.debug("Executing: {}".format(" ".join(args)))
+
+    process_kwargs = {
+        "logger": logger,
+        "env": {}
+    }
+    if platform.system().lower() == "windows":
+        process_kwargs["creationflags"] = CREATE_NO_WINDOW
+
+    try:
+        run_openpype_process(*args, **process_kwargs)
+    finally:
+        # Remove the temporary json
+        os.remove(temporary_json_filepath)
+
+
+def get_burnin_options(options=None):
+    """Burnin options for burnin script.
+
+    Args:
+        options (dict): Options from settings overriding default options.
+
+    Returns:
+        dict: Options with colors converted to hex and opacity and with
+            path to font.
+    """
+    from openpype import resources
+
+    burnin_options = copy.deepcopy(DEFAULT_BURNIN_OPTIONS)
+    if options:
+        for key, value in options.items():
+            if value is not None:
+                burnin_options[key] = copy.deepcopy(value)
+
+    # Convert colors defined as list of numbers RGBA (0-255)
+    # BG Color
+    bg_color = burnin_options.get("bg_color")
+    if bg_color and isinstance(bg_color, list):
+        bg_red, bg_green, bg_blue, bg_alpha = bg_color
+        bg_color_hex = "#{0:0>2X}{1:0>2X}{2:0>2X}".format(
+            bg_red, bg_green, bg_blue
+        )
+        bg_color_alpha = float(bg_alpha) / 255
+        burnin_options["bg_opacity"] = bg_color_alpha
+        burnin_options["bg_color"] = bg_color_hex
+
+    # FG Color
+    font_color = burnin_options.get("font_color")
+    if font_color and isinstance(font_color, list):
+        fg_red, fg_green, fg_blue, fg_alpha = font_color
+        fg_color_hex = "#{0:0>2X}{1:0>2X}{2:0>2X}".format(
+            fg_red, fg_green, fg_blue
+        )
+        fg_color_alpha = float(fg_alpha) / 255
+        burnin_options["opacity"] = fg_color_alpha
+        burnin_options["font_color"] = fg_color_hex
+
+    # Define font filepath
+    # - font filepath may be defined in settings
+    font_filepath = burnin_options.get("font_filepath")
+    if font_filepath and isinstance(font_filepath, dict):
+        sys_name = platform.system().lower()
+        font_filepath = font_filepath.get(sys_name)
+
+    if font_filepath and isinstance(font_filepath, six.string_types):
+        font_filepath = font_filepath.format(**os.environ)
+        if not os.path.exists(font_filepath):
+            font_filepath = None
+
+    # Use OpenPype default font
+    if not font_filepath:
+        font_filepath = resources.get_liberation_font_path()
+
+    burnin_options["font"] = font_filepath
+
+    return burnin_options
+
+
+def get_burnin_values(burnin_def):
+    """Burnin texts by position from burnin definition."""
+    burnin_values = {}
+    for key in BURNIN_POSITIONS:
+        value = burnin_def.get(key)
+        if value:
+            burnin_values[key] = value.replace("{task}", "{task[name]}")
+    return burnin_values
+
+
+def get_burnin_profile(profiles, host_name, task_name, family, logger=None):
+    """Burnin profile most matching host, task and main family.
+
+    Returns:
+        dict: Matching profile or None.
+    """
+    return filter_profiles(
+        profiles,
+        {
+            "hosts": host_name,
+            "tasks": task_name,
+            "families": family
+        },
+        keys_order=("hosts", "tasks", "families"),
+        logger=logger
+    )
+
+
+def _families_filter_validation(families, output_families_filter):
+    """Determine if entered families intersect with families filters.
+
+    All family values are lowered to avoid unexpected results.
+    """
+    if not output_families_filter:
+        return True
+
+    for family_filter in output_families_filter:
+        if not family_filter:
+            continue
+
+        if not isinstance(family_filter, (list, tuple)):
+            if family_filter.lower() not in families:
+                continue
+            return True
+
+        valid = True
+        for family in family_filter:
+            if family.lower() not in families:
+                valid = False
+                break
+
+        if valid:
+            return True
+    return False
+
+
+def filter_burnin_defs(profile, families, logger=None):
+    """Filter burnin definitions of profile by families of instance.
+
+    Burnin definitions without any burnin value are skipped.
+
+    Args:
+        profile (dict): Profile from settings matching current context.
+        families (list): All families of instance.
+
+    Returns:
+        dict: Valid burnin definitions by filename suffix.
+    """
+    if logger is None:
+        logger = log
+
+    filtered_burnin_defs = {}
+
+    burnin_defs = profile.get("burnins")
+    if not burnin_defs:
+        return filtered_burnin_defs
+
+    low_families = [family.lower() for family in families]
+
+    for filename_suffix, orig_burnin_def in burnin_defs.items():
+        burnin_def = copy.deepcopy(orig_burnin_def)
+        def_filter = burnin_def.get("filter", None) or {}
+        for key in ("families", "tags"):
+            if key not in def_filter:
+                def_filter[key] = []
+
+        families_filters = def_filter["families"]
+        if not _families_filter_validation(low_families, families_filters):
+            logger.debug((
+                "Skipped burnin definition \"{}\". Family"
+                " fiters ({}) does not match current instance families: {}"
+            ).format(
+                filename_suffix, str(families_filters), str(families)
+            ))
+            continue
+
+        # Burnin values
+        burnin_values = {}
+        for key, value in tuple(burnin_def.items()):
+            key_low = key.lower()
+            if key_low in BURNIN_POSITIONS and value:
+                burnin_values[key_low] = value
+
+        # Skip processing if burnin values are not set
+        if not burnin_values:
+            logger.warning((
+                "Burnin values for Burnin definition \"{}\""
+                " are not filled. Definition will be skipped."
+                " Origin value: {}"
+            ).format(filename_suffix, str(orig_burnin_def)))
+            continue
+
+        burnin_values["filter"] = def_filter
+
+        filtered_burnin_defs[filename_suffix] = burnin_values
+
+        logger.debug((
+            "Burnin definition \"{}\" passed first filtering."
+        ).format(filename_suffix))
+
+    return filtered_burnin_defs
+
+
+def filter_burnins_by_tags(burnin_defs, tags):
+    """Filter burnin definitions by entered representation tags.
+
+    Burnin definitions without tags filter are marked as valid.
+
+    Args:
+        burnin_defs (dict): Burnin definitions by filename suffix.
+        tags (list): Tags of processed representation.
+
+    Returns:
+        dict: Burnin definitions matching entered tags.
+    """
+    filtered_burnins = {}
+    repre_tags_low = set(tag.lower() for tag in tags)
+    for filename_suffix, burnin_def in burnin_defs.items():
+        valid = True
+        tag_filters = burnin_def["filter"]["tags"]
+        if tag_filters:
+            # Check tag filters
+            tag_filters_low = set(tag.lower() for tag in tag_filters)
+
+            valid = bool(repre_tags_low & tag_filters_low)
+
+        if valid:
+            filtered_burnins[filename_suffix] = burnin_def
+
+    return filtered_burnins
+
+
+def get_repre_burnin_defs(repre, src_burnin_defs, logger=None):
+    """Burnin definitions which should be applied on representation.
+
+    Args:
+        repre (dict): Representation with "burnin" tag.
+        src_burnin_defs (dict): Burnin definitions of matching profile.
+
+    Returns:
+        dict: Burnin definitions by filename suffix.
+    """
+    if logger is None:
+        logger = log
+
+    repre_burnin_links = repre.get("burnins", [])
+    logger.debug("repre_burnin_links: {}".format(repre_burnin_links))
+
+    burnin_defs = copy.deepcopy(src_burnin_defs)
+    logger.debug("burnin_defs.keys(): {}".format(burnin_defs.keys()))
+
+    # Filter output definition by `burnin` represetation key
+    repre_linked_burnins = {
+        name: output
+        for name, output in burnin_defs.items()
+        if name in repre_burnin_links
+    }
+    logger.debug("repre_linked_burnins: {}".format(repre_linked_burnins))
+
+    # if any match then replace burnin defs and follow tag filtering
+    if repre_linked_burnins:
+        burnin_defs = repre_linked_burnins
+
+    # Filter output definition by representation tags (optional)
+    repre_burnin_defs = filter_burnins_by_tags(burnin_defs, repre["tags"])
+    if not repre_burnin_defs:
+        logger.info((
+            "Skipped representation. All burnin definitions from"
+            " selected profile does not match to representation's"
+            " tags. \"{}\""
+        ).format(str(repre["tags"])))
+    return repre_burnin_defs
+
+
+def prepare_basic_burnin_data(instance, logger=None):
+    """Pick data from instance for processing and for burnin strings.
+
+    Args:
+        instance (Instance): Currently processed instance.
+
+    Returns:
+        tuple: `(burnin_data, temp_data)` - `burnin_data` contain data for
+            filling burnin strings. `temp_data` are for repre pre-process
+            preparation.
+    """
+    if logger is None:
+        logger = log
+
+    logger.debug("Prepring basic data for burnins")
+    context = instance.context
+
+    version = instance.data.get("version")
+    if version is None:
+        version = context.data.get("version")
+
+    frame_start = instance.data.get("frameStart")
+    if frame_start is None:
+        logger.warning("Key \"frameStart\" is not set. Setting to \"0\".")
+        frame_start = 0
+    frame_start = int(frame_start)
+
+    frame_end = instance.data.get("frameEnd")
+    if frame_end is None:
+        logger.warning("Key \"frameEnd\" is not set. Setting to \"1\".")
+        frame_end = 1
+    frame_end = int(frame_end)
+
+    handles = instance.data.get("handles")
+    if handles is None:
+        handles = context.data.get("handles")
+        if handles is None:
+            handles = 0
+
+    handle_start = instance.data.get("handleStart")
+    if handle_start is None:
+        handle_start = context.data.get("handleStart")
+        if handle_start is None:
+            handle_start = handles
+
+    handle_end = instance.data.get("handleEnd")
+    if handle_end is None:
+        handle_end = context.data.get("handleEnd")
+        if handle_end is None:
+            handle_end = handles
+
+    frame_start_handle = frame_start - handle_start
+    frame_end_handle = frame_end + handle_end
+
+    burnin_data = copy.deepcopy(instance.data["anatomyData"])
+
+    if "slate.farm" in instance.data["families"]:
+        frame_start_handle += 1
+
+    burnin_data.update({
+        "version": int(version),
+        "comment": context.data.get("comment") or ""
+    })
+
+    intent_label = context.data.get("intent") or ""
+    if intent_label and isinstance(intent_label, dict):
+        value = intent_label.get("value")
+        if value:
+            intent_label = intent_label["label"]
+        else:
+            intent_label = ""
+
+    burnin_data["intent"] = intent_label
+
+    temp_data = {
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "frame_start_handle": frame_start_handle,
+        "frame_end_handle": frame_end_handle
+    }
+
+    logger.debug(
+        "Basic burnin_data: {}".format(json.dumps(burnin_data, indent=4))
+    )
+
+    return burnin_data, temp_data
+
+
+def prepare_repre_burnin_data(instance, repre, burnin_data, temp_data):
+    """Prepare data for representation.
+
+    Args:
+        instance (Instance): Currently processed Instance.
+        repre (dict): Currently processed representation.
+        burnin_data (dict): Copy of basic burnin data based on instance
+            data.
+        temp_data (dict): Copy of basic temp data
+    """
+    # Add representation name to burnin data
+    burnin_data["representation"] = repre["name"]
+
+    # no handles switch from profile tags
+    if "no-handles" in repre["tags"]:
+        burnin_frame_start = temp_data["frame_start"]
+        burnin_frame_end = temp_data["frame_end"]
+
+    else:
+        burnin_frame_start = temp_data["frame_start_handle"]
+        burnin_frame_end = temp_data["frame_end_handle"]
+
+    burnin_duration = burnin_frame_end - burnin_frame_start + 1
+
+    burnin_data.update({
+        "frame_start": burnin_frame_start,
+        "frame_end": burnin_frame_end,
+        "duration": burnin_duration,
+    })
+    temp_data["duration"] = burnin_duration
+
+    # Add values for slate frames
+    burnin_slate_frame_start = burnin_frame_start
+
+    # Move frame start by 1 frame when slate is used.
+    if (
+        "slate" in instance.data["families"]
+        and "slate-frame" in repre["tags"]
+    ):
+        burnin_slate_frame_start -= 1
+
+    burnin_data.update({
+        "slate_frame_start": burnin_slate_frame_start,
+        "slate_frame_end": burnin_frame_end,
+        "slate_duration": burnin_frame_end - burnin_slate_frame_start + 1
+    })
+
+
+def fill_burnin_data(instance, repre, burnin_data):
+    """Add anatomy, custom data and camera name to burnin data."""
+    # Add anatomy keys to burnin_data.
+    anatomy = instance.context.data["anatomy"]
+    filled_anatomy = anatomy.format_all(burnin_data)
+    burnin_data["anatomy"] = filled_anatomy.get_solved()
+
+    # Add context data burnin_data.
+    burnin_data["custom"] = instance.data.get("custom_burnin_data") or {}
+
+    # Add source camera name to burnin data
+    camera_name = repre.get("camera_name")
+    if camera_name:
+        burnin_data["camera_name"] = camera_name
+
+
+def get_burnin_filters(
+    full_input_path, burnin_data, burnin_def, stream_data,
+    options=None, logger=None
+):
+    """Burnin video filters for other ffmpeg process.
+
+    Used by ExtractReview to apply burnins during review encoding.
+
+    Args:
+        full_input_path (str): Path to source file used for probing.
+        burnin_data (dict): Prepared and filled burnin data.
+        burnin_def (dict): Burnin definition.
+        stream_data (dict): Values overriding probed video stream of
+            source, e.g. output resolution.
+        options (dict): Burnin options from settings.
+
+    Returns:
+        str: Video filters joined with comma.
+    """
+    filters_file = tempfile.NamedTemporaryFile(
+        mode="w", suffix=".json", delete=False
+    )
+    filters_file.close()
+    filters_filepath = filters_file.name.replace("\\", "/")
+    script_data = {
+        "full_input_path": full_input_path,
+        "filters_output": filters_filepath,
+        "burnin_data": burnin_data,
+        "stream_data": stream_data,
+        "options": get_burnin_options(options),
+        "values": get_burnin_values(burnin_def)
+    }
+    try:
+        run_burnin_script(script_data, logger)
+        with open(filters_filepath, "r") as stream:
+            return json.load(stream)["filters"]
+    finally:
+        os.remove(filters_filepath)
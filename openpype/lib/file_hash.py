@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""Content hashing of files with persistent cache of calculated hashes."""
+import os
+import json
+import time
+import hashlib
+import threading
+from multiprocessing.pool import ThreadPool
+
+import appdirs
+
+from .log import PypeLogger
+
+log = PypeLogger.get_logger(__name__)
+
+# Size of chunk read from file at once
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+if hasattr(hashlib, "blake2b"):
+    HASH_ALGORITHM = "blake2b"
+else:
+    # Python 2 hosts
+    HASH_ALGORITHM = "sha1"
+
+# Prefix of content hash in 'source_hash' output
+CONTENT_HASH_PREFIXES = ("blake2b-", "sha1-")
+
+
+def _new_hash_object():
+    if HASH_ALGORITHM == "blake2b":
+        return hashlib.blake2b(digest_size=20)
+    return hashlib.sha1()
+
+
+def calculate_file_hash(filepath, chunk_size=HASH_CHUNK_SIZE):
+    """Calculate hash of file content.
+
+    File is read in chunks so memory usage does not depend on file size.
+
+    Args:
+        filepath (str): Path to file.
+        chunk_size (int): Size of chunk read at once.
+
+    Returns:
+        str: Hex digest of file content.
+    """
+    hash_obj = _new_hash_object()
+    with open(filepath, "rb") as stream:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+class FileHashCache(object):
+    """Persistent cache of file content hashes.
+
+    Hash of file is valid until path, inode, modification time or size of
+    the file changes. Cache is stored to json file and is loaded on first
+    access. Changes are written only on `save`, when the file is merged with
+    current content on disk so multiple processes can share the cache.
+
+    Each item stores time when it was last used. Items which were not used
+    for 'max_age' seconds are removed on save and only 'max_items' most
+    recently used items are kept.
+
+    Args:
+        filepath (str): Path to cache file. File in OpenPype's user data
+            directory is used if not passed.
+    """
+
+    # Remove items not used for 30 days
+    max_age = 30 * 24 * 60 * 60
+    max_items = 100000
+
+    def __init__(self, filepath=None):
+        if filepath is None:
+            filepath = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                "file_hashes.json"
+            )
+        self.filepath = filepath
+        self._data = None
+        self._changed = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.normpath(path))
+
+    @staticmethod
+    def _stat_values(stat_result):
+        return [stat_result.st_ino, stat_result.st_mtime, stat_result.st_size]
+
+    def _read(self):
+        if not os.path.exists(self.filepath):
+            return {}
+
+        try:
+            with open(self.filepath, "r") as stream:
+                return json.load(stream)
+        except ValueError:
+            log.warning(
+                "Hash cache file \"{}\" is corrupted.".format(self.filepath)
+            )
+        except (IOError, OSError):
+            log.warning(
+                "Failed to read hash cache \"{}\".".format(self.filepath),
+                exc_info=True
+            )
+        return {}
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    def get(self, path, stat_result):
+        """Cached hash of file if file did not change.
+
+        Args:
+            path (str): Path to file.
+            stat_result (os.stat_result): Current stat of the file.
+
+        Returns:
+            Union[str, None]: Hash of file or None if is not cached.
+        """
+        key = self._key(path)
+        with self._lock:
+            item = self.data.get(key)
+            if (
+                not item
+                or item.get("algorithm") != HASH_ALGORITHM
+                or item.get("stat") != self._stat_values(stat_result)
+            ):
+                return None
+
+            # Store time of usage so the item is not pruned
+            if key not in self._changed:
+                item = dict(item, used=time.time())
+                self.data[key] = item
+                self._changed[key] = item
+        return item["hash"]
+
+    def set(self, path, stat_result, file_hash):
+        item = {
+            "algorithm": HASH_ALGORITHM,
+            "stat": self._stat_values(stat_result),
+            "hash": file_hash,
+            "used": time.time()
+        }
+        key = self._key(path)
+        with self._lock:
+            self.data[key] = item
+            self._changed[key] = item
+
+    def save(self):
+        """Store changed hashes to cache file."""
+        with self._lock:
+            if not self._changed:
+                return
+            changed = self._changed
+            self._changed = {}
+
+            data = self._read()
+            data.update(changed)
+            data = self._prune(data)
+            self._data = data
+
+        dirpath = os.path.dirname(self.filepath)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        tmp_path = "{}.{}.tmp".format(self.filepath, os.getpid())
+        with open(tmp_path, "w") as stream:
+            json.dump(data, stream)
+
+        # 'os.rename' can't replace existing file on windows
+        if hasattr(os, "replace"):
+            os.replace(tmp_path, self.filepath)
+        else:
+            if os.path.exists(self.filepath):
+                os.remove(self.filepath)
+            os.rename(tmp_path, self.filepath)
+
+    def _prune(self, data):
+        """Remove items which were not used recently."""
+        min_time = time.time() - self.max_age
+        items = [
+            (key, item)
+            for key, item in data.items()
+            if item.get("used", 0) >= min_time
+        ]
+        if len(items) > self.max_items:
+            items.sort(key=lambda pair: pair[1]["used"], reverse=True)
+            items = items[:self.max_items]
+        return dict(items)
+
+
+def content_hash(filepath, hash_cache=None, stat_result=None):
+    """Hash of file content using cache if possible.
+
+    Args:
+        filepath (str): Path to file.
+        hash_cache (FileHashCache): Cache of hashes. Content is always
+            read if not passed.
+        stat_result (os.stat_result): Already known stat of the file.
+
+    Returns:
+        str: Hash with algorithm prefix e.g. 'blake2b-<hex digest>'.
+    """
+    if stat_result is None:
+        stat_result = os.stat(filepath)
+
+    file_hash = None
+    if hash_cache is not None:
+        file_hash = hash_cache.get(filepath, stat_result)
+
+    if file_hash is None:
+        file_hash = "{}-{}".format(
+            HASH_ALGORITHM, calculate_file_hash(filepath)
+        )
+        if hash_cache is not None:
+            hash_cache.set(filepath, stat_result, file_hash)
+    return file_hash
+
+
+def content_hashes(filepaths, hash_cache=None, max_workers=None):
+    """Calculate content hashes of multiple files in parallel.
+
+    Hashing releases GIL so files are hashed in a pool of threads.
+
+    Args:
+        filepaths (list): Paths to files.
+        hash_cache (FileHashCache): Cache of hashes. Cache is saved after
+            all hashes are calculated.
+        max_workers (int): Number of threads. Number of cpus is used if not
+            passed.
+
+    Returns:
+        dict: Hash by file path.
+    """
+    filepaths = list(filepaths)
+    if not filepaths:
+        return {}
+
+    if not max_workers:
+        max_workers = os.cpu_count() if hasattr(os, "cpu_count") else 4
+    max_workers = max(1, min(max_workers or 1, len(filepaths)))
+
+    def _hash(filepath):
+        return content_hash(filepath, hash_cache)
+
+    if max_workers == 1:
+        hashes = [_hash(filepath) for filepath in filepaths]
+    else:
+        pool = ThreadPool(max_workers)
+        try:
+            hashes = pool.map(_hash, filepaths)
+        finally:
+            pool.close()
+            pool.join()
+
+    if hash_cache is not None:
+        hash_cache.save()
+    return dict(zip(filepaths, hashes))
+
+
+def get_content_hash_from_source_hash(file_hash):
+    """Content hash part of hash created with `source_hash`.
+
+    Args:
+        file_hash (str): Hash created with `source_hash`.
+
+    Returns:
+        Union[str, None]: Content hash or None if the hash was not created
+            from file content.
+    """
+    if not file_hash:
+        return None
+
+    for part in file_hash.split("|"):
+        if part.startswith(CONTENT_HASH_PREFIXES):
+            return part
+    return None
+
+
+def validate_file_content(filepath, file_hash, hash_cache=None):
+    """Validate file content against hash created with `source_hash`.
+
+    Args:
+        filepath (str): Path to file.
+        file_hash (str): Hash created with `source_hash`.
+        hash_cache (FileHashCache): Cache of hashes.
+
+    Returns:
+        Union[bool, None]: Result of validation or None if the hash does
+            not contain content hash or algorithm is not available.
+    """
+    expected = get_content_hash_from_source_hash(file_hash)
+    if expected is None or not expected.startswith(HASH_ALGORITHM + "-"):
+        return None
+    return content_hash(filepath, hash_cache) == expected
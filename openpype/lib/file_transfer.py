@@ -0,0 +1,372 @@
+"""Parallel copy and hardlink of files used during publishing."""
+import os
+import sys
+import errno
+import threading
+import collections
+
+import six
+
+from .log import PypeLogger
+
+# this is needed until speedcopy for linux is fixed
+if sys.platform == "win32":
+    from speedcopy import copyfile
+else:
+    from shutil import copyfile
+
+
+class FileTransferError(Exception):
+    """Transfer of one or more files failed.
+
+    Args:
+        errors (list): Tuples of source, destination and error message.
+        transferred (dict): Destination paths and sizes of files which were
+            transferred before the failure. Can be used for rollback.
+    """
+
+    def __init__(self, errors, transferred):
+        self.errors = errors
+        self.transferred = transferred
+        lines = [
+            "{} -> {}: {}".format(src, dst, msg)
+            for src, dst, msg in errors
+        ]
+        super(FileTransferError, self).__init__(
+            "Failed to transfer {} file/s.\n{}".format(
+                len(errors), "\n".join(lines)
+            )
+        )
+
+
+class FileStatCache(object):
+    """Cache of `os.stat` results of files.
+
+    Each file is stat-ed only once and result is shared by all parts which
+    need metadata of the file (size, modification time, existence). That is
+    important on network storages where each stat is a round-trip.
+
+    Cache must be updated with `set` or `invalidate` when file changes.
+    """
+
+    def __init__(self):
+        self._stats = {}
+
+    @staticmethod
+    def _key(path):
+        return os.path.normpath(path)
+
+    def stat(self, path):
+        """Cached `os.stat` of a path.
+
+        Raises:
+            OSError: When file does not exist. Missing files are not cached.
+        """
+        key = self._key(path)
+        stat_result = self._stats.get(key)
+        if stat_result is None:
+            stat_result = os.stat(key)
+            self._stats[key] = stat_result
+        return stat_result
+
+    def set(self, path, stat_result):
+        """Store stat result of a path e.g. after file was changed."""
+        self._stats[self._key(path)] = stat_result
+
+    def invalidate(self, path=None):
+        """Remove cached stat of path or all paths if path is not passed."""
+        if path is None:
+            self._stats.clear()
+        else:
+            self._stats.pop(self._key(path), None)
+
+    def exists(self, path):
+        try:
+            self.stat(path)
+        except OSError:
+            return False
+        return True
+
+    def getsize(self, path):
+        return self.stat(path).st_size
+
+    def getmtime(self, path):
+        return self.stat(path).st_mtime
+
+
+class FileTransferEngine(object):
+    """Copy or hardlink files using multiple threads.
+
+    Destination directories are created once per directory before any
+    transfer starts. Each copied file is validated only once after copy by
+    comparing size of source and destination.
+
+    Number of concurrent transfers to one root can be limited with
+    `max_workers_per_root` so single storage is not overloaded by the
+    transfers.
+
+    Args:
+        max_workers (int): Maximum number of concurrent transfers.
+        max_workers_per_root (int): Maximum number of concurrent transfers
+            to one destination root. Not limited if not set.
+        roots (list): Paths to destination roots. Destinations which are
+            not under any of the roots are grouped by their drive.
+        progress_callback (callable): Called after each finished transfer
+            with number of finished transfers, number of all transfers and
+            destination path.
+        copy_retries (int): How many times is copy repeated when
+            destination size does not match source size.
+        stat_cache (FileStatCache): Cache of file stats which is filled with
+            stats of sources and transferred files. New cache is created if
+            not passed.
+        log (Logger): Logger used for reports.
+    """
+
+    MODE_COPY = "copy"
+    MODE_HARDLINK = "hardlink"
+
+    def __init__(
+        self,
+        max_workers=4,
+        max_workers_per_root=None,
+        roots=None,
+        progress_callback=None,
+        copy_retries=2,
+        stat_cache=None,
+        log=None
+    ):
+        if log is None:
+            log = PypeLogger.get_logger(self.__class__.__name__)
+
+        if stat_cache is None:
+            stat_cache = FileStatCache()
+
+        self.log = log
+        self.stat_cache = stat_cache
+        self.max_workers = max(1, max_workers or 1)
+        self.max_workers_per_root = max_workers_per_root
+        self.progress_callback = progress_callback
+        self.copy_retries = copy_retries
+
+        root_paths = []
+        for root in roots or []:
+            root_path = os.path.normcase(os.path.normpath(str(root)))
+            root_paths.append(root_path)
+        # Longest roots first so nested roots are matched correctly
+        self._roots = list(sorted(root_paths, key=len, reverse=True))
+
+        self._transfers = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, src, dst, mode=MODE_COPY):
+        """Add file to transfer.
+
+        Args:
+            src (str): Source file path.
+            dst (str): Destination file path.
+            mode (str): Copy or hardlink the file. Use `MODE_COPY` or
+                `MODE_HARDLINK`.
+        """
+        if mode not in (self.MODE_COPY, self.MODE_HARDLINK):
+            raise ValueError("Unknown transfer mode \"{}\"".format(mode))
+
+        src = os.path.normpath(src)
+        dst = os.path.normpath(dst)
+        if dst in self._transfers:
+            if self._transfers[dst] != (src, mode):
+                raise ValueError((
+                    "Destination \"{}\" has multiple sources."
+                ).format(dst))
+            return
+        self._transfers[dst] = (src, mode)
+
+    def __len__(self):
+        return len(self._transfers)
+
+    def process(self):
+        """Transfer all added files.
+
+        Returns:
+            collections.OrderedDict: Destination paths and their sizes in
+                order in which were transfers added.
+
+        Raises:
+            FileTransferError: When any transfer failed. Files which were
+                already transferred are stored in exception.
+        """
+        transfers = list(self._transfers.items())
+        self._transfers = collections.OrderedDict()
+        if not transfers:
+            return collections.OrderedDict()
+
+        self._create_dirs(dst for dst, _ in transfers)
+
+        # Transfers waiting for a worker grouped by destination root
+        pending_by_root = collections.OrderedDict()
+        for item in transfers:
+            root = self._get_root(item[0])
+            pending_by_root.setdefault(root, collections.deque()).append(item)
+
+        state = {
+            "sizes": {},
+            "errors": [],
+            "finished": 0,
+            "total": len(transfers),
+            "pending": pending_by_root,
+            "active": collections.Counter()
+        }
+        condition = threading.Condition(self._lock)
+
+        worker_count = min(self.max_workers, len(transfers))
+        self.log.debug("Transferring {} file/s with {} worker/s".format(
+            len(transfers), worker_count
+        ))
+        if worker_count == 1:
+            self._worker(condition, state)
+        else:
+            threads = []
+            for _ in range(worker_count):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(condition, state)
+                )
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
+
+            for thread in threads:
+                thread.join()
+
+        output = collections.OrderedDict()
+        for dst, _ in transfers:
+            if dst in state["sizes"]:
+                output[dst] = state["sizes"][dst]
+
+        if state["errors"]:
+            raise FileTransferError(state["errors"], output)
+        return output
+
+    def _get_root(self, path):
+        path = os.path.normcase(path)
+        for root in self._roots:
+            if path.startswith(root + os.path.sep) or path == root:
+                return root
+        return os.path.splitdrive(path)[0] or os.path.sep
+
+    def _create_dirs(self, paths):
+        dirpaths = set()
+        for path in paths:
+            dirpaths.add(os.path.dirname(path))
+
+        for dirpath in sorted(dirpaths):
+            try:
+                os.makedirs(dirpath)
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    self.log.critical("An unexpected error occurred.")
+                    six.reraise(*sys.exc_info())
+
+    def _get_next_transfer(self, condition, state):
+        """Next transfer to a root which did not reach limit of workers.
+
+        Waits when all roots with pending transfers are saturated, so
+        workers are not blocked by transfers to one root while transfers
+        to other roots wait.
+
+        Returns:
+            tuple: Root and transfer item or None if there is nothing to
+                transfer.
+        """
+        with condition:
+            while True:
+                # Skip remaining transfers after first failure
+                if state["errors"]:
+                    return None
+
+                has_pending = False
+                for root, items in state["pending"].items():
+                    if not items:
+                        continue
+                    has_pending = True
+                    if (
+                        not self.max_workers_per_root
+                        or state["active"][root] < self.max_workers_per_root
+                    ):
+                        state["active"][root] += 1
+                        return root, items.popleft()
+
+                if not has_pending:
+                    return None
+                condition.wait()
+
+    def _worker(self, condition, state):
+        while True:
+            next_transfer = self._get_next_transfer(condition, state)
+            if next_transfer is None:
+                return
+
+            root, (dst, (src, mode)) = next_transfer
+            try:
+                if mode == self.MODE_HARDLINK:
+                    size = self._hardlink(src, dst)
+                else:
+                    size = self._copy(src, dst)
+
+            except Exception as exc:
+                self.log.critical(
+                    "Cannot {} {} to {}".format(mode, src, dst),
+                    exc_info=True
+                )
+                with condition:
+                    state["errors"].append((src, dst, str(exc)))
+                    state["active"][root] -= 1
+                    condition.notify_all()
+                continue
+
+            with condition:
+                state["sizes"][dst] = size
+                state["finished"] += 1
+                state["active"][root] -= 1
+                finished = state["finished"]
+                condition.notify_all()
+
+            self._report_progress(finished, state["total"], dst)
+
+    def _report_progress(self, finished, total, dst):
+        self.log.debug("Transferred {}/{}: {}".format(finished, total, dst))
+        if self.progress_callback is not None:
+            self.progress_callback(finished, total, dst)
+
+    def _copy(self, src, dst):
+        src_stat = self.stat_cache.stat(src)
+        src_size = src_stat.st_size
+        if (
+            self.stat_cache.exists(dst)
+            and os.path.samestat(src_stat, self.stat_cache.stat(dst))
+        ):
+            self.log.warning(
+                "Files are the same {} to {}".format(src, dst)
+            )
+            return src_size
+
+        attempts = 1 + max(0, self.copy_retries)
+        dst_size = None
+        for _ in range(attempts):
+            copyfile(src, dst)
+            dst_stat = os.stat(dst)
+            self.stat_cache.set(dst, dst_stat)
+            dst_size = dst_stat.st_size
+            if dst_size == src_size:
+                return dst_size
+
+        raise IOError((
+            "Size of copied file does not match source size ({} != {})"
+        ).format(dst_size, src_size))
+
+    def _hardlink(self, src, dst):
+        from avalon.vendor import filelink  # safer importing
+
+        if not self.stat_cache.exists(dst):
+            filelink.create(src, dst, filelink.HARDLINK)
+            self.stat_cache.set(dst, os.stat(dst))
+        return self.stat_cache.getsize(dst)
@@ -22,8 +22,13 @@ import sys
 import time
 import traceback
 import threading
+import collections
+import atexit
 import copy
 
+import appdirs
+import pymongo
+
 from . import Terminal
 from .mongo import (
     MongoEnvNotSet,
@@ -177,6 +182,189 @@ class PypeMongoFormatter(logging.Formatter):
         return document
 
 
+class PypeMongoBufferHandler(logging.Handler):
+    """Handler writing log documents to mongo in batches.
+
+    Records are formatted to documents on emitting thread and queued.
+    Background thread writes them with 'insert_many' when there is
+    'batch_size' queued documents or each 'flush_interval' seconds.
+
+    If queue is full (mongo is slow or not available) or insert fails,
+    documents are appended to spill file in OpenPype's user data directory
+    as extended json lines (can be imported with 'mongoimport'). Only
+    documents rejected by mongo are spilled when part of batch is written.
+    When spill file reaches 'max_spill_size' documents are dropped, count of
+    dropped documents is logged on close.
+
+    Queued documents are written on 'flush' and on 'close' which is called
+    on exit of the process.
+
+    Args:
+        get_collection (callable): Returns mongo collection for logs.
+    """
+    batch_size = 100
+    flush_interval = 1.0
+    max_queue_size = 10000
+    max_spill_size = 100 * 1024 * 1024
+
+    def __init__(self, get_collection, level=logging.NOTSET):
+        super(PypeMongoBufferHandler, self).__init__(level)
+        self.setFormatter(PypeMongoFormatter())
+
+        self._get_collection = get_collection
+        self._collection = None
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+        self.dropped_count = 0
+
+        atexit.register(self.close)
+
+    def emit(self, record):
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._condition:
+            if self._stopped:
+                return
+
+            if len(self._queue) >= self.max_queue_size:
+                self._spill([document])
+                return
+
+            self._queue.append(document)
+            if self._thread is None:
+                self._start_thread()
+
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+
+    def flush(self):
+        """Write all queued documents."""
+        while self._write_batch():
+            pass
+
+    def close(self):
+        with self._condition:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._condition.notify()
+
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.flush_interval * 5)
+        self.flush()
+        if self.dropped_count:
+            logging.getLogger(__name__).warning((
+                "{} log documents could not be written to mongo"
+                " or spill file and were dropped."
+            ).format(self.dropped_count))
+        super(PypeMongoBufferHandler, self).close()
+
+    def _start_thread(self):
+        thread = threading.Thread(
+            target=self._run, name="PypeMongoBufferHandler"
+        )
+        thread.daemon = True
+        thread.start()
+        self._thread = thread
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if len(self._queue) < self.batch_size and not self._stopped:
+                    self._condition.wait(self.flush_interval)
+                stopped = self._stopped
+
+            while self._write_batch():
+                pass
+
+            if stopped:
+                return
+
+    def _write_batch(self):
+        """Write one batch of queued documents.
+
+        Returns:
+            bool: Batch was full and more documents may be queued.
+        """
+        with self._write_lock:
+            with self._condition:
+                count = min(len(self._queue), self.batch_size)
+                documents = [self._queue.popleft() for _ in range(count)]
+
+            if not documents:
+                return False
+
+            try:
+                if self._collection is None:
+                    self._collection = self._get_collection()
+                self._collection.insert_many(documents, ordered=False)
+            except pymongo.errors.BulkWriteError as exc:
+                # Unordered insert writes all valid documents
+                failed_indexes = {
+                    error["index"]
+                    for error in exc.details.get("writeErrors") or []
+                }
+                self._spill([
+                    document
+                    for idx, document in enumerate(documents)
+                    if idx in failed_indexes
+                ])
+                return count == self.batch_size
+            except pymongo.errors.AutoReconnect:
+                # Validate connection before next batch
+                OpenPypeMongoConnection.invalidate_client()
+                self._collection = None
+                self._spill(documents)
+                return False
+            except Exception:
+                self._collection = None
+                self._spill(documents)
+                return False
+            return count == self.batch_size
+
+    def _spill(self, documents):
+        """Store documents which can't be written to mongo to local file."""
+        try:
+            from bson import json_util
+
+            spill_path = get_mongo_log_spill_path()
+            spill_dir = os.path.dirname(spill_path)
+            if not os.path.exists(spill_dir):
+                os.makedirs(spill_dir)
+
+            if (
+                os.path.exists(spill_path)
+                and os.path.getsize(spill_path) >= self.max_spill_size
+            ):
+                self.dropped_count += len(documents)
+                return
+
+            with open(spill_path, "a") as stream:
+                for document in documents:
+                    stream.write(json_util.dumps(document) + "\n")
+
+        except Exception:
+            self.dropped_count += len(documents)
+
+
+def get_mongo_log_spill_path():
+    """Path to file where logs which couldn't be written to mongo are stored.
+    """
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "logs",
+        "mongo_logs_{}.json".format(os.getpid())
+    )
+
+
 class PypeLogger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -215,6 +403,9 @@ class PypeLogger:
     # OPENPYPE_DEBUG
     pype_debug = 0
 
+    # Buffered mongo handler shared by all loggers
+    _mongo_handler = None
+
     # Data same for all record documents
     process_data = None
     # Cached process name or ability to set different process name
@@ -236,7 +427,7 @@ class PypeLogger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, (MongoHandler, PypeMongoBufferHandler)):
                 add_mongo_handler = False
             elif isinstance(handler, PypeStreamHandler):
                 add_console_handler = False
@@ -283,22 +474,16 @@ class PypeLogger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": PypeMongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
+        if cls._mongo_handler is None:
+            cls._mongo_handler = PypeMongoBufferHandler(
+                cls._get_log_collection
+            )
+        return cls._mongo_handler
 
-        return MongoHandler(**kwargs)
+    @classmethod
+    def _get_log_collection(cls):
+        client = cls.get_log_mongo_connection()
+        return client[cls.log_database_name][cls.log_collection_name]
 
     @classmethod
     def _get_console_handler(cls):
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""Cache of media probes (ffprobe, oiiotool) with optional on-disk storage."""
+import os
+import copy
+import json
+import hashlib
+import logging
+import threading
+import collections
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+log = logging.getLogger(__name__)
+
+# Count of probe results kept in memory
+MEMORY_CACHE_SIZE = 256
+# Environment variable with path to directory of on-disk cache
+CACHE_DIR_ENV_KEY = "OPENPYPE_MEDIA_PROBE_CACHE_DIR"
+
+_probe_cache = None
+_probe_cache_lock = threading.Lock()
+
+
+class MediaProbeCache(object):
+    """Cache of probe results of media files.
+
+    Result of a probe is valid until path, modification time or size of the
+    probed file changes. Results are kept in memory, least recently used are
+    dropped when there is more than 'max_items' of them. Results can be also
+    stored to a directory on disk, each result to own json file, so other
+    processes (e.g. burnin script) can reuse them.
+
+    Results must be json serializable.
+
+    Args:
+        cache_dir (str): Directory of on-disk cache. Results are cached only
+            in memory if not passed.
+        max_items (int): Count of results kept in memory.
+    """
+
+    def __init__(self, cache_dir=None, max_items=MEMORY_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.max_items = max_items
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(kind, path, stat_result):
+        """Key of probe result.
+
+        Args:
+            kind (str): Type of probe e.g. 'ffprobe'.
+            path (str): Path to probed file.
+            stat_result (os.stat_result): Current stat of the file.
+        """
+        return (
+            kind,
+            os.path.normcase(os.path.normpath(os.path.abspath(path))),
+            stat_result.st_mtime,
+            stat_result.st_size
+        )
+
+    def _get_cache_filepath(self, key):
+        key_hash = hashlib.sha1(
+            json.dumps(list(key)).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.cache_dir, key_hash[:2], key_hash + ".json")
+
+    def _set_memory(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def _read(self, key):
+        filepath = self._get_cache_filepath(key)
+        if not os.path.exists(filepath):
+            return None
+
+        try:
+            with open(filepath, "r") as stream:
+                data = json.load(stream)
+        except ValueError:
+            log.warning(
+                "Probe cache file \"{}\" is corrupted.".format(filepath)
+            )
+            return None
+        except (IOError, OSError):
+            log.warning(
+                "Failed to read probe cache \"{}\".".format(filepath),
+                exc_info=True
+            )
+            return None
+
+        # Hash collision or changed format
+        if data.get("key") != list(key):
+            return None
+        return data.get("value")
+
+    def _write(self, key, value):
+        filepath = self._get_cache_filepath(key)
+        tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+        try:
+            dirpath = os.path.dirname(filepath)
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+            with open(tmp_path, "w") as stream:
+                json.dump({"key": list(key), "value": value}, stream)
+
+            # 'os.rename' can't replace existing file on windows
+            if hasattr(os, "replace"):
+                os.replace(tmp_path, filepath)
+            else:
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                os.rename(tmp_path, filepath)
+
+        except (IOError, OSError):
+            log.warning(
+                "Failed to write probe cache \"{}\".".format(filepath),
+                exc_info=True
+            )
+
+    def get(self, key):
+        """Cached probe result.
+
+        Returns:
+            Any: Copy of probe result or None if is not cached.
+        """
+        with self._lock:
+            value = self._items.pop(key, None)
+            if value is not None:
+                # Move to end as recently used
+                self._items[key] = value
+                return copy.deepcopy(value)
+
+        if not self.cache_dir:
+            return None
+
+        value = self._read(key)
+        if value is not None:
+            self._set_memory(key, value)
+            value = copy.deepcopy(value)
+        return value
+
+    def set(self, key, value):
+        self._set_memory(key, copy.deepcopy(value))
+        if self.cache_dir:
+            self._write(key, value)
+
+    def clear(self):
+        """Clear results cached in memory."""
+        with self._lock:
+            self._items.clear()
+
+
+def get_media_probe_cache():
+    """Cache of probe results shared in process.
+
+    On-disk cache is used if 'OPENPYPE_MEDIA_PROBE_CACHE_DIR' environment
+    variable is set.
+    """
+    global _probe_cache
+    with _probe_cache_lock:
+        if _probe_cache is None:
+            _probe_cache = MediaProbeCache(
+                os.environ.get(CACHE_DIR_ENV_KEY) or None
+            )
+    return _probe_cache
+
+
+def cached_probe(kind, path, probe_func, probe_cache=None):
+    """Result of probe function using cache if possible.
+
+    Paths which can't be checked with 'os.stat' (e.g. sequence patterns) are
+    always probed.
+
+    Args:
+        kind (str): Type of probe e.g. 'ffprobe'.
+        path (str): Path to probed file.
+        probe_func (Callable[[str], Any]): Probe of file called with path.
+            Must return json serializable result.
+        probe_cache (MediaProbeCache): Cache of results. Process cache from
+            'get_media_probe_cache' is used if not passed.
+
+    Returns:
+        Any: Result of probe.
+    """
+    if probe_cache is None:
+        probe_cache = get_media_probe_cache()
+
+    try:
+        stat_result = os.stat(path)
+    except (IOError, OSError):
+        return probe_func(path)
+
+    key = probe_cache.get_key(kind, path, stat_result)
+    value = probe_cache.get(key)
+    if value is None:
+        value = probe_func(path)
+        probe_cache.set(key, value)
+    return value
+
+
+def cached_probes(kind, paths, probe_func, max_workers=None,
+                  probe_cache=None):
+    """Probe multiple files in parallel using cache if possible.
+
+    Probes run in external processes so files are probed in a pool of
+    threads.
+
+    Args:
+        kind (str): Type of probe e.g. 'ffprobe'.
+        paths (list): Paths to probed files.
+        probe_func (Callable[[str], Any]): Probe of file called with path.
+        max_workers (int): Number of threads. Number of cpus is used if not
+            passed.
+        probe_cache (MediaProbeCache): Cache of results.
+
+    Returns:
+        dict: Probe result by path.
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+
+    if not max_workers:
+        try:
+            max_workers = multiprocessing.cpu_count()
+        except NotImplementedError:
+            max_workers = 1
+    max_workers = max(1, min(max_workers, len(paths)))
+
+    def _probe(path):
+        return cached_probe(kind, path, probe_func, probe_cache)
+
+    if max_workers == 1:
+        results = [_probe(path) for path in paths]
+    else:
+        pool = ThreadPool(max_workers)
+        try:
+            results = pool.map(_probe, paths)
+        finally:
+            pool.close()
+            pool.join()
+    return dict(zip(paths, results))
@@ -121,26 +121,102 @@ class OpenPypeMongoConnection:
     """Singleton MongoDB connection.
 
     Keeps MongoDB connections by url.
+
+    Cached connection is validated with server round-trip at most once per
+    health check interval (in seconds) defined by environment variable
+    'OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL'. Value '0' validates connection
+    on each request and negative value disables the validation (pymongo
+    reconnects on it's own) so connection is recreated only after
+    `invalidate_client` is called e.g. on connection error.
     """
     mongo_clients = {}
+    _last_validations = {}
     log = logging.getLogger("OpenPypeMongoConnection")
 
+    default_health_check_interval = 30
+    # Environment keys of 'pymongo.MongoClient' connection pool arguments
+    pool_kwargs_env_keys = {
+        "maxPoolSize": "OPENPYPE_MONGO_MAX_POOL_SIZE",
+        "minPoolSize": "OPENPYPE_MONGO_MIN_POOL_SIZE",
+        "maxIdleTimeMS": "OPENPYPE_MONGO_MAX_IDLE_TIME_MS"
+    }
+
     @staticmethod
     def get_default_mongo_url():
         return os.environ["OPENPYPE_MONGO"]
 
+    @classmethod
+    def get_health_check_interval(cls):
+        value = os.environ.get("OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL")
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                cls.log.warning((
+                    "Invalid value of 'OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL'"
+                    " \"{}\". Using default {}s."
+                ).format(value, cls.default_health_check_interval))
+        return cls.default_health_check_interval
+
+    @classmethod
+    def get_pool_kwargs(cls):
+        """Connection pool arguments for 'pymongo.MongoClient'.
+
+        Only arguments set in environments with positive values are
+        returned so pymongo defaults are used otherwise.
+        """
+        output = {}
+        for kwarg_name, env_key in cls.pool_kwargs_env_keys.items():
+            value = os.environ.get(env_key)
+            if not value:
+                continue
+            try:
+                value = int(value)
+            except ValueError:
+                cls.log.warning("Invalid value of '{}' \"{}\".".format(
+                    env_key, value
+                ))
+                continue
+
+            if value > 0:
+                output[kwarg_name] = value
+        return output
+
+    @classmethod
+    def invalidate_client(cls, mongo_url=None):
+        """Force validation of connection on next request.
+
+        Should be called when operation with client failed on connection
+        error.
+        """
+        if mongo_url is None:
+            mongo_url = os.environ.get("OPENPYPE_MONGO")
+        cls._last_validations.pop(mongo_url, None)
+
+    @classmethod
+    def _is_validation_required(cls, mongo_url):
+        last_validation = cls._last_validations.get(mongo_url)
+        if last_validation is None:
+            return True
+
+        interval = cls.get_health_check_interval()
+        if interval < 0:
+            return False
+        return (time.time() - last_validation) >= interval
+
     @classmethod
     def get_mongo_client(cls, mongo_url=None):
         if mongo_url is None:
             mongo_url = cls.get_default_mongo_url()
 
         connection = cls.mongo_clients.get(mongo_url)
-        if connection:
+        if connection and cls._is_validation_required(mongo_url):
             # Naive validation of existing connection
             try:
                 connection.server_info()
                 with connection.start_session():
                     pass
+                cls._last_validations[mongo_url] = time.time()
             except Exception:
                 connection = None
 
@@ -148,6 +224,7 @@ class OpenPypeMongoConnection:
             cls.log.debug("Creating mongo connection to {}".format(mongo_url))
             connection = cls.create_connection(mongo_url)
             cls.mongo_clients[mongo_url] = connection
+            cls._last_validations[mongo_url] = time.time()
 
         return connection
 
@@ -164,9 +241,8 @@ class OpenPypeMongoConnection:
         if timeout is None:
             timeout = int(os.environ.get("AVALON_TIMEOUT") or 1000)
 
-        kwargs = {
-            "serverSelectionTimeoutMS": timeout
-        }
+        kwargs = cls.get_pool_kwargs()
+        kwargs["serverSelectionTimeoutMS"] = timeout
         if should_add_certificate_path_to_mongo_url(mongo_url):
             kwargs["ssl_ca_certs"] = certifi.where()
 
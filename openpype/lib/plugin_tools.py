@@ -7,6 +7,7 @@ import re
 import json
 
 from .profiles_filtering import filter_profiles
+from .file_hash import content_hash
 
 from openpype.settings import get_project_settings
 
@@ -353,7 +354,7 @@ def set_plugin_attributes_from_settings(
                 print("  - setting `{}`: `{}`".format(option, value))
 
 
-def source_hash(filepath, *args):
+def source_hash(filepath, *args, **kwargs):
     """Generate simple identifier for a source file.
     This is used to identify whether a source file has previously been
     processe into the pipeline, e.g. a texture.
@@ -362,15 +363,45 @@ def source_hash(filepath, *args):
     published before from the same location with the same modification date.
     We opt to do it this way as opposed to Avalanch C4 hash as this is much
     faster and predictable enough for all our production use cases.
+
+    Content mode replaces modification time with hash of file content. Such
+    identifier does not change when file is touched or copied to different
+    site so it can be used to validate transferred files. Hashes are cached
+    by path, inode, modification time and size in 'hash_cache'.
     Args:
         filepath (str): The source file path.
+        stat_result (os.stat_result, optional): Already known stat of the
+            file so it does not have to be stat-ed again.
+        content (bool, optional): Use hash of file content instead of
+            modification time.
+        hash_cache (FileHashCache, optional): Cache of content hashes.
+        file_content_hash (str, optional): Already calculated content hash.
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    stat_result = kwargs.pop("stat_result", None)
+    content = kwargs.pop("content", False)
+    hash_cache = kwargs.pop("hash_cache", None)
+    file_content_hash = kwargs.pop("file_content_hash", None)
+    if kwargs:
+        raise TypeError("Unexpected keyword arguments: {}".format(
+            ", ".join(kwargs.keys())
+        ))
+
+    if stat_result is None:
+        stat_result = os.stat(filepath)
+
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
+    if content or file_content_hash:
+        if not file_content_hash:
+            file_content_hash = content_hash(
+                filepath, hash_cache, stat_result
+            )
+        time = file_content_hash
+    else:
+        time = str(stat_result.st_mtime)
+    size = str(stat_result.st_size)
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
 
 
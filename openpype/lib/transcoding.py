@@ -1,8 +1,12 @@
 import os
 import re
+import math
 import logging
+import threading
 import collections
+import multiprocessing
 import tempfile
+from multiprocessing.pool import ThreadPool
 
 import xml.etree.ElementTree
 
@@ -11,6 +15,7 @@ from .vendor_bin_utils import (
     get_oiio_tools_path,
     is_oiio_supported
 )
+from .media_probe import cached_probe, cached_probes
 
 # Max length of string that is supported by ffmpeg
 MAX_FFMPEG_STRING_LEN = 8196
@@ -35,6 +40,18 @@ XML_CHAR_REF_REGEX_HEX = re.compile(r"&#x?[0-9a-fA-F]+;")
 
 # Regex to parse array attributes
 ARRAY_TYPE_REGEX = re.compile(r"^(int|float|string)\[\d+\]$")
+# Regex to find frame number in filename
+FRAME_NUMBER_REGEX = re.compile(r"(\d+)(?=\D*$)")
+
+# Minimum count of frames converted by one oiiotool process
+CONVERT_MIN_CHUNK_FRAMES = 10
+
+
+def _get_cpu_count():
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
 
 
 def get_transcode_temp_directory():
@@ -49,11 +66,8 @@ def get_transcode_temp_directory():
     )
 
 
-def get_oiio_info_for_input(filepath, logger=None):
-    """Call oiiotool to get information about input and return stdout.
-
-    Stdout should contain xml format string.
-    """
+def _get_oiio_info_xml(filepath, logger=None):
+    """Call oiiotool to get information about input and return xml."""
     args = [
         get_oiio_tools_path(), "--info", "-v", "-i:infoformat=xml", filepath
     ]
@@ -77,10 +91,46 @@ def get_oiio_info_for_input(filepath, logger=None):
             )
         )
 
-    xml_text = "\n".join(lines)
+    return "\n".join(lines)
+
+
+def get_oiio_info_for_input(filepath, logger=None):
+    """Call oiiotool to get information about input and return stdout.
+
+    Stdout should contain xml format string. Output of oiiotool is cached
+    until the file changes.
+    """
+    xml_text = cached_probe(
+        "oiio_info",
+        filepath,
+        lambda path: _get_oiio_info_xml(path, logger)
+    )
     return parse_oiio_xml_output(xml_text, logger=logger)
 
 
+def get_oiio_info_for_inputs(filepaths, logger=None, max_workers=None):
+    """Information about multiple inputs loaded in parallel by oiiotool.
+
+    Args:
+        filepaths (list): Paths to input files.
+        logger (logging.Logger): Logger used for logging.
+        max_workers (int): Number of parallel oiiotool processes.
+
+    Returns:
+        dict: Parsed information by filepath.
+    """
+    xml_by_path = cached_probes(
+        "oiio_info",
+        filepaths,
+        lambda path: _get_oiio_info_xml(path, logger),
+        max_workers
+    )
+    return {
+        filepath: parse_oiio_xml_output(xml_text, logger=logger)
+        for filepath, xml_text in xml_by_path.items()
+    }
+
+
 class RationalToInt:
     """Rational value stored as division of 2 integers using string."""
     def __init__(self, string_value):
@@ -355,46 +405,278 @@ def should_convert_for_ffmpeg(src_filepath):
     return False
 
 
-def convert_for_ffmpeg(
-    first_input_path,
-    output_dir,
-    input_frame_start=None,
-    input_frame_end=None,
-    logger=None
+def get_sequence_path_pattern(filepath):
+    """Replace frame number in filename with printf like pattern.
+
+    Pattern is used by oiiotool to substitute frames of '--frames' argument.
+
+    Example:
+        "/path/to/render.1001.exr" -> "/path/to/render.%04d.exr"
+
+    Returns:
+        str: Path with pattern or unchanged path if filename does not
+            contain frame number.
+    """
+    dirpath, filename = os.path.split(filepath)
+    match = FRAME_NUMBER_REGEX.search(filename)
+    if not match:
+        return filepath
+    pattern = "%0{}d".format(len(match.group(1)))
+    filename = "{}{}{}".format(
+        filename[:match.start()], pattern, filename[match.end():]
+    )
+    return os.path.join(dirpath, filename)
+
+
+def get_frame_chunks(frame_start, frame_end, workers, frames=None):
+    """Split frame range to chunks converted by separate processes.
+
+    There are more chunks than workers so progress can be reported more
+    often, but each chunk has at least 'CONVERT_MIN_CHUNK_FRAMES' frames.
+
+    Args:
+        frame_start (int): First frame of range.
+        frame_end (int): Last frame of range.
+        workers (int): Count of processes converting chunks.
+        frames (Iterable[int]): Frames which should be part of chunks. All
+            frames of range are used if not passed. Chunk never contains
+            frame which is not in passed frames.
+
+    Returns:
+        list: Tuples with first and last frame of chunks.
+    """
+    frame_start = int(frame_start)
+    frame_end = int(frame_end)
+    if frames is None:
+        frames = range(frame_start, frame_end + 1)
+    frames = sorted({
+        int(frame)
+        for frame in frames
+        if frame_start <= int(frame) <= frame_end
+    })
+    if not frames:
+        return []
+
+    frames_count = len(frames)
+    chunks_count = min(
+        workers * 4,
+        int(math.ceil(frames_count / float(CONVERT_MIN_CHUNK_FRAMES)))
+    )
+    chunk_size = int(math.ceil(frames_count / float(max(chunks_count, 1))))
+    chunks = []
+    chunk_start = chunk_end = None
+    for frame in frames:
+        if chunk_start is not None and (
+            # Gap in frames or chunk is full
+            frame != chunk_end + 1
+            or chunk_end - chunk_start + 1 >= chunk_size
+        ):
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = None
+
+        if chunk_start is None:
+            chunk_start = frame
+        chunk_end = frame
+    chunks.append((chunk_start, chunk_end))
+    return chunks
+
+
+def run_oiio_batch(commands, workers=None, logger=None, stop_on_failure=False):
+    """Run oiiotool commands in bounded pool of processes.
+
+    Failures are collected per command so caller can decide what to do with
+    items which failed.
+
+    Args:
+        commands (list): Tuples with key identifying processed item (e.g.
+            frame range or file) and arguments of oiiotool command.
+        workers (int): Maximum count of parallel processes. Count of CPUs is
+            used if not passed.
+        logger (logging.Logger): Logger used for logging.
+        stop_on_failure (bool): Cancel not started commands when a command
+            fails.
+
+    Returns:
+        dict: Error messages of failed commands by their keys.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    failures = {}
+    if not commands:
+        return failures
+
+    if not workers:
+        workers = _get_cpu_count()
+    workers = min(workers, len(commands))
+    commands_count = len(commands)
+    finished_count = 0
+    logger.info("Running {} oiiotool commands by {} processes.".format(
+        commands_count, workers
+    ))
+    stop_event = threading.Event()
+
+    def _run(command):
+        key, args = command
+        if stop_event.is_set():
+            return key, None, True
+        try:
+            run_subprocess(args, logger=logger)
+        except Exception as exc:
+            if stop_on_failure:
+                stop_event.set()
+            return key, str(exc), False
+        return key, None, False
+
+    pool = ThreadPool(workers)
+    try:
+        for key, error, skipped in pool.imap_unordered(_run, commands):
+            if skipped:
+                continue
+
+            finished_count += 1
+            if error is None:
+                logger.info("Finished {}/{} oiiotool commands.".format(
+                    finished_count, commands_count
+                ))
+                continue
+
+            failures[key] = error
+            logger.warning("oiiotool command of \"{}\" failed. {}".format(
+                key, error
+            ))
+    finally:
+        pool.close()
+        pool.join()
+    return failures
+
+
+def _get_frames_sequence(input_paths, output_paths):
+    """Patterns of inputs and outputs if they're sequence of frames.
+
+    Inputs and outputs are sequence if are in one directory, have same
+    frame numbers in filenames and frames are consecutive.
+
+    Returns:
+        tuple: Input pattern, output pattern and first and last frame. None
+            if inputs and outputs are not sequence.
+    """
+    if len(input_paths) < 2:
+        return None
+
+    patterns = set()
+    frames = []
+    for input_path, output_path in zip(input_paths, output_paths):
+        input_match = FRAME_NUMBER_REGEX.search(os.path.basename(input_path))
+        output_match = FRAME_NUMBER_REGEX.search(
+            os.path.basename(output_path)
+        )
+        if (
+            not input_match
+            or not output_match
+            or input_match.group(1) != output_match.group(1)
+        ):
+            return None
+
+        frames.append(int(input_match.group(1)))
+        patterns.add((
+            get_sequence_path_pattern(input_path),
+            get_sequence_path_pattern(output_path)
+        ))
+        if len(patterns) > 1:
+            return None
+
+    frames.sort()
+    if frames != list(range(frames[0], frames[-1] + 1)):
+        return None
+
+    input_pattern, output_pattern = patterns.pop()
+    return input_pattern, output_pattern, frames[0], frames[-1]
+
+
+def run_oiio_for_files(
+    input_paths, output_paths, oiio_args, workers=None, logger=None
 ):
-    """Contert source file to format supported in ffmpeg.
+    """Process files with same oiiotool arguments.
 
-    Currently can convert only exrs.
+    Inputs which are sequence of consecutive frames are processed in chunks
+    of frames by oiiotool invocations with frame ranges. Other inputs are
+    processed by one invocation per file. Invocations run in bounded pool
+    of processes.
 
     Args:
-        first_input_path (str): Path to first file of a sequence or a single
-            file path for non-sequential input.
-        output_dir (str): Path to directory where output will be rendered.
-            Must not be same as input's directory.
-        input_frame_start (int): Frame start of input.
-        input_frame_end (int): Frame end of input.
+        input_paths (list): Paths to input files.
+        output_paths (list): Paths to output files in order of inputs.
+        oiio_args (list): Arguments applied to each input (e.g.
+            ["--scanline"]).
+        workers (int): Maximum count of parallel processes. Count of CPUs is
+            used if not passed.
         logger (logging.Logger): Logger used for logging.
 
-    Raises:
-        ValueError: If input filepath has extension not supported by function.
-            Currently is supported only ".exr" extension.
+    Returns:
+        list: Input paths which failed. Input failed when its command failed
+            or when its output was not created.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    ext = os.path.splitext(first_input_path)[1].lower()
-    if ext != ".exr":
-        raise ValueError((
-            "Function 'convert_for_ffmpeg' currently support only"
-            " \".exr\" extension. Got \"{}\"."
-        ).format(ext))
+    if not workers:
+        workers = _get_cpu_count()
+
+    oiio_tool_path = get_oiio_tools_path()
+    commands = []
+    input_paths_by_key = {}
+    sequence = _get_frames_sequence(input_paths, output_paths)
+    if sequence is not None:
+        input_pattern, output_pattern, frame_start, frame_end = sequence
+        input_paths_by_frame = {
+            int(FRAME_NUMBER_REGEX.search(
+                os.path.basename(input_path)
+            ).group(1)): input_path
+            for input_path in input_paths
+        }
+        for chunk_start, chunk_end in get_frame_chunks(
+            frame_start, frame_end, workers
+        ):
+            key = "{}-{}".format(chunk_start, chunk_end)
+            args = [oiio_tool_path, "--frames", key, input_pattern]
+            args.extend(oiio_args)
+            args.extend(["-o", output_pattern])
+            commands.append((key, args))
+            input_paths_by_key[key] = [
+                input_paths_by_frame[frame]
+                for frame in range(chunk_start, chunk_end + 1)
+            ]
+
+    else:
+        for input_path, output_path in zip(input_paths, output_paths):
+            args = [oiio_tool_path, input_path]
+            args.extend(oiio_args)
+            args.extend(["-o", output_path])
+            commands.append((input_path, args))
+            input_paths_by_key[input_path] = [input_path]
+
+    failures = run_oiio_batch(commands, workers, logger)
+    failed_paths = set()
+    for key in failures:
+        failed_paths.update(input_paths_by_key[key])
+
+    for input_path, output_path in zip(input_paths, output_paths):
+        if not os.path.exists(output_path):
+            failed_paths.add(input_path)
+
+    return [
+        input_path
+        for input_path in input_paths
+        if input_path in failed_paths
+    ]
 
-    is_sequence = False
-    if input_frame_start is not None and input_frame_end is not None:
-        is_sequence = int(input_frame_end) != int(input_frame_start)
 
-    input_info = get_oiio_info_for_input(first_input_path)
+def _get_convert_oiio_args(input_path, input_info, logger):
+    """Arguments of oiiotool converting input to format supported in ffmpeg.
 
+    Output path and frames are not part of arguments.
+    """
     # Change compression only if source compression is "dwaa" or "dwab"
     #   - they're not supported in ffmpeg
     compression = input_info["attribs"].get("compression")
@@ -427,17 +709,11 @@ def convert_for_ffmpeg(
         # Tell oiiotool which channels should be loaded
         # - other channels are not loaded to memory so helps to avoid memory
         #       leak issues
-        "-i:ch={}".format(input_channels_str), first_input_path,
+        "-i:ch={}".format(input_channels_str), input_path,
         # Tell oiiotool which channels should be put to top stack (and output)
         "--ch", channels_arg
     ])
 
-    # Add frame definitions to arguments
-    if is_sequence:
-        oiio_cmd.extend([
-            "--frames", "{}-{}".format(input_frame_start, input_frame_end)
-        ])
-
     ignore_attr_changes_added = False
     for attr_name, attr_value in input_info["attribs"].items():
         if not isinstance(attr_value, str):
@@ -456,13 +732,147 @@ def convert_for_ffmpeg(
                 " because has too long value ({} chars)."
             ).format(attr_name, len(attr_value)))
             oiio_cmd.extend(["--eraseattrib", attr_name])
+    return oiio_cmd
+
+
+def _validate_convert_input(input_path):
+    ext = os.path.splitext(input_path)[1].lower()
+    if ext != ".exr":
+        raise ValueError((
+            "Function 'convert_for_ffmpeg' currently support only"
+            " \".exr\" extension. Got \"{}\"."
+        ).format(ext))
+
+
+def convert_for_ffmpeg(
+    first_input_path,
+    output_dir,
+    input_frame_start=None,
+    input_frame_end=None,
+    logger=None,
+    workers=None,
+    frames=None
+):
+    """Contert source file to format supported in ffmpeg.
+
+    Currently can convert only exrs. Frame range of a sequence is split to
+    chunks converted by parallel oiiotool processes.
+
+    Args:
+        first_input_path (str): Path to first file of a sequence or a single
+            file path for non-sequential input.
+        output_dir (str): Path to directory where output will be rendered.
+            Must not be same as input's directory.
+        input_frame_start (int): Frame start of input.
+        input_frame_end (int): Frame end of input.
+        logger (logging.Logger): Logger used for logging.
+        workers (int): Count of parallel oiiotool processes converting
+            sequence. Count of CPUs is used if not passed.
+        frames (Iterable[int]): Frames of sequence which exist and should be
+            converted. All frames of frame range are converted if not passed,
+            which fails if sequence has missing frames.
+
+    Raises:
+        ValueError: If input filepath has extension not supported by function.
+            Currently is supported only ".exr" extension.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    _validate_convert_input(first_input_path)
+
+    is_sequence = False
+    if input_frame_start is not None and input_frame_end is not None:
+        is_sequence = int(input_frame_end) != int(input_frame_start)
+
+    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+
+    # Frame number in filenames must be replaced with pattern which oiiotool
+    #   substitutes with frames from '--frames' argument
+    input_path = first_input_path
+    if is_sequence:
+        input_path = get_sequence_path_pattern(first_input_path)
+
+    oiio_cmd = _get_convert_oiio_args(input_path, input_info, logger)
 
     # Add last argument - path to output
-    base_file_name = os.path.basename(first_input_path)
+    base_file_name = os.path.basename(input_path)
     output_path = os.path.join(output_dir, base_file_name)
-    oiio_cmd.extend([
-        "-o", output_path
-    ])
 
-    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+    if not is_sequence:
+        oiio_cmd.extend([
+            "-o", output_path
+        ])
+        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+        run_subprocess(oiio_cmd, logger=logger)
+        return
+
+    if not workers:
+        workers = _get_cpu_count()
+    commands = []
+    for chunk_start, chunk_end in get_frame_chunks(
+        input_frame_start, input_frame_end, workers, frames
+    ):
+        frame_range = "{}-{}".format(chunk_start, chunk_end)
+        chunk_cmd = list(oiio_cmd)
+        # Add frame definitions to arguments
+        chunk_cmd.extend(["--frames", frame_range, "-o", output_path])
+        commands.append((frame_range, chunk_cmd))
+
+    if not commands:
+        raise ValueError("No frames to convert in range {}-{}.".format(
+            input_frame_start, input_frame_end
+        ))
+
+    logger.debug("Conversion command of first chunk: {}".format(
+        " ".join(commands[0][1])
+    ))
+    failures = run_oiio_batch(
+        commands, workers, logger, stop_on_failure=True
+    )
+    if failures:
+        raise RuntimeError("Conversion of frames {} failed.\n{}".format(
+            ", ".join(sorted(failures)), "\n".join(failures.values())
+        ))
+
+
+def convert_files_for_ffmpeg(input_paths, output_dirs, workers=None,
+                             logger=None):
+    """Convert multiple single files to format supported in ffmpeg.
+
+    All files are converted in one batch of parallel oiiotool processes.
+    Converted file has same filename as input file.
+
+    Args:
+        input_paths (list): Paths to input files.
+        output_dirs (list): Output directory for each input file.
+        workers (int): Maximum count of parallel processes. Count of CPUs is
+            used if not passed.
+        logger (logging.Logger): Logger used for logging.
+
+    Raises:
+        ValueError: If an input has extension not supported by function.
+        RuntimeError: Conversion of any input failed. All inputs are
+            processed before error is raised.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    commands = []
+    for input_path, output_dir in zip(input_paths, output_dirs):
+        _validate_convert_input(input_path)
+        input_info = get_oiio_info_for_input(input_path, logger=logger)
+        oiio_cmd = _get_convert_oiio_args(input_path, input_info, logger)
+        oiio_cmd.extend([
+            "-o", os.path.join(output_dir, os.path.basename(input_path))
+        ])
+        commands.append((input_path, oiio_cmd))
+
+    failures = run_oiio_batch(commands, workers, logger)
+    if failures:
+        raise RuntimeError("Conversion of files failed:\n{}".format(
+            "\n".join(
+                "{}: {}".format(input_path, message)
+                for input_path, message in failures.items()
+            )
+        ))
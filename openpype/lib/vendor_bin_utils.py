@@ -5,6 +5,8 @@ import platform
 import subprocess
 import distutils
 
+from .media_probe import cached_probe, cached_probes
+
 log = logging.getLogger("FFmpeg utils")
 
 
@@ -64,16 +66,7 @@ def get_ffmpeg_tool_path(tool="ffmpeg"):
     return os.path.join(ffmpeg_dir, tool)
 
 
-def ffprobe_streams(path_to_file, logger=None):
-    """Load streams from entered filepath via ffprobe.
-
-    Args:
-        path_to_file (str): absolute path
-        logger (logging.getLogger): injected logger, if empty new is created
-
-    """
-    if not logger:
-        logger = log
+def _run_ffprobe(path_to_file, logger):
     logger.info(
         "Getting information about input \"{}\".".format(path_to_file)
     )
@@ -111,7 +104,77 @@ def ffprobe_streams(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)["streams"]
+    # Raise so failed probe is not cached
+    if popen.returncode != 0:
+        raise RuntimeError(
+            "FFprobe failed to read \"{}\" (return code {})".format(
+                path_to_file, popen.returncode
+            )
+        )
+
+    data = json.loads(popen_stdout)
+    if "streams" not in data:
+        raise RuntimeError(
+            "FFprobe didn't return streams of \"{}\"".format(path_to_file)
+        )
+    return data
+
+
+def get_ffprobe_data(path_to_file, logger=None):
+    """Load data about entered filepath via ffprobe.
+
+    Result is cached until the file changes.
+
+    Args:
+        path_to_file (str): absolute path
+        logger (logging.getLogger): injected logger, if empty new is created
+
+    Returns:
+        dict: Output of ffprobe with "streams", "format" etc.
+    """
+    if not logger:
+        logger = log
+    return cached_probe(
+        "ffprobe",
+        path_to_file,
+        lambda path: _run_ffprobe(path, logger)
+    )
+
+
+def ffprobe_streams(path_to_file, logger=None):
+    """Load streams from entered filepath via ffprobe.
+
+    Args:
+        path_to_file (str): absolute path
+        logger (logging.getLogger): injected logger, if empty new is created
+
+    """
+    return get_ffprobe_data(path_to_file, logger)["streams"]
+
+
+def ffprobe_streams_for_inputs(paths, logger=None, max_workers=None):
+    """Load streams of multiple files in parallel via ffprobe.
+
+    Args:
+        paths (list): Absolute paths to files.
+        logger (logging.getLogger): injected logger, if empty new is created
+        max_workers (int): Number of parallel ffprobe processes.
+
+    Returns:
+        dict: Streams by path.
+    """
+    if not logger:
+        logger = log
+    data_by_path = cached_probes(
+        "ffprobe",
+        paths,
+        lambda path: _run_ffprobe(path, logger),
+        max_workers
+    )
+    return {
+        path: data["streams"]
+        for path, data in data_by_path.items()
+    }
 
 
 def is_oiio_supported():
@@ -65,6 +65,7 @@ class FtrackModule(
 
         # Prepare attribute
         self.server_event_handlers_paths = server_event_handlers_paths
+        self.server_event_workers = ftrack_settings["event_server_workers"]
         self.user_event_handlers_paths = user_event_handlers_paths
         self.tray_module = None
 
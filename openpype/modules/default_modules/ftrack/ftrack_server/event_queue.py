@@ -0,0 +1,117 @@
+import time
+import datetime
+
+import pymongo
+
+
+class MongoEventQueue(object):
+    """Ftrack events stored in mongo by storer and handled by processor.
+
+    Storer stores events as not processed. Processor fetches not processed
+    events in batches sorted by time when they were stored and acknowledges
+    handled events in bulk. Processed events older than
+    'keep_processed_days' are removed each 'cleanup_interval' seconds.
+
+    Acknowledges are written when 'ack_batch_size' events were handled,
+    each 'ack_interval' seconds and always before next fetch, so fetched
+    batch never contains already handled events.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection of events.
+    """
+    fetch_batch_size = 100
+    ack_batch_size = 50
+    ack_interval = 1.0
+    cleanup_interval = 60 * 60
+    keep_processed_days = 3
+
+    def __init__(self, collection):
+        self.collection = collection
+        self._pending_acks = []
+        self._last_ack = time.time()
+        self._last_cleanup = None
+        self._indexes_created = False
+
+    def ensure_indexes(self):
+        """Create indexes used by storer and processor queries."""
+        if self._indexes_created:
+            return
+        self.collection.create_index(
+            [
+                ("pype_data.is_processed", pymongo.ASCENDING),
+                ("pype_data.stored", pymongo.ASCENDING)
+            ],
+            background=True
+        )
+        self.collection.create_index("id", background=True)
+        self._indexes_created = True
+
+    def store(self, event_data):
+        """Store event data as not processed event."""
+        self.ensure_indexes()
+        event_data["pype_data"] = {
+            "stored": datetime.datetime.utcnow(),
+            "is_processed": False
+        }
+        self.collection.replace_one(
+            {"id": event_data["id"]}, event_data, upsert=True
+        )
+
+    def fetch(self, exclude_ids=None):
+        """Not processed events sorted by time when were stored.
+
+        Args:
+            exclude_ids (Iterable[ObjectId]): Skip events with these ids
+                (e.g. events which are still handled).
+
+        Returns:
+            list: Event documents, at most 'fetch_batch_size'.
+        """
+        self.ensure_indexes()
+        self.flush_acks()
+        query_filter = {"pype_data.is_processed": False}
+        if exclude_ids:
+            query_filter["_id"] = {"$nin": list(exclude_ids)}
+        return list(
+            self.collection.find(query_filter).sort(
+                [("pype_data.stored", pymongo.ASCENDING)]
+            ).limit(self.fetch_batch_size)
+        )
+
+    def ack(self, mongo_id):
+        """Mark event as processed, written to database in bulk."""
+        self._pending_acks.append(mongo_id)
+        if (
+            len(self._pending_acks) >= self.ack_batch_size
+            or time.time() - self._last_ack >= self.ack_interval
+        ):
+            self.flush_acks()
+
+    def flush_acks(self):
+        """Write pending acknowledges of processed events."""
+        self._last_ack = time.time()
+        if not self._pending_acks:
+            return
+        mongo_ids = self._pending_acks
+        self._pending_acks = []
+        self.collection.update_many(
+            {"_id": {"$in": mongo_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+
+    def cleanup(self, force=False):
+        """Remove old processed events if 'cleanup_interval' passed."""
+        if (
+            not force
+            and self._last_cleanup is not None
+            and time.time() - self._last_cleanup < self.cleanup_interval
+        ):
+            return
+        self._last_cleanup = time.time()
+        ago_date = datetime.datetime.utcnow() - datetime.timedelta(
+            days=self.keep_processed_days
+        )
+        self.collection.delete_many({
+            "pype_data.stored": {"$lte": ago_date},
+            "pype_data.is_processed": True
+        })
@@ -0,0 +1,308 @@
+"""Concurrent handling of events in event processor.
+
+Events are handled by workers where each worker has own ftrack session with
+own instances of event handlers, because ftrack session is not thread safe.
+Events related to the same project are handled by the same worker in order
+in which were stored, so handlers can expect that changes of a project are
+processed one by one. Events of other projects are not blocked by slow
+handling (e.g. synchronization of big project).
+"""
+import time
+import threading
+import collections
+import queue
+
+import ftrack_api
+from ftrack_api.logging import LazyLogMessage as L
+
+from openpype.api import Logger
+from .lib import CustomEventHubSession
+
+log = Logger().get_logger("Event workers")
+
+
+def get_event_partition_key(event):
+    """Key of event which defines which events must be handled in order.
+
+    Events of the same project share the key. Entity id is used if project
+    is not available and topic for events without entities.
+
+    Args:
+        event (ftrack_api.event.base.Event): Processed event.
+
+    Returns:
+        str: Partition key of event.
+    """
+    data = event.get("data") or {}
+    entities = data.get("entities") or []
+    for entity_info in entities:
+        parents = entity_info.get("parents") or []
+        for parent_info in parents:
+            if parent_info.get("entityType") == "show":
+                return parent_info["entityId"]
+
+        # Changed entity is project
+        if entity_info.get("entityType") == "show":
+            return entity_info["entityId"]
+
+    for entity_info in entities:
+        entity_id = entity_info.get("entityId")
+        if entity_id:
+            return entity_id
+    return event.get("topic")
+
+
+class HandlerMetrics(object):
+    """Timing metrics of event handlers callbacks (thread safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = collections.defaultdict(
+            lambda: {"count": 0, "failed": 0, "total": 0.0, "max": 0.0}
+        )
+
+    @staticmethod
+    def get_callback_name(callback):
+        """Name of handler used in metrics."""
+        handler = getattr(callback, "__self__", None)
+        if handler is not None:
+            return handler.__class__.__name__
+        return getattr(callback, "__name__", str(callback))
+
+    def add(self, name, duration, failed=False):
+        with self._lock:
+            item = self._metrics[name]
+            item["count"] += 1
+            item["total"] += duration
+            item["max"] = max(item["max"], duration)
+            if failed:
+                item["failed"] += 1
+
+    def wrap(self, callback):
+        """Wrap callback so its duration is stored to metrics."""
+        name = self.get_callback_name(callback)
+
+        def wrapper_callback(event):
+            start_time = time.perf_counter()
+            failed = True
+            try:
+                result = callback(event)
+                failed = False
+                return result
+            finally:
+                self.add(name, time.perf_counter() - start_time, failed)
+        return wrapper_callback
+
+    def get_metrics(self):
+        """Copy of metrics by handler name.
+
+        Returns:
+            dict: Handler name with 'count', 'failed', 'total', 'avg' and
+                'max' durations in seconds.
+        """
+        output = {}
+        with self._lock:
+            for name, item in self._metrics.items():
+                item = dict(item)
+                item["avg"] = item["total"] / item["count"]
+                output[name] = item
+        return output
+
+    def log_metrics(self):
+        metrics = self.get_metrics()
+        if not metrics:
+            return
+        lines = []
+        for name, item in sorted(
+            metrics.items(), key=lambda pair: pair[1]["total"], reverse=True
+        ):
+            lines.append(
+                "{}: count {} (failed {}) total {:.2f}s"
+                " avg {:.3f}s max {:.3f}s".format(
+                    name, item["count"], item["failed"], item["total"],
+                    item["avg"], item["max"]
+                )
+            )
+        log.info("Event handlers metrics:\n{}".format("\n".join(lines)))
+
+
+class WorkerEventHub(ftrack_api.event.hub.EventHub):
+    """Event hub of worker session which is never connected to server.
+
+    Events are handled by worker thread calling '_handle'. Published events
+    are sent using connected hub of processor session.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.main_event_hub = kwargs.pop("main_event_hub")
+        self.publish_lock = kwargs.pop("publish_lock")
+        super(WorkerEventHub, self).__init__(*args, **kwargs)
+
+    def publish(
+        self, event, synchronous=False, on_reply=None, on_error="raise"
+    ):
+        if synchronous:
+            return super(WorkerEventHub, self).publish(
+                event, synchronous, on_reply, on_error
+            )
+
+        with self.publish_lock:
+            return self.main_event_hub.publish(
+                event, synchronous, on_reply, on_error
+            )
+
+
+class WorkerSession(CustomEventHubSession):
+    """Session of event worker using 'WorkerEventHub'.
+
+    Expects 'main_event_hub' and 'publish_lock' in keyword arguments.
+    """
+
+    def _create_event_hub(self):
+        return WorkerEventHub(
+            self._server_url,
+            self._api_user,
+            self._api_key,
+            main_event_hub=self.kwargs["main_event_hub"],
+            publish_lock=self.kwargs["publish_lock"]
+        )
+
+
+class EventWorker(threading.Thread):
+    """Thread handling events with its own session.
+
+    Args:
+        session (ftrack_api.Session): Session with registered event handlers
+            used only by this worker.
+        done_callback (callable): Called with partition key and event when
+            event was handled.
+    """
+
+    def __init__(self, session, done_callback):
+        super(EventWorker, self).__init__()
+        self.daemon = True
+        self.session = session
+        self.done_callback = done_callback
+        self.events = queue.Queue()
+
+    def run(self):
+        while True:
+            item = self.events.get()
+            if item is None:
+                break
+
+            key, event = item
+            try:
+                self.session.event_hub._handle(event)
+            except Exception:
+                log.error(L(
+                    "Failed to handle event {0}", event.get("id")
+                ), exc_info=True)
+            self.done_callback(key, event)
+
+    def stop(self):
+        self.events.put(None)
+
+
+class EventWorkerPool(object):
+    """Pool of event workers keeping order of events of the same project.
+
+    Event is given to worker which already handles events with the same
+    partition key or to worker with least waiting events. Timing metrics of
+    handlers are logged each 'metrics_log_interval' seconds.
+
+    Args:
+        session_factory (callable): Creates new 'WorkerSession' with
+            registered event handlers for a worker. Receives keyword
+            arguments which must be passed to the session.
+        worker_count (int): Count of workers.
+        main_event_hub (ftrack_api.event.hub.EventHub): Connected event hub
+            used to publish events from workers.
+    """
+
+    metrics_log_interval = 5 * 60
+
+    def __init__(self, session_factory, worker_count, main_event_hub):
+        self.session_factory = session_factory
+        self.worker_count = max(1, worker_count)
+        self.main_event_hub = main_event_hub
+        self.metrics = HandlerMetrics()
+        self.done_events = queue.Queue()
+
+        self._publish_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._workers = []
+        # Partition key -> [worker, count of not handled events]
+        self._workers_by_key = {}
+        self._last_metrics_log = time.time()
+
+    def start(self):
+        """Create workers sessions and start workers."""
+        if self._workers:
+            return
+
+        for _ in range(self.worker_count):
+            session = self.session_factory(
+                main_event_hub=self.main_event_hub,
+                publish_lock=self._publish_lock
+            )
+            for subscriber in session.event_hub._subscribers:
+                subscriber.callback = self.metrics.wrap(subscriber.callback)
+
+            worker = EventWorker(session, self._on_event_done)
+            worker.start()
+            self._workers.append(worker)
+        log.debug("Started {} event workers".format(len(self._workers)))
+
+    def stop(self):
+        """Stop workers after all already submitted events are handled."""
+        for worker in self._workers:
+            worker.stop()
+        for worker in self._workers:
+            worker.join()
+            worker.session.close()
+        self._workers = []
+
+    def log_metrics(self, force=False):
+        """Log handlers metrics if 'metrics_log_interval' passed."""
+        if (
+            not force
+            and time.time() - self._last_metrics_log
+            < self.metrics_log_interval
+        ):
+            return
+        self._last_metrics_log = time.time()
+        self.metrics.log_metrics()
+
+    def submit(self, event):
+        """Add event to be handled by a worker."""
+        key = get_event_partition_key(event)
+        with self._lock:
+            item = self._workers_by_key.get(key)
+            if item is None:
+                worker = min(
+                    self._workers, key=lambda _worker: _worker.events.qsize()
+                )
+                item = self._workers_by_key[key] = [worker, 0]
+            item[1] += 1
+            worker = item[0]
+        worker.events.put((key, event))
+
+    def _on_event_done(self, key, event):
+        with self._lock:
+            item = self._workers_by_key.get(key)
+            if item is not None:
+                item[1] -= 1
+                if item[1] < 1:
+                    self._workers_by_key.pop(key)
+        self.done_events.put(event)
+
+    def get_done_events(self):
+        """Events handled since last call."""
+        events = []
+        while True:
+            try:
+                events.append(self.done_events.get_nowait())
+            except queue.Empty:
+                break
+        return events
@@ -60,6 +60,16 @@ class FtrackServer:
         self.session = None
 
     def set_files(self, paths):
+        self.register_handlers(
+            self.session, self.get_register_functions(paths)
+        )
+
+    def get_register_functions(self, paths):
+        """Load 'register' functions of event handlers modules in paths.
+
+        Returns:
+            list: Tuples of filepath and 'register' function.
+        """
         # Iterate all paths
         register_functions = []
         for path in paths:
@@ -101,10 +111,19 @@ class FtrackServer:
                 "There are no events with `register` function"
                 " in registered paths: \"{}\""
             ).format("| ".join(paths)))
+        return register_functions
 
+    def register_handlers(self, session, register_functions):
+        """Register event handlers to session.
+
+        Args:
+            session (ftrack_api.Session): Session where handlers are
+                registered.
+            register_functions (list): Output of 'get_register_functions'.
+        """
         for filepath, register_func in register_functions:
             try:
-                register_func(self.session)
+                register_func(session)
             except Exception:
                 log.warning(
                     "\"{}\" - register was not successful".format(filepath),
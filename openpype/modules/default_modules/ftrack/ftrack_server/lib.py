@@ -4,7 +4,6 @@ import logging
 import getpass
 import atexit
 import threading
-import datetime
 import time
 import queue
 import appdirs
@@ -23,6 +22,7 @@ try:
 except ImportError:
     from ftrack_api._weakref import WeakMethod
 from openpype_modules.ftrack.lib import get_ftrack_event_mongo_info
+from .event_queue import MongoEventQueue
 
 from openpype.lib import OpenPypeMongoConnection
 from openpype.api import Logger
@@ -134,10 +134,16 @@ class ProcessEventHub(SocketBaseEventHub):
 
     is_collection_created = False
     pypelog = Logger().get_logger("Session Processor")
+    # Don't load more events when workers did not handle this count yet
+    max_events_in_progress = 1000
 
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        self.event_queue = None
+        # Optional 'EventWorkerPool' handling events concurrently
+        self.worker_pool = None
+        self._events_in_progress = set()
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
@@ -147,6 +153,8 @@ class ProcessEventHub(SocketBaseEventHub):
             mongo_client = OpenPypeMongoConnection.get_mongo_client()
             self.dbcon = mongo_client[database_name][collection_name]
             self.mongo_client = mongo_client
+            self.event_queue = MongoEventQueue(self.dbcon)
+            self.event_queue.ensure_indexes()
 
         except pymongo.errors.AutoReconnect:
             self.pypelog.error((
@@ -166,34 +174,47 @@ class ProcessEventHub(SocketBaseEventHub):
     def wait(self, duration=None):
         """Overridden wait
         Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        set as processed in Mongo DB (in bulk, see 'MongoEventQueue').
+
+        Events are passed to 'worker_pool' if is set, subscribers of this
+        session are still triggered in this thread.
         """
         started = time.time()
         self.prepare_dbcon()
+        if self.worker_pool is not None:
+            self.worker_pool.start()
+        try:
+            self._wait(started, duration)
+        finally:
+            try:
+                if self.worker_pool is not None:
+                    self.worker_pool.stop()
+                    self._ack_done_events()
+                    self.worker_pool.log_metrics(force=True)
+                self.event_queue.flush_acks()
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Failed to mark processed events.", exc_info=True
+                )
+
+    def _wait(self, started, duration):
         while True:
+            if self.worker_pool is not None:
+                self._ack_done_events()
+                self.worker_pool.log_metrics()
+
             try:
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
                 if not self.load_events():
                     time.sleep(0.5)
             else:
-                try:
-                    self._handle(event)
-
-                    mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
-
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["AVALON_MONGO"]))
-                    sys.exit(0)
+                self._handle(event)
+                if self.worker_pool is None:
+                    self._ack_event(event)
+                else:
+                    self.worker_pool.submit(event)
+
                 # Additional special processing of events.
                 if event['topic'] == 'ftrack.meta.disconnected':
                     break
@@ -202,22 +223,36 @@ class ProcessEventHub(SocketBaseEventHub):
                 if (time.time() - started) > duration:
                     break
 
+    def _ack_event(self, event):
+        mongo_id = event["data"].get("_event_mongo_id")
+        if mongo_id is None:
+            return
+
+        self._events_in_progress.discard(mongo_id)
+        try:
+            self.event_queue.ack(mongo_id)
+
+        except pymongo.errors.AutoReconnect:
+            self.pypelog.error((
+                "Mongo server \"{}\" is not responding, exiting."
+            ).format(os.environ["AVALON_MONGO"]))
+            sys.exit(0)
+
+    def _ack_done_events(self):
+        for event in self.worker_pool.get_done_events():
+            self._ack_event(event)
+
     def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
-        self.dbcon.delete_many({
-            "pype_data.stored": {"$lte": ago_date},
-            "pype_data.is_processed": True
-        })
-
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
-            [("pype_data.stored", pymongo.ASCENDING)]
-        )
+        """Load batch of not processed events sorted by stored date
+
+        Events which are still handled by workers are skipped.
+        """
+        self.event_queue.cleanup()
+        if len(self._events_in_progress) >= self.max_events_in_progress:
+            return False
 
         found = False
-        for event_data in not_processed_events:
+        for event_data in self.event_queue.fetch(self._events_in_progress):
             new_event_data = {
                 k: v for k, v in event_data.items()
                 if k not in ["_id", "pype_data"]
@@ -232,6 +267,7 @@ class ProcessEventHub(SocketBaseEventHub):
                 ))
                 continue
             found = True
+            self._events_in_progress.add(event_data["_id"])
             self._event_queue.put(event)
 
         return found
@@ -10,6 +10,10 @@ from openpype_modules.ftrack.ftrack_server.lib import (
     ProcessEventHub,
     TOPIC_STATUS_SERVER
 )
+from openpype_modules.ftrack.ftrack_server.event_workers import (
+    WorkerSession,
+    EventWorkerPool
+)
 from openpype.modules import ModulesManager
 
 from openpype.api import Logger
@@ -67,6 +71,26 @@ def register(session):
     )
 
 
+def create_worker_pool(server, session, worker_count):
+    """Pool of workers with own sessions where event handlers are registered.
+
+    Args:
+        server (FtrackServer): Server with paths to event handlers.
+        session (SocketSession): Connected session of processor.
+        worker_count (int): Count of workers.
+    """
+    register_functions = server.get_register_functions(server.handler_paths)
+
+    def create_worker_session(**kwargs):
+        worker_session = WorkerSession(**kwargs)
+        server.register_handlers(worker_session, register_functions)
+        return worker_session
+
+    return EventWorkerPool(
+        create_worker_session, worker_count, session.event_hub
+    )
+
+
 def main(args):
     port = int(args[-1])
     # Create a TCP/IP socket
@@ -92,8 +116,16 @@ def main(args):
         server = FtrackServer(
             ftrack_module.server_event_handlers_paths
         )
+        # Handlers are registered to sessions of workers instead of
+        #   processor session
+        worker_count = ftrack_module.server_event_workers
+        use_workers = worker_count > 0
+        if use_workers:
+            session.event_hub.worker_pool = create_worker_pool(
+                server, session, worker_count
+            )
         log.debug("Launched Ftrack Event processor")
-        server.run_server(session)
+        server.run_server(session, load_files=not use_workers)
 
     except Exception:
         returncode = 1
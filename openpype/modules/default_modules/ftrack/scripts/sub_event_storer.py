@@ -13,6 +13,9 @@ from openpype_modules.ftrack.ftrack_server.lib import (
     TOPIC_STATUS_SERVER,
     TOPIC_STATUS_SERVER_RESULT
 )
+from openpype_modules.ftrack.ftrack_server.event_queue import (
+    MongoEventQueue
+)
 from openpype_modules.ftrack.lib import get_ftrack_event_mongo_info
 from openpype.lib import (
     OpenPypeMongoConnection,
@@ -31,6 +34,7 @@ class SessionFactory:
 
 database_name, collection_name = get_ftrack_event_mongo_info()
 dbcon = None
+event_queue = None
 
 # ignore_topics = ["ftrack.meta.connected"]
 ignore_topics = []
@@ -38,9 +42,12 @@ ignore_topics = []
 
 def install_db():
     global dbcon
+    global event_queue
     try:
         mongo_client = OpenPypeMongoConnection.get_mongo_client()
         dbcon = mongo_client[database_name][collection_name]
+        event_queue = MongoEventQueue(dbcon)
+        event_queue.ensure_indexes()
     except pymongo.errors.AutoReconnect:
         log.error("Mongo server \"{}\" is not responding, exiting.".format(
             OpenPypeMongoConnection.get_default_mongo_url()
@@ -55,14 +62,8 @@ def launch(event):
     event_data = event._data
     event_id = event["id"]
 
-    event_data["pype_data"] = {
-        "stored": datetime.datetime.utcnow(),
-        "is_processed": False
-    }
-
     try:
-        # dbcon.insert_one(event_data)
-        dbcon.replace_one({"id": event_id}, event_data, upsert=True)
+        event_queue.store(event_data)
         log.debug("Event: {} stored".format(event_id))
 
     except pymongo.errors.AutoReconnect:
@@ -0,0 +1,136 @@
+import datetime
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import PyMongoError
+
+from openpype.lib.log import PypeLogger
+
+log = PypeLogger().get_logger("LogViewer")
+
+
+class LogsQuery(object):
+    """Queries of log collection used by Log Viewer.
+
+    Logs are grouped to processes on server and log lines of a process are
+    queried only when needed. All filters are applied in the query.
+
+    Filters:
+        usernames (Iterable[str]): Only logs of users. All users if None.
+        levels (Iterable[str]): Only logs with levels. All levels if None.
+        time_window (datetime.timedelta): Only logs younger than time window.
+            All logs if None.
+
+    Args:
+        collection (pymongo.collection.Collection): Log collection.
+    """
+    process_keys = (
+        "process_id", "hostname", "hostip",
+        "username", "system_name", "process_name"
+    )
+    log_keys = (
+        "timestamp", "level", "thread", "threadName", "message", "loggerName",
+        "fileName", "module", "method", "lineNumber", "exception"
+    )
+
+    def __init__(self, collection):
+        self.collection = collection
+        self._indexes_created = False
+
+    def ensure_indexes(self):
+        """Create indexes used by queries (only once per object)."""
+        if self._indexes_created:
+            return
+        self._indexes_created = True
+        try:
+            self.collection.create_index(
+                [("process_id", ASCENDING), ("timestamp", ASCENDING)],
+                background=True
+            )
+            self.collection.create_index(
+                [("timestamp", DESCENDING)], background=True
+            )
+        except PyMongoError:
+            log.warning("Failed to create indexes of logs", exc_info=True)
+
+    def build_filter(self, usernames=None, levels=None, time_window=None):
+        """Mongo filter of logs matching filters.
+
+        Returns:
+            dict: Filter for 'find' or '$match'.
+        """
+        query_filter = {}
+        if usernames is not None:
+            query_filter["username"] = {"$in": list(usernames)}
+
+        if levels is not None:
+            query_filter["level"] = {"$in": list(levels)}
+
+        if time_window is not None:
+            query_filter["timestamp"] = {
+                "$gte": datetime.datetime.now() - time_window
+            }
+        return query_filter
+
+    def get_distinct_values(self, key, time_window=None):
+        """Distinct values of 'key' in logs of time window."""
+        self.ensure_indexes()
+        query_filter = self.build_filter(time_window=time_window)
+        return [
+            value
+            for value in self.collection.distinct(key, query_filter)
+            if value
+        ]
+
+    def get_processes(self, usernames=None, levels=None, time_window=None,
+                      limit=None):
+        """Summary of processes which have logs matching filters.
+
+        Args:
+            limit (int): Return only last started processes.
+
+        Returns:
+            list: Process information with keys from 'process_keys' and
+                'started', 'finished' and 'count' of matching logs. Sorted
+                by 'started' from last.
+        """
+        self.ensure_indexes()
+        query_filter = self.build_filter(usernames, levels, time_window)
+        # backwards (in)compatibility
+        query_filter["process_id"] = {"$nin": [None, ""]}
+
+        group_stage = {
+            "_id": "$process_id",
+            "started": {"$min": "$timestamp"},
+            "finished": {"$max": "$timestamp"},
+            "count": {"$sum": 1}
+        }
+        for key in self.process_keys:
+            if key != "process_id":
+                group_stage[key] = {"$first": "${}".format(key)}
+
+        pipeline = [
+            {"$match": query_filter},
+            {"$group": group_stage},
+            {"$sort": {"started": DESCENDING}}
+        ]
+        if limit:
+            pipeline.append({"$limit": limit})
+
+        processes = []
+        for item in self.collection.aggregate(pipeline, allowDiskUse=True):
+            item["process_id"] = item.pop("_id")
+            processes.append(item)
+        return processes
+
+    def get_process_logs(self, process_id, levels=None, time_window=None):
+        """Log lines of process matching filters sorted by time."""
+        self.ensure_indexes()
+        query_filter = self.build_filter(
+            levels=levels, time_window=time_window
+        )
+        query_filter["process_id"] = process_id
+        return list(self.collection.find(
+            query_filter,
+            projection={key: True for key in self.log_keys},
+            sort=[("timestamp", ASCENDING)]
+        ))
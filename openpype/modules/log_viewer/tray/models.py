@@ -1,6 +1,6 @@
-import collections
 from Qt import QtCore, QtGui
 from openpype.lib.log import PypeLogger
+from ..lib import LogsQuery
 
 
 class LogModel(QtGui.QStandardItemModel):
@@ -21,24 +21,28 @@ class LogModel(QtGui.QStandardItemModel):
         "system_name": "System name",
         "started": "Started at"
     }
-    process_keys = (
-        "process_id", "hostname", "hostip",
-        "username", "system_name", "process_name"
-    )
     log_keys = (
         "timestamp", "level", "thread", "threadName", "message", "loggerName",
         "fileName", "module", "method", "lineNumber"
     )
     default_value = "- Not set -"
+    # maximum of shown processes (last started)
+    process_limit = 1000
 
-    ROLE_LOGS = QtCore.Qt.UserRole + 2
     ROLE_PROCESS_ID = QtCore.Qt.UserRole + 3
 
     def __init__(self, parent=None):
         super(LogModel, self).__init__(parent)
 
-        self.log_by_process = None
         self.dbcon = None
+        self.query = None
+
+        # filters applied in database queries
+        self.filter_usernames = None
+        self.filter_levels = None
+        self.time_window = None
+
+        self._logs_by_process_id = {}
 
         # Crash if connection is not possible to skip this module
         if not PypeLogger.initialized:
@@ -49,6 +53,7 @@ class LogModel(QtGui.QStandardItemModel):
             PypeLogger.bootstrap_mongo_log()
             database = connection[PypeLogger.log_database_name]
             self.dbcon = database[PypeLogger.log_collection_name]
+            self.query = LogsQuery(self.dbcon)
 
     def headerData(self, section, orientation, role):
         if (
@@ -61,78 +66,80 @@ class LogModel(QtGui.QStandardItemModel):
 
         super(LogModel, self).headerData(section, orientation, role)
 
-    def add_process_logs(self, process_logs):
+    def set_filters(self, usernames=None, levels=None, time_window=None):
+        """Set filters of queries, 'refresh' must be called to apply them.
+
+        Args:
+            usernames (Iterable[str]): Show only processes of users.
+            levels (Iterable[str]): Show only logs with levels.
+            time_window (datetime.timedelta): Show only younger logs.
+        """
+        self.filter_usernames = usernames
+        self.filter_levels = levels
+        self.time_window = time_window
+
+    def get_distinct_values(self, key):
+        """Values of 'key' in logs of current time window."""
+        if not self.query:
+            return []
+        return self.query.get_distinct_values(key, self.time_window)
+
+    def get_process_logs(self, process_id):
+        """Log lines of process, queried from database on first request."""
+        if process_id in self._logs_by_process_id:
+            return self._logs_by_process_id[process_id]
+
+        logs = []
+        if self.query:
+            for item in self.query.get_process_logs(
+                process_id, self.filter_levels, self.time_window
+            ):
+                log_item = {}
+                for key in self.log_keys:
+                    log_item[key] = item.get(key) or self.default_value
+
+                if "exception" in item:
+                    log_item["exception"] = item["exception"]
+                logs.append(log_item)
+
+        self._logs_by_process_id[process_id] = logs
+        return logs
+
+    def add_process_logs(self, process_info):
         items = []
         first_item = True
         for key in self.COLUMNS:
-            display_value = str(process_logs[key])
+            display_value = str(process_info[key])
             item = QtGui.QStandardItem(display_value)
             if first_item:
                 first_item = False
-                item.setData(process_logs["_logs"], self.ROLE_LOGS)
-                item.setData(process_logs["process_id"], self.ROLE_PROCESS_ID)
+                item.setData(process_info["process_id"], self.ROLE_PROCESS_ID)
             items.append(item)
         self.appendRow(items)
 
     def refresh(self):
-        self.log_by_process = collections.defaultdict(list)
-        self.process_info = {}
+        self._logs_by_process_id = {}
 
         self.clear()
         self.beginResetModel()
-        if self.dbcon:
-            result = self.dbcon.find({})
-            for item in result:
-                process_id = item.get("process_id")
-                # backwards (in)compatibility
-                if not process_id:
-                    continue
-
-                if process_id not in self.process_info:
-                    proc_dict = {"_logs": []}
-                    for key in self.process_keys:
-                        proc_dict[key] = (
-                            item.get(key) or self.default_value
-                        )
-                    self.process_info[process_id] = proc_dict
-
-                log_item = {}
-                for key in self.log_keys:
-                    log_item[key] = item.get(key) or self.default_value
-
-                if "exception" in item:
-                    log_item["exception"] = item["exception"]
-
-                self.process_info[process_id]["_logs"].append(log_item)
-
-        for item in self.process_info.values():
-            item["_logs"] = sorted(
-                item["_logs"], key=lambda item: item["timestamp"]
+        if self.query:
+            processes = self.query.get_processes(
+                self.filter_usernames,
+                self.filter_levels,
+                self.time_window,
+                limit=self.process_limit
             )
-            item["started"] = item["_logs"][0]["timestamp"]
-            self.add_process_logs(item)
+            for process_info in processes:
+                for key in self.COLUMNS:
+                    if not process_info.get(key):
+                        process_info[key] = self.default_value
+                self.add_process_logs(process_info)
 
         self.endResetModel()
 
 
 class LogsFilterProxy(QtCore.QSortFilterProxyModel):
-    def __init__(self, *args, **kwargs):
-        super(LogsFilterProxy, self).__init__(*args, **kwargs)
-        self.col_usernames = None
-        self.filter_usernames = set()
-
-    def update_users_filter(self, users):
-        self.filter_usernames = set()
-        for user in users or tuple():
-            self.filter_usernames.add(user)
-        self.invalidateFilter()
-
-    def filterAcceptsRow(self, source_row, source_parent):
-        if self.col_usernames is not None:
-            index = self.sourceModel().index(
-                source_row, self.col_usernames, source_parent
-            )
-            user = index.data(QtCore.Qt.DisplayRole)
-            if user not in self.filter_usernames:
-                return False
-        return True
+    """Proxy for sorting of processes.
+
+    Filters by user, level and time window are part of query of 'LogModel'.
+    """
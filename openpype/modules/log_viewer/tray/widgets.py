@@ -1,3 +1,5 @@
+import datetime
+
 from Qt import QtCore, QtWidgets
 from avalon.vendor import qtawesome
 from .models import LogModel, LogsFilterProxy
@@ -106,33 +108,38 @@ class CustomCombo(QtWidgets.QWidget):
 class LogsWidget(QtWidgets.QWidget):
     """A widget that lists the published subsets for an asset"""
 
+    # label and time window of time filter
+    time_windows = (
+        ("Last hour", datetime.timedelta(hours=1)),
+        ("Last 24 hours", datetime.timedelta(days=1)),
+        ("Last 7 days", datetime.timedelta(days=7)),
+        ("Last 30 days", datetime.timedelta(days=30)),
+        ("All", None)
+    )
+    default_time_window = "Last 7 days"
+
     def __init__(self, detail_widget, parent=None):
         super(LogsWidget, self).__init__(parent=parent)
 
         model = LogModel()
         proxy_model = LogsFilterProxy()
         proxy_model.setSourceModel(model)
-        proxy_model.col_usernames = model.COLUMNS.index("username")
 
         filter_layout = QtWidgets.QHBoxLayout()
 
-        user_filter = CustomCombo("Users", self)
-        users = model.dbcon.distinct("username")
-        user_filter.populate(users)
-        user_filter.selection_changed.connect(self._user_changed)
-
-        proxy_model.update_users_filter(users)
+        time_filter = QtWidgets.QComboBox(self)
+        for idx, (label, _) in enumerate(self.time_windows):
+            time_filter.addItem(label)
+            if label == self.default_time_window:
+                time_filter.setCurrentIndex(idx)
 
+        user_filter = CustomCombo("Users", self)
         level_filter = CustomCombo("Levels", self)
-        levels = model.dbcon.distinct("level")
-        level_filter.addItems(levels)
-        level_filter.selection_changed.connect(self._level_changed)
-
-        detail_widget.update_level_filter(levels)
 
         icon = qtawesome.icon("fa.refresh", color="white")
         refresh_btn = QtWidgets.QPushButton(icon, "")
 
+        filter_layout.addWidget(time_filter)
         filter_layout.addWidget(user_filter)
         filter_layout.addWidget(level_filter)
         filter_layout.addStretch(1)
@@ -157,12 +164,16 @@ class LogsWidget(QtWidgets.QWidget):
 
         view.selectionModel().selectionChanged.connect(self._on_index_change)
         refresh_btn.clicked.connect(self._on_refresh_clicked)
+        time_filter.currentIndexChanged.connect(self._time_window_changed)
+        user_filter.selection_changed.connect(self._user_changed)
+        level_filter.selection_changed.connect(self._level_changed)
 
         # Store to memory
         self.model = model
         self.proxy_model = proxy_model
         self.view = view
 
+        self.time_filter = time_filter
         self.user_filter = user_filter
         self.level_filter = level_filter
 
@@ -170,36 +181,87 @@ class LogsWidget(QtWidgets.QWidget):
         self.refresh_btn = refresh_btn
 
         # prepare
+        self._populate_filters()
         self.refresh()
 
     def refresh(self):
+        self.model.set_filters(
+            self._get_checked_values(self.user_filter),
+            self._get_checked_values(self.level_filter),
+            self._get_time_window()
+        )
         self.model.refresh()
         self.detail_widget.refresh()
 
+    def _populate_filters(self):
+        """Fill user and level filters with values of time window.
+
+        Unchecked values stay unchecked.
+        """
+        self.model.set_filters(time_window=self._get_time_window())
+        for combo, key in (
+            (self.user_filter, "username"),
+            (self.level_filter, "level")
+        ):
+            unchecked = set(
+                action.text()
+                for action in combo.items()
+                if not action.isChecked()
+            )
+            combo.populate(sorted(self.model.get_distinct_values(key)))
+            for action in combo.items():
+                action.setChecked(action.text() not in unchecked)
+
+        self.detail_widget.update_level_filter(
+            self._get_checked_values(self.level_filter, True)
+        )
+
+    def _get_time_window(self):
+        return self.time_windows[self.time_filter.currentIndex()][1]
+
+    def _get_checked_values(self, combo, all_values=False):
+        """Checked values of filter combo.
+
+        Returns:
+            Union[set, None]: None if all values are checked (no filter).
+        """
+        checked_values = set()
+        all_checked = True
+        for action in combo.items():
+            if action.isChecked():
+                checked_values.add(action.text())
+            else:
+                all_checked = False
+        if all_checked and not all_values:
+            return None
+        return checked_values
+
     def _on_refresh_clicked(self):
+        self._populate_filters()
         self.refresh()
 
     def _on_index_change(self, to_index, from_index):
         index = self._selected_log()
         if index:
-            logs = index.data(self.model.ROLE_LOGS)
+            logs = self.model.get_process_logs(
+                index.data(self.model.ROLE_PROCESS_ID)
+            )
         else:
             logs = []
         self.detail_widget.set_detail(logs)
 
+    def _time_window_changed(self):
+        self._populate_filters()
+        self.refresh()
+
     def _user_changed(self):
-        checked_values = set()
-        for action in self.user_filter.items():
-            if action.isChecked():
-                checked_values.add(action.text())
-        self.proxy_model.update_users_filter(checked_values)
+        self.refresh()
 
     def _level_changed(self):
-        checked_values = set()
-        for action in self.level_filter.items():
-            if action.isChecked():
-                checked_values.add(action.text())
-        self.detail_widget.update_level_filter(checked_values)
+        self.detail_widget.update_level_filter(
+            self._get_checked_values(self.level_filter, True)
+        )
+        self.refresh()
 
     def on_context_menu(self, point):
         # TODO will be any actions? it's ready
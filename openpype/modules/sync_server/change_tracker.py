@@ -0,0 +1,188 @@
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+from pymongo.errors import PyMongoError
+
+from openpype.lib import PypeLogger
+
+log = PypeLogger().get_logger("SyncServer")
+
+
+class RepresentationChangeTracker(object):
+    """Tracks representations of a project which may need synchronization.
+
+    Full scan of representations is done on first pass and then each
+    'full_scan_interval' seconds. Other passes examine only representations
+    which were returned by previous pass (they may still need
+    synchronization) and representations which changed since previous pass.
+
+    Changed representations are collected from Mongo change stream if
+    database supports it (replica sets). Otherwise are polled by creation
+    time of representation and by 'files.sites.created_dt' which is set
+    when file was synchronized to any site.
+
+    Sites added by other processes (e.g. download request from Loader)
+    without change stream available are found by next full scan, so they
+    may wait up to 'full_scan_interval' seconds.
+
+    Args:
+        full_scan_interval (int): Seconds between full scans.
+        use_change_stream (bool): Try to use change streams.
+    """
+    # 'created_dt' of sites is stored in local time of the machine which
+    #   synchronized the file and '_id' is created with clock of machine
+    #   which inserted the representation, watermarks are moved back to
+    #   handle time differences between machines
+    watermark_margin = timedelta(hours=1)
+    # Do full scan if more documents changed since last pass
+    max_changed_ids = 10000
+
+    def __init__(self, full_scan_interval=600, use_change_stream=True):
+        self.full_scan_interval = full_scan_interval
+        self.use_change_stream = use_change_stream
+
+        self._last_full_scan = None
+        self._watermark = None
+        self._utc_watermark = None
+        self._pending_ids = set()
+        self._changed_ids = set()
+        self._change_stream = None
+        self._index_created = False
+
+    def reset(self):
+        """Next pass will do full scan."""
+        self._last_full_scan = None
+        self._close_change_stream()
+
+    def mark_changed(self, representation_id):
+        """Representation will be examined in next pass."""
+        if not isinstance(representation_id, ObjectId):
+            representation_id = ObjectId(representation_id)
+        self._changed_ids.add(representation_id)
+
+    def set_pending(self, representation_ids):
+        """Store ids of representations which were returned in last pass.
+
+        These representations are examined in next pass too as they may
+        not be fully synchronized yet.
+        """
+        self._pending_ids = set(representation_ids)
+
+    def get_filter(self, collection):
+        """Filter of representations which should be examined in this pass.
+
+        Args:
+            collection (pymongo.collection.Collection): Project collection.
+
+        Returns:
+            Union[dict, None]: Filter of representations or None if full
+                scan should be done.
+        """
+        now = datetime.now()
+        utc_now = datetime.utcnow()
+        watermark = self._watermark
+        utc_watermark = self._utc_watermark
+        self._watermark = now
+        self._utc_watermark = utc_now
+
+        if self._is_full_scan_required():
+            self._start_full_scan(collection)
+            return None
+
+        representation_ids = self._pending_ids | self._changed_ids
+        self._changed_ids = set()
+        if self._change_stream is not None:
+            changed_ids = self._read_change_stream()
+            if changed_ids is None:
+                self._start_full_scan(collection)
+                return None
+            representation_ids |= changed_ids
+            return {"_id": {"$in": list(representation_ids)}}
+
+        return {"$or": [
+            {"_id": {"$in": list(representation_ids)}},
+            {"_id": {"$gte": ObjectId.from_datetime(
+                utc_watermark - self.watermark_margin
+            )}},
+            {"files.sites.created_dt": {
+                "$gte": watermark - self.watermark_margin
+            }}
+        ]}
+
+    def _is_full_scan_required(self):
+        if self._last_full_scan is None:
+            return True
+        return (
+            time.time() - self._last_full_scan
+        ) > self.full_scan_interval
+
+    def _start_full_scan(self, collection):
+        self._last_full_scan = time.time()
+        self._changed_ids = set()
+        self._close_change_stream()
+        if self.use_change_stream:
+            self._open_change_stream(collection)
+
+        if self._change_stream is None:
+            self._create_index(collection)
+
+    def _open_change_stream(self, collection):
+        try:
+            self._change_stream = collection.watch([
+                {"$match": {
+                    "operationType": {"$in": ["insert", "update", "replace"]}
+                }},
+                {"$project": {"documentKey": True}}
+            ])
+        except PyMongoError:
+            log.debug((
+                "Change streams are not available for \"{}\"."
+                " Using polling of changes."
+            ).format(collection.name))
+            self.use_change_stream = False
+            self._change_stream = None
+
+    def _close_change_stream(self):
+        if self._change_stream is None:
+            return
+        try:
+            self._change_stream.close()
+        except PyMongoError:
+            pass
+        self._change_stream = None
+
+    def _read_change_stream(self):
+        """Ids of documents changed since last read.
+
+        Returns:
+            Union[set, None]: Changed ids or None if full scan is required.
+        """
+        changed_ids = set()
+        try:
+            while True:
+                change = self._change_stream.try_next()
+                if change is None:
+                    break
+                changed_ids.add(change["documentKey"]["_id"])
+                if len(changed_ids) > self.max_changed_ids:
+                    return None
+        except PyMongoError:
+            log.warning("Change stream failed", exc_info=True)
+            self._change_stream = None
+            return None
+        return changed_ids
+
+    def _create_index(self, collection):
+        if self._index_created:
+            return
+        self._index_created = True
+        try:
+            collection.create_index(
+                "files.sites.created_dt", background=True
+            )
+        except PyMongoError:
+            log.debug(
+                "Failed to create index of sites creation time.",
+                exc_info=True
+            )
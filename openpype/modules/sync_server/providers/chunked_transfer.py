@@ -0,0 +1,159 @@
+"""Chunked and resumable copy of files for providers with stream access.
+
+Data are written to partial file next to target which is renamed to target
+when whole file is transferred. Count of transferred bytes is stored with
+progress to site record of the file ('resume' key) together with size and
+modification time of source, so next attempt continues from there if partial
+file is still available and source did not change.
+"""
+import time
+
+from openpype.api import Logger
+
+log = Logger().get_logger("SyncServer")
+
+CHUNK_SIZE = 8 * 1024 * 1024
+PARTIAL_EXT = ".part"
+
+
+def get_partial_path(path):
+    """Path of partial file used during transfer to 'path'."""
+    return path + PARTIAL_EXT
+
+
+def get_source_mtime(mtime):
+    """Modification time of source as stored in resume info of transfer.
+
+    Stored in whole seconds as SFTP doesn't provide better precision.
+    """
+    return int(mtime)
+
+
+def get_resume_offset(file, site, size, mtime, partial_size):
+    """Offset where interrupted transfer of file to site can continue.
+
+    Args:
+        file (dict): File info from representation with site records.
+        site (str): Name of target site.
+        size (int): Size of source file.
+        mtime (float): Modification time of source file.
+        partial_size (int): Size of existing partial file, None if missing.
+
+    Returns:
+        (int): 0 if transfer must start from beginning
+    """
+    if not partial_size:
+        return 0
+
+    for site_rec in file.get("sites") or []:
+        if site_rec.get("name") != site:
+            continue
+        resume = site_rec.get("resume") or {}
+        # source file changed since previous attempt
+        if (
+            resume.get("size") != size
+            or resume.get("mtime") != get_source_mtime(mtime)
+        ):
+            return 0
+        return min(int(resume.get("offset") or 0), partial_size)
+    return 0
+
+
+def copy_chunks(source_stream, target_stream, size, offset=0,
+                chunk_size=CHUNK_SIZE, callback=None):
+    """Copy data between opened streams by chunks starting at 'offset'.
+
+    Args:
+        source_stream (file): Readable stream of source file.
+        target_stream (file): Writable stream of target file.
+        size (int): Size of source file.
+        offset (int): Bytes already transferred in previous attempt.
+        chunk_size (int): Size of one read in bytes.
+        callback (callable): Called with count of transferred bytes after
+            each chunk is written.
+
+    Returns:
+        (int): Count of transferred bytes
+    """
+    source_stream.seek(offset)
+    target_stream.seek(offset)
+    transferred = offset
+    while transferred < size:
+        chunk = source_stream.read(min(chunk_size, size - transferred))
+        if not chunk:
+            break
+        target_stream.write(chunk)
+        transferred += len(chunk)
+        if callback is not None:
+            target_stream.flush()
+            callback(transferred)
+    return transferred
+
+
+class TransferProgress(object):
+    """Callback of 'copy_chunks' reporting progress of transfer to DB.
+
+    Progress and resume offset are stored each 'LOG_PROGRESS_SEC' of
+    server. Raises ValueError if representation was paused, offset of
+    the transfer is kept so it continues when resumed.
+
+    Args:
+        server (SyncServerModule): server instance to call update_db on
+        collection (str): name of collection
+        file (dict): info about transferred file (from db)
+        representation (dict): complete repre containing 'file'
+        site (str): name of target site
+        size (int): size of source file
+        mtime (float): modification time of source file
+        direction (str): 'Upload' or 'Download' for logging
+    """
+
+    def __init__(self, server, collection, file, representation, site,
+                 size, mtime, direction):
+        self.server = server
+        self.collection = collection
+        self.file = file
+        self.representation = representation
+        self.site = site
+        self.size = size
+        self.mtime = get_source_mtime(mtime)
+        self.direction = direction
+        self._last_tick = None
+
+    def __call__(self, transferred):
+        if (
+            self._last_tick is not None
+            and time.time() - self._last_tick < self.server.LOG_PROGRESS_SEC
+        ):
+            return
+
+        self._last_tick = time.time()
+        if self.server.is_representation_paused(
+            self.representation["_id"],
+            check_parents=True,
+            project_name=self.collection
+        ):
+            raise ValueError("Paused during process, please redo.")
+
+        progress = 1.0
+        if self.size:
+            progress = float(transferred) / self.size
+        log.debug("{}ed {}%.".format(self.direction, int(progress * 100)))
+        self.server.update_db(collection=self.collection,
+                              new_file_id=None,
+                              file=self.file,
+                              representation=self.representation,
+                              site=self.site,
+                              progress=progress,
+                              resume={"offset": transferred,
+                                      "size": self.size,
+                                      "mtime": self.mtime})
+
+
+def validate_size(path, size, transferred_size):
+    """Raise ValueError if transferred file doesn't match source size."""
+    if transferred_size != size:
+        raise ValueError(
+            "Size of transferred file {} ({}) doesn't match source ({})"
+            .format(path, transferred_size, size)
+        )
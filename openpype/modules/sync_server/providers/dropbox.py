@@ -4,6 +4,7 @@ import dropbox
 
 from openpype.api import Logger
 from .abstract_provider import AbstractProvider
+from .folder_cache import FolderTreeCache
 from ..utils import EditableScopes
 
 log = Logger().get_logger("SyncServer")
@@ -17,6 +18,10 @@ class DropboxHandler(AbstractProvider):
         self.active = False
         self.site_name = site_name
         self.presets = presets
+        # folders can't be checked without listing, don't persist them
+        self._folder_cache = FolderTreeCache.get_cache(
+            self.CODE, project_name, site_name, persistent=False
+        )
 
         if not self.presets:
             log.info(
@@ -388,11 +393,14 @@ class DropboxHandler(AbstractProvider):
         Returns:
             (string) folder id of lowest subfolder from 'path'
         """
-        if self._path_exists(folder_path):
+        # folder was already created or found by this process
+        if self._folder_cache.is_verified(folder_path):
             return folder_path
 
-        self.dbx.files_create_folder_v2(folder_path)
+        if not self._path_exists(folder_path):
+            self.dbx.files_create_folder_v2(folder_path)
 
+        self._folder_cache.set(folder_path, folder_path)
         return folder_path
 
     def get_tree(self):
@@ -0,0 +1,202 @@
+import os
+import re
+import json
+import time
+import atexit
+import threading
+
+import appdirs
+
+from openpype.api import Logger
+
+log = Logger().get_logger("SyncServer")
+
+
+class FolderTreeCache(object):
+    """Persistent cache of remote folder paths and their ids.
+
+    Cache is shared by all provider handlers of the same provider, project
+    and site in the process (use 'get_cache') and is stored to json file in
+    OpenPype's user data directory, so the folder tree does not have to be
+    listed again after restart.
+
+    Cache is updated incrementally when provider creates a folder. Folders
+    which are not in cache should be resolved with provider on demand and
+    folders which were removed on provider should be removed from cache with
+    'remove'.
+
+    Structure of cached folders matches tree of 'GDriveHandler':
+        {"/My Drive/project/assets": {"id": "1234567"}}
+
+    Folders loaded from file may not exist anymore, provider should check
+    them before use if they're not 'is_verified'.
+
+    Args:
+        filepath (str): Path to json file where cache is stored. Cache is
+            kept only in memory if not passed.
+    """
+    # Minimum time between writes of the cache file
+    save_interval = 30
+
+    _caches = {}
+    _caches_lock = threading.Lock()
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._folders = None
+        self._verified = set()
+        self._dirty = False
+        self._last_save = time.time()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def get_cache(cls, provider_code, project_name, site_name,
+                  persistent=True):
+        """Shared cache of folders for provider, project and site.
+
+        Args:
+            persistent (bool): Store cache to file. Providers which can't
+                check cached folders cheaply should not persist the cache.
+        """
+        key = (provider_code, project_name, site_name)
+        with cls._caches_lock:
+            cache = cls._caches.get(key)
+            if cache is None:
+                filepath = None
+                if persistent:
+                    filename = "_".join(
+                        re.sub(r"[^\w\-.]", "_", str(part)) for part in key
+                    )
+                    filepath = os.path.join(
+                        appdirs.user_data_dir("openpype", "pypeclub"),
+                        "sync_server",
+                        "folder_trees",
+                        "{}.json".format(filename)
+                    )
+                cache = cls(filepath)
+                cls._caches[key] = cache
+        return cache
+
+    @classmethod
+    def save_all(cls):
+        """Store all changed caches, called on exit of the process."""
+        with cls._caches_lock:
+            caches = list(cls._caches.values())
+        for cache in caches:
+            try:
+                cache.save(force=True)
+            except Exception:
+                log.warning("Failed to store folder cache", exc_info=True)
+
+    @property
+    def folders(self):
+        """Cached folders by path. Loaded from file on first access."""
+        with self._lock:
+            if self._folders is None:
+                self._folders = self._read()
+            return self._folders
+
+    def get(self, path):
+        """Id of cached folder or None if folder is not cached."""
+        item = self.folders.get(path)
+        if item:
+            return item["id"]
+        return None
+
+    def is_verified(self, path):
+        """Folder was created or found on provider by this process."""
+        return path in self._verified
+
+    def mark_verified(self, path):
+        """Cached folder was checked on provider by this process."""
+        with self._lock:
+            self._verified.add(path)
+
+    def set(self, path, folder_id):
+        """Store folder which was created or found on provider."""
+        with self._lock:
+            self.folders[path] = {"id": folder_id}
+            self._verified.add(path)
+            self._dirty = True
+        self.save()
+
+    def update(self, folders):
+        """Replace cached folders with result of full listing of provider.
+
+        Args:
+            folders (dict): Folders by path in format of 'folders'.
+        """
+        with self._lock:
+            folders_cache = self.folders
+            folders_cache.clear()
+            folders_cache.update(folders)
+            self._verified = set(folders.keys())
+            self._dirty = True
+        self.save(force=True)
+
+    def remove(self, path):
+        """Remove folder and its subfolders from cache.
+
+        Should be called when cached folder does not exist on provider.
+        """
+        prefix = path.rstrip("/") + "/"
+        with self._lock:
+            folders = self.folders
+            for folder_path in list(folders.keys()):
+                if folder_path == path or folder_path.startswith(prefix):
+                    folders.pop(folder_path)
+                    self._verified.discard(folder_path)
+                    self._dirty = True
+        self.save()
+
+    def _read(self):
+        if not self.filepath or not os.path.exists(self.filepath):
+            return {}
+        try:
+            with open(self.filepath, "r") as stream:
+                data = json.load(stream)
+        except (ValueError, IOError, OSError):
+            log.warning(
+                "Failed to read folder cache \"{}\"".format(self.filepath),
+                exc_info=True
+            )
+            return {}
+        return data.get("folders") or {}
+
+    def save(self, force=False):
+        """Store cache to file if changed.
+
+        Args:
+            force (bool): Store even if 'save_interval' did not pass since
+                last save.
+        """
+        with self._lock:
+            if not self._dirty or not self.filepath:
+                return
+            if (
+                not force
+                and time.time() - self._last_save < self.save_interval
+            ):
+                return
+            data = {"folders": dict(self.folders)}
+            self._dirty = False
+            self._last_save = time.time()
+
+        dirpath = os.path.dirname(self.filepath)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        tmp_path = "{}.{}.tmp".format(self.filepath, os.getpid())
+        with open(tmp_path, "w") as stream:
+            json.dump(data, stream)
+
+        # 'os.rename' can't replace existing file on windows
+        if hasattr(os, "replace"):
+            os.replace(tmp_path, self.filepath)
+        else:
+            if os.path.exists(self.filepath):
+                os.remove(self.filepath)
+            os.rename(tmp_path, self.filepath)
+
+
+atexit.register(FolderTreeCache.save_all)
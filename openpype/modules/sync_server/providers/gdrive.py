@@ -8,6 +8,7 @@ import platform
 from openpype.api import Logger
 from openpype.api import get_system_settings
 from .abstract_provider import AbstractProvider
+from .folder_cache import FolderTreeCache
 from ..utils import time_function, ResumableError
 
 log = Logger().get_logger("SyncServer")
@@ -37,6 +38,10 @@ class GDriveHandler(AbstractProvider):
         which are used in API. Building of this tree might be expensive and
         slow and should be run only when necessary. Currently is set to
         lazy creation, created only after first call when necessary.
+        Tree is persisted in 'FolderTreeCache' and built from full listing
+        only if cache is empty. Folders missing in cache are resolved on
+        demand. Cached folders are checked once per process and folders
+        which don't exist anymore or are trashed are removed from it.
 
         Configuration for provider is in
             'settings/defaults/project_settings/global.json'
@@ -66,6 +71,10 @@ class GDriveHandler(AbstractProvider):
         self.site_name = site_name
         self.service = None
         self.root = None
+        self._tree = tree
+        self._folder_cache = FolderTreeCache.get_cache(
+            self.CODE, project_name, site_name
+        )
 
         self.presets = presets
         if not self.presets:
@@ -85,7 +94,6 @@ class GDriveHandler(AbstractProvider):
         if self.presets["enabled"]:
             self.service = self._get_gd_service(cred_path)
 
-            self._tree = tree
             self.active = True
 
     def is_active(self):
@@ -186,7 +194,11 @@ class GDriveHandler(AbstractProvider):
              (dictionary) - url to id mapping
         """
         if not self._tree:
-            self._tree = self._build_tree(self.list_folders())
+            if not self._folder_cache.folders:
+                self._folder_cache.update(
+                    self._build_tree(self.list_folders())
+                )
+            self._tree = self._folder_cache.folders
         return self._tree
 
     def create_folder(self, path):
@@ -219,14 +231,20 @@ class GDriveHandler(AbstractProvider):
                         'mimeType': 'application/vnd.google-apps.folder',
                         'parents': [folder_id]
                     }
-                    folder = self.service.files().create(
-                        body=folder_metadata,
-                        supportsAllDrives=True,
-                        fields='id').execute()
+                    try:
+                        folder = self.service.files().create(
+                            body=folder_metadata,
+                            supportsAllDrives=True,
+                            fields='id').execute()
+                    except errors.HttpError as ex:
+                        if ex.resp['status'] == '404':
+                            # cached parent folder was removed
+                            self._remove_folder(path)
+                        raise
                     folder_id = folder["id"]
 
                     new_path_key = path + '/' + new_folder_name
-                    self.get_tree()[new_path_key] = {"id": folder_id}
+                    self._set_folder(new_path_key, folder_id)
 
                     path = new_path_key
                 return folder_id
@@ -325,6 +343,8 @@ class GDriveHandler(AbstractProvider):
 
         except errors.HttpError as ex:
             if ex.resp['status'] == '404':
+                # folder might be removed, resolve it again in next try
+                self._remove_folder(path)
                 return False
             if ex.resp['status'] == '403':
                 # real permission issue
@@ -445,6 +465,7 @@ class GDriveHandler(AbstractProvider):
 
         self.service.files().delete(fileId=folder_id,
                                     supportsAllDrives=True).execute()
+        self._remove_folder(path)
 
     def delete_file(self, path):
         """
@@ -547,9 +568,42 @@ class GDriveHandler(AbstractProvider):
 
         path = self.get_tree().get(dir_path, None)
         if path:
-            return path["id"]
+            folder_id = path["id"]
+            if self._is_cached_folder_valid(dir_path, folder_id):
+                return folder_id
+            self._remove_folder(dir_path)
 
-        return False
+        return self._resolve_folder(dir_path) or False
+
+    def _is_cached_folder_valid(self, path, folder_id):
+        """
+            Check that folder loaded from persistent cache still exists and
+            is not in trash. Each folder is checked once per process.
+        Args:
+            path (string): folder path with / as a separator
+            folder_id (string): cached id of folder
+        Returns:
+            (boolean)
+        """
+        if self._folder_cache.is_verified(path):
+            return True
+
+        try:
+            folder = self.service.files().get(
+                fileId=folder_id,
+                supportsAllDrives=True,
+                fields='id, trashed').execute()
+        except errors.HttpError as ex:
+            if ex.resp['status'] == '404':
+                return False
+            raise
+
+        if folder.get("trashed"):
+            log.debug("Cached folder {} is in trash".format(path))
+            return False
+
+        self._folder_cache.mark_verified(path)
+        return True
 
     def file_path_exists(self, file_path):
         """
@@ -766,6 +820,79 @@ class GDriveHandler(AbstractProvider):
 
         return tree
 
+    def _set_folder(self, path, folder_id):
+        """
+            Store created or found folder to tree and persistent cache.
+        """
+        tree = self.get_tree()
+        self._folder_cache.set(path, folder_id)
+        if tree is not self._folder_cache.folders:
+            tree[path] = {"id": folder_id}
+
+    def _remove_folder(self, path):
+        """
+            Remove folder which doesn't exist anymore (and its subfolders)
+            from tree and persistent cache.
+        """
+        path = path.rstrip('/')
+        self._folder_cache.remove(path)
+        tree = self.get_tree()
+        if tree is not self._folder_cache.folders:
+            prefix = path + '/'
+            for folder_path in list(tree.keys()):
+                if folder_path == path or folder_path.startswith(prefix):
+                    tree.pop(folder_path)
+
+    def _resolve_folder(self, path):
+        """
+            Find folder missing in tree on GDrive, query only levels below
+            closest known parent folder.
+            Found folders are stored in tree.
+        Args:
+            path (string): folder path with / as a separator
+        Returns:
+            (string) folder id or None if folder doesn't exist
+        """
+        tree = self.get_tree()
+        parts = path.rstrip('/').split('/')
+        missing_names = []
+        folder_id = None
+        while parts:
+            parent_path = '/'.join(parts)
+            item = tree.get(parent_path)
+            if item:
+                folder_id = item["id"]
+                break
+            missing_names.insert(0, parts.pop())
+
+        # not under any known root
+        if folder_id is None:
+            return None
+
+        for folder_name in missing_names:
+            escaped_name = folder_name.replace("\\", "\\\\")
+            escaped_name = escaped_name.replace("'", "\\'")
+            q = self._handle_q(
+                "name = '{}' and '{}' in parents and mimeType = '{}'".format(
+                    escaped_name, folder_id, self.FOLDER_STR)
+            )
+            response = self.service.files().list(
+                q=q,
+                corpora="allDrives",
+                includeItemsFromAllDrives=True,
+                supportsAllDrives=True,
+                pageSize=1,
+                fields='files(id)').execute()
+            folders = response.get('files', [])
+            if not folders:
+                return None
+
+            folder_id = folders[0]["id"]
+            parent_path = parent_path + '/' + folder_name
+            self._set_folder(parent_path, folder_id)
+
+        return folder_id
+
     def _get_folder_metadata(self, path):
         """
             Get info about folder with 'path'
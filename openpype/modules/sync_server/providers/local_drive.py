@@ -1,11 +1,16 @@
 from __future__ import print_function
 import os.path
 import shutil
-import threading
-import time
 
 from openpype.api import Logger, Anatomy
 from .abstract_provider import AbstractProvider
+from .chunked_transfer import (
+    get_partial_path,
+    get_resume_offset,
+    copy_chunks,
+    validate_size,
+    TransferProgress
+)
 
 log = Logger().get_logger("SyncServer")
 
@@ -13,6 +18,7 @@ log = Logger().get_logger("SyncServer")
 class LocalDriveHandler(AbstractProvider):
     CODE = 'local_drive'
     LABEL = 'Local drive'
+    CHUNK_SIZE = 8388608  # size of chunks of resumable copy
 
     """ Handles required operations on mounted disks with OS """
     def __init__(self, project_name, site_name, tree=None, presets=None):
@@ -85,17 +91,18 @@ class LocalDriveHandler(AbstractProvider):
                     overwrite=False, direction="Upload"):
         """
             Copies file from 'source_path' to 'target_path'
+
+            File is copied by chunks to partial file, interrupted copy
+            continues from last stored offset (see 'chunked_transfer').
         """
         if not os.path.isfile(source_path):
             raise FileNotFoundError("Source file {} doesn't exist."
                                     .format(source_path))
 
         if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(collection, file, representation, server,
-                                site, source_path, target_path, direction)
+            self._copy(source_path, target_path,
+                       server, collection, file, representation, site,
+                       direction)
         else:
             if os.path.exists(target_path):
                 raise ValueError("File {} exists, set overwrite".
@@ -180,41 +187,45 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
+    def _copy(self, source_path, target_path,
+              server, collection, file, representation, site, direction):
         print("copying {}->{}".format(source_path, target_path))
-        try:
-            shutil.copy(source_path, target_path)
-        except shutil.SameFileError:
+        if (
+            os.path.exists(target_path)
+            and os.path.samefile(source_path, target_path)
+        ):
             print("same files, skipping")
+            return
+
+        source_stat = os.stat(source_path)
+        size = source_stat.st_size
+        mtime = source_stat.st_mtime
+        partial_path = get_partial_path(target_path)
+        partial_size = None
+        if os.path.exists(partial_path):
+            partial_size = os.path.getsize(partial_path)
+        offset = get_resume_offset(file, site, size, mtime, partial_size)
+        if offset:
+            log.debug("Resuming {} of {} from {} bytes".format(
+                direction.lower(), target_path, offset))
+
+        progress = TransferProgress(server, collection, file,
+                                    representation, site, size, mtime,
+                                    direction)
+        with open(source_path, "rb") as source_stream:
+            with open(partial_path, "r+b" if offset else "wb") as stream:
+                stream.truncate(offset)
+                copy_chunks(source_stream, stream, size, offset,
+                            chunk_size=self.CHUNK_SIZE, callback=progress)
+
+        try:
+            validate_size(target_path, size, os.path.getsize(partial_path))
+        except ValueError:
+            os.remove(partial_path)
+            raise
 
-    def _mark_progress(self, collection, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(collection=collection,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+        shutil.copymode(source_path, partial_path)
+        os.replace(partial_path, target_path)
 
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
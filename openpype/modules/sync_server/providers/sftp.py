@@ -1,12 +1,18 @@
 import os
 import os.path
-import time
-import threading
 import platform
 
 from openpype.api import Logger
 from openpype.api import get_system_settings
 from .abstract_provider import AbstractProvider
+from .folder_cache import FolderTreeCache
+from .chunked_transfer import (
+    get_partial_path,
+    get_resume_offset,
+    copy_chunks,
+    validate_size,
+    TransferProgress
+)
 log = Logger().get_logger("SyncServer")
 
 pysftp = None
@@ -33,6 +39,7 @@ class SFTPHandler(AbstractProvider):
     """
     CODE = 'sftp'
     LABEL = 'SFTP'
+    CHUNK_SIZE = 8388608  # size of chunks of resumable copy
 
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
@@ -40,6 +47,10 @@ class SFTPHandler(AbstractProvider):
         self.site_name = site_name
         self.root = None
         self._conn = None
+        # folders can't be checked without listing, don't persist them
+        self._folder_cache = FolderTreeCache.get_cache(
+            self.CODE, project_name, site_name, persistent=False
+        )
 
         self.presets = presets
         if not self.presets:
@@ -217,7 +228,10 @@ class SFTPHandler(AbstractProvider):
         Returns:
             (string) folder id of lowest subfolder from 'path'
         """
-        self.conn.makedirs(path)
+        # folder was already created or found by this process
+        if not self._folder_cache.is_verified(path):
+            self.conn.makedirs(path)
+            self._folder_cache.set(path, path)
 
         return os.path.basename(path)
 
@@ -253,18 +267,51 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(collection, file, representation, server,
-                            site, source_path, target_path, "upload")
+        self._upload(source_path, target_path,
+                     server, collection, file, representation, site)
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
+    def _upload(self, source_path, target_path,
+                server, collection, file, representation, site):
         print("copying {}->{}".format(source_path, target_path))
         conn = self._get_conn()
-        conn.put(source_path, target_path)
+        try:
+            source_stat = os.stat(source_path)
+            size = source_stat.st_size
+            mtime = source_stat.st_mtime
+            partial_path = get_partial_path(target_path)
+            partial_size = None
+            if conn.exists(partial_path):
+                partial_size = conn.stat(partial_path).st_size
+            offset = get_resume_offset(file, site, size, mtime, partial_size)
+            if offset:
+                log.debug("Resuming upload of {} from {} bytes".format(
+                    target_path, offset))
+                conn.truncate(partial_path, offset)
+
+            progress = TransferProgress(server, collection, file,
+                                        representation, site, size, mtime,
+                                        "Upload")
+            mode = "r+" if offset else "w"
+            with open(source_path, "rb") as source_stream:
+                with conn.open(partial_path, mode) as stream:
+                    stream.set_pipelined(True)
+                    copy_chunks(source_stream, stream, size, offset,
+                                chunk_size=self.CHUNK_SIZE, callback=progress)
+
+            try:
+                validate_size(target_path, size,
+                              conn.stat(partial_path).st_size)
+            except ValueError:
+                conn.remove(partial_path)
+                raise
+
+            if conn.exists(target_path):
+                conn.remove(target_path)
+            conn.rename(partial_path, target_path)
+        finally:
+            conn.close()
 
     def download_file(self, source_path, target_path,
                       server, collection, file, representation, site,
@@ -299,18 +346,49 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(collection, file, representation, server,
-                            site, source_path, target_path, "download")
+        self._download(source_path, target_path,
+                       server, collection, file, representation, site)
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
+    def _download(self, source_path, target_path,
+                  server, collection, file, representation, site):
         print("downloading {}->{}".format(source_path, target_path))
         conn = self._get_conn()
-        conn.get(source_path, target_path)
+        try:
+            source_stat = conn.stat(source_path)
+            size = source_stat.st_size
+            mtime = source_stat.st_mtime
+            partial_path = get_partial_path(target_path)
+            partial_size = None
+            if os.path.exists(partial_path):
+                partial_size = os.path.getsize(partial_path)
+            offset = get_resume_offset(file, site, size, mtime, partial_size)
+            if offset:
+                log.debug("Resuming download of {} from {} bytes".format(
+                    target_path, offset))
+
+            progress = TransferProgress(server, collection, file,
+                                        representation, site, size, mtime,
+                                        "Download")
+            with conn.open(source_path, "r") as source_stream:
+                if not offset:
+                    source_stream.prefetch(size)
+                with open(partial_path, "r+b" if offset else "wb") as stream:
+                    stream.truncate(offset)
+                    copy_chunks(source_stream, stream, size, offset,
+                                chunk_size=self.CHUNK_SIZE, callback=progress)
+
+            try:
+                validate_size(target_path, size,
+                              os.path.getsize(partial_path))
+            except ValueError:
+                os.remove(partial_path)
+                raise
+
+            os.replace(partial_path, target_path)
+        finally:
+            conn.close()
 
     def delete_file(self, path):
         """
@@ -424,40 +502,3 @@ class SFTPHandler(AbstractProvider):
         except (paramiko.ssh_exception.SSHException,
                 pysftp.exceptions.ConnectionException):
             log.warning("Couldn't connect", exc_info=True)
-
-    def _mark_progress(self, collection, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(collection=collection,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
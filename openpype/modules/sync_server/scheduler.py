@@ -0,0 +1,243 @@
+"""Python 3 only implementation."""
+import time
+import asyncio
+import itertools
+import collections
+import contextlib
+
+from openpype.lib import PypeLogger
+
+log = PypeLogger().get_logger("SyncServer")
+
+# bandwidth limits are stored in MB/s in settings
+_MEGABYTE = 1024 * 1024
+
+
+class TransferLimit(object):
+    """Parallelism and bandwidth limit of a site or a provider.
+
+    Bandwidth is limited by pacing of transfer starts. Each started transfer
+    reserves time needed to transfer its size with 'max_bandwidth' and next
+    transfer can't start sooner, so average throughput doesn't exceed the
+    limit. Throughput of single transfer is not throttled.
+
+    Args:
+        name (str): Name of site or provider.
+        max_parallel (int): Maximum of running transfers, 0 is unlimited.
+        max_bandwidth (float): Maximum of bytes per second, 0 is unlimited.
+    """
+    # time window of throughput statistics in seconds
+    stats_window = 60
+
+    def __init__(self, name, max_parallel=0, max_bandwidth=0):
+        self.name = name
+        self.max_parallel = max_parallel
+        self.max_bandwidth = max_bandwidth
+
+        self.active = 0
+        self.queued = 0
+        self.transferred = 0
+        self._next_start = 0
+        self._finished = collections.deque()
+
+    def get_delay(self, now):
+        """Seconds until new transfer can start, None if no slot is free."""
+        if self.max_parallel and self.active >= self.max_parallel:
+            return None
+        return max(0, self._next_start - now)
+
+    def reserve(self, size, now):
+        self.active += 1
+        if self.max_bandwidth and size:
+            self._next_start = (
+                max(now, self._next_start) + float(size) / self.max_bandwidth
+            )
+
+    def release(self, size, success):
+        self.active -= 1
+        if success and size:
+            self.transferred += size
+            self._finished.append((time.time(), size))
+
+    def get_throughput(self):
+        """Average bytes per second of transfers finished in stats window."""
+        limit_time = time.time() - self.stats_window
+        while self._finished and self._finished[0][0] < limit_time:
+            self._finished.popleft()
+        return float(
+            sum(size for _, size in self._finished)
+        ) / self.stats_window
+
+    def get_stats(self):
+        return {
+            "queued": self.queued,
+            "active": self.active,
+            "transferred": self.transferred,
+            "bytes_per_sec": self.get_throughput(),
+            "max_parallel": self.max_parallel,
+            "max_bandwidth": self.max_bandwidth
+        }
+
+
+class TransferScheduler(object):
+    """Schedules transfers of files by limits of sites and providers.
+
+    Waiting transfers are started by 'priority' (higher first) and by order
+    of request. Transfer starts only when both its site and its provider
+    have free slot and bandwidth budget. Must be used from the asyncio loop
+    of 'SyncServerThread'.
+
+    Limits are taken from system settings of sync server:
+        "site_limits": {"gdrive": {"max_parallel": 2, "max_bandwidth": 5}}
+        "provider_limits": {"sftp": {"max_parallel": 4, "max_bandwidth": 0}}
+    'max_bandwidth' is in MB/s, 0 means unlimited.
+
+    Args:
+        site_limits (dict): Limits by site name.
+        provider_limits (dict): Limits by provider code.
+    """
+
+    def __init__(self, site_limits=None, provider_limits=None):
+        self._site_limits = {}
+        self._provider_limits = {}
+        self._waiting = []
+        self._counter = itertools.count()
+        self._dispatch_handle = None
+        self.set_limits(site_limits, provider_limits)
+
+    def set_limits(self, site_limits=None, provider_limits=None):
+        """Change limits, running and waiting transfers are kept."""
+        for limits, settings in (
+            (self._site_limits, site_limits),
+            (self._provider_limits, provider_limits)
+        ):
+            settings = settings or {}
+            for name, limit in limits.items():
+                if name not in settings:
+                    limit.max_parallel = 0
+                    limit.max_bandwidth = 0
+
+            for name, values in settings.items():
+                limit = self._get_limit(limits, name)
+                limit.max_parallel = int(values.get("max_parallel") or 0)
+                limit.max_bandwidth = (
+                    float(values.get("max_bandwidth") or 0) * _MEGABYTE
+                )
+        self._dispatch()
+
+    @contextlib.asynccontextmanager
+    async def transfer(self, site_name, provider_name, size=0, priority=0):
+        """Wait for free slot of site and provider, hold it in context.
+
+        Args:
+            site_name (str): Remote site of transfer.
+            provider_name (str): Provider of remote site.
+            size (int): Size of transferred file in bytes.
+            priority (int): Priority of transfer, higher starts sooner.
+        """
+        site_limit = self._get_limit(self._site_limits, site_name)
+        provider_limit = self._get_limit(
+            self._provider_limits, provider_name
+        )
+        size = size or 0
+        future = asyncio.get_running_loop().create_future()
+        item = (
+            -(priority or 0), next(self._counter),
+            future, site_limit, provider_limit, size
+        )
+        self._waiting.append(item)
+        site_limit.queued += 1
+        provider_limit.queued += 1
+        self._dispatch()
+        try:
+            await future
+        except BaseException:
+            if item in self._waiting:
+                self._waiting.remove(item)
+                site_limit.queued -= 1
+                provider_limit.queued -= 1
+            elif future.done() and not future.cancelled():
+                # slot was reserved already
+                self._release(site_limit, provider_limit, size, False)
+            raise
+
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self._release(site_limit, provider_limit, size, success)
+
+    def get_stats(self):
+        """Queue depth and throughput of sites and providers.
+
+        Returns:
+            (dict): {"queued": 1, "active": 3,
+                     "sites": {..}, "providers": {..}}
+        """
+        return {
+            "queued": len(self._waiting),
+            "active": sum(
+                limit.active for limit in tuple(self._site_limits.values())
+            ),
+            "sites": {
+                name: limit.get_stats()
+                for name, limit in tuple(self._site_limits.items())
+            },
+            "providers": {
+                name: limit.get_stats()
+                for name, limit in tuple(self._provider_limits.items())
+            }
+        }
+
+    def _get_limit(self, limits, name):
+        limit = limits.get(name)
+        if limit is None:
+            limit = TransferLimit(name)
+            limits[name] = limit
+        return limit
+
+    def _release(self, site_limit, provider_limit, size, success):
+        site_limit.release(size, success)
+        provider_limit.release(size, success)
+        self._dispatch()
+
+    def _dispatch(self):
+        """Start waiting transfers which fit to limits."""
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+
+        if not self._waiting:
+            return
+
+        now = time.time()
+        min_delay = None
+        self._waiting.sort(key=lambda item: item[:2])
+        for item in tuple(self._waiting):
+            future, site_limit, provider_limit, size = item[2:]
+            if future.done():
+                continue
+
+            site_delay = site_limit.get_delay(now)
+            provider_delay = provider_limit.get_delay(now)
+            if site_delay is None or provider_delay is None:
+                continue
+
+            delay = max(site_delay, provider_delay)
+            if delay > 0:
+                if min_delay is None or delay < min_delay:
+                    min_delay = delay
+                continue
+
+            self._waiting.remove(item)
+            site_limit.queued -= 1
+            provider_limit.queued -= 1
+            site_limit.reserve(size, now)
+            provider_limit.reserve(size, now)
+            future.set_result(True)
+
+        if min_delay is not None:
+            self._dispatch_handle = asyncio.get_event_loop().call_later(
+                min_delay, self._dispatch
+            )
@@ -7,15 +7,20 @@ from concurrent.futures._base import CancelledError
 
 from .providers import lib
 from openpype.lib import PypeLogger
+from openpype.lib.file_hash import (
+    get_content_hash_from_source_hash,
+    validate_file_content
+)
 
 from .utils import SyncStatus, ResumableError
+from .scheduler import TransferScheduler
 
 
 log = PypeLogger().get_logger("SyncServer")
 
 
 async def upload(module, collection, file, representation, provider_name,
-                 remote_site_name, tree=None, preset=None):
+                 remote_site_name, tree=None, preset=None, scheduler=None):
     """
         Upload single 'file' of a 'representation' to 'provider'.
         Source url is taken from 'file' portion, where {root} placeholder
@@ -39,8 +44,21 @@ async def upload(module, collection, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        scheduler (TransferScheduler): limits parallel transfers of site
 
     """
+    if scheduler is None:
+        scheduler = TransferScheduler()
+
+    async with scheduler.transfer(remote_site_name, provider_name,
+                                  file.get("size"),
+                                  representation.get("priority")):
+        return await _upload(module, collection, file, representation,
+                             provider_name, remote_site_name, tree, preset)
+
+
+async def _upload(module, collection, file, representation, provider_name,
+                  remote_site_name, tree, preset):
     # create ids sequentially, upload file in parallel later
     with module.lock:
         # this part modifies structure on 'remote_site', only single
@@ -88,7 +106,7 @@ async def upload(module, collection, file, representation, provider_name,
 
 
 async def download(module, collection, file, representation, provider_name,
-                   remote_site_name, tree=None, preset=None):
+                   remote_site_name, tree=None, preset=None, scheduler=None):
     """
         Downloads file to local folder denoted in representation.Context.
 
@@ -102,10 +120,23 @@ async def download(module, collection, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        scheduler (TransferScheduler): limits parallel transfers of site
 
         Returns:
         (string) - 'name' of local file
     """
+    if scheduler is None:
+        scheduler = TransferScheduler()
+
+    async with scheduler.transfer(remote_site_name, provider_name,
+                                  file.get("size"),
+                                  representation.get("priority")):
+        return await _download(module, collection, file, representation,
+                               provider_name, remote_site_name, tree, preset)
+
+
+async def _download(module, collection, file, representation, provider_name,
+                    remote_site_name, tree, preset):
     with module.lock:
         remote_handler = lib.factory.get_provider(provider_name,
                                                   collection,
@@ -136,6 +167,17 @@ async def download(module, collection, file, representation, provider_name,
                                          True
                                          )
 
+    # validate content of downloaded file if content hash is known
+    file_hash = file.get("hash")
+    if get_content_hash_from_source_hash(file_hash):
+        is_valid = await loop.run_in_executor(None,
+                                              validate_file_content,
+                                              local_file_path,
+                                              file_hash)
+        if is_valid is False:
+            raise ValueError("Content of downloaded file {} doesn't match "
+                             "published hash".format(local_file_path))
+
     module.handle_alternate_site(collection, representation, local_site,
                                  file["_id"], file_id)
 
@@ -240,7 +282,16 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+
+        system_settings = module.sync_system_settings or {}
+        max_workers = int(system_settings.get("max_parallel_transfers") or 3)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        )
+        self.scheduler = TransferScheduler(
+            system_settings.get("site_limits"),
+            system_settings.get("provider_limits")
+        )
         self.timer = None
 
     def run(self):
@@ -295,7 +346,8 @@ class SyncServerThread(threading.Thread):
                     sync_repres = self.module.get_sync_representations(
                         collection,
                         local_site,
-                        remote_site
+                        remote_site,
+                        incremental=preset["config"].get("incremental_scan")
                     )
 
                     task_files_to_process = []
@@ -348,7 +400,8 @@ class SyncServerThread(threading.Thread):
                                                remote_provider,
                                                remote_site,
                                                tree,
-                                               site_preset))
+                                               site_preset,
+                                               self.scheduler))
                                     task_files_to_process.append(task)
                                     # store info for exception handlingy
                                     files_processed_info.append((file,
@@ -368,7 +421,8 @@ class SyncServerThread(threading.Thread):
                                                  remote_provider,
                                                  remote_site,
                                                  tree,
-                                                 site_preset))
+                                                 site_preset,
+                                                 self.scheduler))
                                     task_files_to_process.append(task)
 
                                     files_processed_info.append((file,
@@ -380,6 +434,8 @@ class SyncServerThread(threading.Thread):
 
                     log.debug("Sync tasks count {}".
                               format(len(task_files_to_process)))
+                    log.debug("Transfers {}".format(
+                        self.scheduler.get_stats()))
                     files_created = await asyncio.gather(
                         *task_files_to_process,
                         return_exceptions=True)
@@ -396,6 +452,8 @@ class SyncServerThread(threading.Thread):
                                               representation,
                                               site,
                                               error)
+                    # write queued updates of this project at once
+                    self.module.flush_db_updates()
 
                 duration = time.time() - start_time
                 log.debug("One loop took {:.2f}s".format(duration))
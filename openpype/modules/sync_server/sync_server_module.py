@@ -17,6 +17,7 @@ from openpype.api import (
     get_local_site_id)
 from openpype.lib import PypeLogger
 from openpype.settings.lib import (
+    get_projects_settings,
     get_default_anatomy_settings,
     get_anatomy_settings)
 
@@ -24,6 +25,8 @@ from .providers.local_drive import LocalDriveHandler
 from .providers import lib
 
 from .utils import time_function, SyncStatus
+from .change_tracker import RepresentationChangeTracker
+from .update_queue import SiteUpdateQueue
 
 
 log = PypeLogger().get_logger("SyncServer")
@@ -119,8 +122,11 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         self._paused_projects = set()
         self._paused_representations = set()
         self._anatomies = {}
+        # trackers of changed representations for incremental scan
+        self._change_trackers = {}
 
         self._connection = None
+        self._update_queue = None
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
@@ -960,6 +966,32 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         return self._connection
 
+    @property
+    def update_queue(self):
+        """Queue of site updates written to DB in batches."""
+        if self._update_queue is None:
+            self._update_queue = SiteUpdateQueue(
+                lambda collection: self.connection.database[collection]
+            )
+        return self._update_queue
+
+    def flush_db_updates(self):
+        """Write all queued site updates to DB."""
+        if self._update_queue is not None:
+            self._update_queue.flush()
+
+    def get_transfer_stats(self):
+        """
+            Returns queue depth and throughput of transfers by remote site
+            and by provider (see 'TransferScheduler.get_stats').
+
+            Returns:
+                (dict): empty if server is not running
+        """
+        if not self.sync_server_thread:
+            return {}
+        return self.sync_server_thread.scheduler.get_stats()
+
     @property
     def sync_system_settings(self):
         if self._sync_system_settings is None:
@@ -994,12 +1026,18 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             projection={"name": 1},
             only_active=True
         )
-        for project_doc in project_docs:
-            project_name = project_doc["name"]
+        project_names = [project_doc["name"] for project_doc in project_docs]
+        # Use read-only settings and copy only sync server settings
+        settings_by_project = get_projects_settings(
+            project_names, exclude_locals=exclude_locals, readonly=True
+        )
+        for project_name in project_names:
             sites = copy.deepcopy(system_sites)  # get all configured sites
-            proj_settings = self._parse_sync_settings_from_settings(
-                get_project_settings(project_name,
-                                     exclude_locals=exclude_locals))
+            proj_settings = copy.deepcopy(
+                self._parse_sync_settings_from_settings(
+                    settings_by_project[project_name]
+                )
+            )
             sites.update(self._get_default_site_configs(
                 proj_settings["enabled"], project_name))
             sites.update(proj_settings['sites'])
@@ -1117,8 +1155,29 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         return sites.get(site, 'N/A')
 
+    def _get_change_tracker(self, collection, active_site, remote_site):
+        """Tracker of changed representations for incremental scan.
+
+        Tracker is recreated when sites of project change.
+        """
+        config = self.sync_project_settings[collection]["config"]
+        full_scan_interval = int(config.get("full_scan_interval") or 0)
+        key = (active_site, remote_site, full_scan_interval)
+        tracker_key, tracker = self._change_trackers.get(
+            collection, (None, None))
+        if tracker is None or tracker_key != key:
+            tracker = RepresentationChangeTracker(full_scan_interval)
+            self._change_trackers[collection] = (key, tracker)
+        return tracker
+
+    def _mark_representation_changed(self, collection, representation_id):
+        _, tracker = self._change_trackers.get(collection, (None, None))
+        if tracker is not None:
+            tracker.mark_changed(representation_id)
+
     @time_function
-    def get_sync_representations(self, collection, active_site, remote_site):
+    def get_sync_representations(self, collection, active_site, remote_site,
+                                 incremental=False):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1135,6 +1194,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            incremental (bool): examine only representations which may have
+                changed since last call (see 'RepresentationChangeTracker')
 
         Returns:
             (list) of dictionaries
@@ -1182,6 +1243,15 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             ]
         }
 
+        tracker = None
+        if incremental:
+            tracker = self._get_change_tracker(collection, active_site,
+                                               remote_site)
+            changes_filter = tracker.get_filter(
+                self.connection.database[collection])
+            if changes_filter is not None:
+                match = {"$and": [changes_filter, match]}
+
         aggr = [
             {"$match": match},
             {'$unwind': '$files'},
@@ -1222,6 +1292,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                                                            remote_site))
         log.debug("query: {}".format(aggr))
         representations = self.connection.aggregate(aggr)
+        if tracker is not None:
+            representations = list(representations)
+            tracker.set_pending(repre["_id"] for repre in representations)
 
         return representations
 
@@ -1280,11 +1353,17 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         return SyncStatus.DO_NOTHING
 
     def update_db(self, collection, new_file_id, file, representation,
-                  site, error=None, progress=None, priority=None):
+                  site, error=None, progress=None, priority=None,
+                  resume=None):
         """
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
 
+            Updates are queued and written in batches, progress updates are
+            debounced per file (see 'SiteUpdateQueue'). Priority updates are
+            written immediately. Use 'flush_db_updates' to write queued
+            updates.
+
         Args:
             collection (string): name of project - force to db connection as
               each file might come from different collection
@@ -1295,6 +1374,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             error (string): exception message
             progress (float): 0-1 of progress of upload/download
             priority (int): 0-100 set priority
+            resume (dict): {"offset": bytes, "size": bytes, "mtime": seconds}
+                of interrupted transfer, stored with progress, removed on
+                success
 
         Returns:
             None
@@ -1313,8 +1395,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             update["$set"] = self._get_success_dict(new_file_id)
             # reset previous errors if any
             update["$unset"] = self._get_error_dict("", "", "")
+            update["$unset"]["files.$[f].sites.$[s].resume"] = ""
         elif progress is not None:
-            update["$set"] = self._get_progress_dict(progress)
+            update["$set"] = self._get_progress_dict(progress, resume)
         elif priority is not None:
             update["$set"] = self._get_priority_dict(priority, file_id)
         else:
@@ -1329,12 +1412,16 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[collection].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
+        file_key = None
+        if file_id:
+            file_key = (representation_id, file_id, site)
+
+        self.update_queue.add(collection, query, update, arr_filter,
+                              file_key=file_key,
+                              progress=progress is not None)
+
+        if priority is not None:
+            self.flush_db_updates()
 
         if progress is not None or priority is not None:
             return
@@ -1436,6 +1523,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         local_site = self.get_active_site(collection)
         remote_site = self.get_remote_site(collection)
 
+        self._mark_representation_changed(collection, representation_id)
+
         if side:
             if side == 'local':
                 site_name = local_site
@@ -1464,6 +1553,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
             Used for refactoring ugly reset_provider_for_file
         """
+        # queued updates must not overwrite this change later
+        self.flush_db_updates()
         self.connection.database[collection].update_one(
             query,
             update,
@@ -1757,16 +1848,20 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         _, rec = self._get_site_rec(file.get("sites", []), provider)
         return rec.get("tries", 0)
 
-    def _get_progress_dict(self, progress):
+    def _get_progress_dict(self, progress, resume=None):
         """
             Provide progress metadata to be stored in Db.
             Used during upload/download for GUI to show.
         Args:
             progress: (float) - 0-1 progress of upload/download
+            resume: (dict) - offset, size and mtime of source of chunked
+                transfer
         Returns:
             (dictionary)
         """
         val = {"files.$[f].sites.$[s].progress": progress}
+        if resume is not None:
+            val["files.$[f].sites.$[s].resume"] = resume
         return val
 
     def _get_priority_dict(self, priority, file_id):
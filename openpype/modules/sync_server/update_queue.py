@@ -0,0 +1,183 @@
+import time
+import threading
+import collections
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from openpype.lib import PypeLogger
+
+log = PypeLogger().get_logger("SyncServer")
+
+
+class SiteUpdateQueue(object):
+    """Collects updates of site records and writes them in batches.
+
+    Updates are written with one 'bulk_write' per project when 'flush' is
+    called, when there are 'max_batch_size' pending updates or when the
+    oldest pending update is older than 'flush_interval' seconds.
+
+    Progress updates are debounced per file. Only last progress of a file
+    is written and pending progress is dropped when final (success or
+    error) update of the file is added.
+
+    Updates which failed to be written because of connection error are
+    queued again. Update rejected by database is logged and dropped.
+
+    Args:
+        get_collection (callable): Returns collection of project by name.
+        flush_interval (float): Maximum age of pending update in seconds.
+        max_batch_size (int): Maximum number of pending updates.
+    """
+
+    def __init__(self, get_collection, flush_interval=2.0,
+                 max_batch_size=500):
+        self._get_collection = get_collection
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+
+        self._lock = threading.Lock()
+        # Serializes writes so updates are written in order
+        self._flush_lock = threading.Lock()
+        self._pending = collections.OrderedDict()
+        # Progress keys of files with final update added during write
+        self._finalized_keys = set()
+        self._oldest_time = None
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, collection, query, update, array_filters,
+            file_key=None, progress=False):
+        """Add update of site record.
+
+        Args:
+            collection (str): Name of project collection.
+            query (dict): Filter of updated document.
+            update (dict): Update operations.
+            array_filters (list): Array filters of update.
+            file_key (Hashable): Key of updated file and site used for
+                debouncing of progress updates.
+            progress (bool): Update is progress update.
+        """
+        with self._lock:
+            progress_key = None
+            if file_key is not None:
+                progress_key = ("progress", collection, file_key)
+
+            if progress and progress_key is not None:
+                key = progress_key
+            else:
+                # Final update makes pending progress obsolete
+                if progress_key is not None:
+                    self._pending.pop(progress_key, None)
+                    self._finalized_keys.add(progress_key)
+                self._counter += 1
+                key = ("update", self._counter)
+
+            # Progress replaces previous pending progress of the file
+            #   on the same position
+            self._pending[key] = (collection, query, update, array_filters)
+            if self._oldest_time is None:
+                self._oldest_time = time.time()
+
+            should_flush = (
+                len(self._pending) >= self.max_batch_size
+                or time.time() - self._oldest_time >= self.flush_interval
+            )
+
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """Write all pending updates to database.
+
+        Database is not accessed under lock of pending updates, so threads
+        adding updates are not blocked by the write. Updates which failed
+        to be written are queued again before newer updates.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                pending = list(self._pending.items())
+                self._pending = collections.OrderedDict()
+                self._finalized_keys = set()
+                self._oldest_time = None
+
+            items_by_collection = collections.OrderedDict()
+            for item in pending:
+                collection = item[1][0]
+                items_by_collection.setdefault(collection, []).append(item)
+
+            failed_items = []
+            for collection, items in items_by_collection.items():
+                failed_items.extend(self._write(collection, items))
+
+            if failed_items:
+                self._requeue(failed_items)
+
+    def _write(self, collection, items):
+        """Write updates to collection.
+
+        Returns:
+            list: Items which were not written and should be written again.
+        """
+        requests = [
+            UpdateOne(
+                query,
+                update,
+                upsert=True,
+                array_filters=array_filters or None
+            )
+            for _, (_, query, update, array_filters) in items
+        ]
+        log.debug("Writing {} update/s to {}".format(
+            len(requests), collection
+        ))
+        try:
+            self._get_collection(collection).bulk_write(
+                requests, ordered=True
+            )
+
+        except BulkWriteError as exc:
+            # Ordered write stops on first failed update, updates before
+            #   it are written and the failed update would fail again
+            write_errors = exc.details.get("writeErrors") or []
+            if not write_errors:
+                return items
+            failed_idx = write_errors[0]["index"]
+            log.error(
+                "Failed to write site update to {}: {}".format(
+                    collection, write_errors[0].get("errmsg")
+                )
+            )
+            return items[failed_idx + 1:]
+
+        except PyMongoError:
+            log.warning(
+                "Failed to write {} site update/s to {}. Will retry.".format(
+                    len(items), collection
+                ),
+                exc_info=True
+            )
+            return items
+        return []
+
+    def _requeue(self, items):
+        """Put not written items before pending updates.
+
+        Progress is not queued again if newer progress or final update of
+        the file was added in the meantime.
+        """
+        with self._lock:
+            pending = collections.OrderedDict()
+            for key, value in items:
+                if key in self._pending or key in self._finalized_keys:
+                    continue
+                pending[key] = value
+            pending.update(self._pending)
+            self._pending = pending
+            if self._pending and self._oldest_time is None:
+                self._oldest_time = time.time()
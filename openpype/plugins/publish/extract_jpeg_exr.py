@@ -8,7 +8,7 @@ from openpype.lib import (
     path_to_subprocess_arg,
 
     get_transcode_temp_directory,
-    convert_for_ffmpeg,
+    convert_files_for_ffmpeg,
     should_convert_for_ffmpeg
 )
 
@@ -44,6 +44,33 @@ class ExtractJpegEXR(pyblish.api.InstancePlugin):
             return
 
         filtered_repres = self._get_filtered_repres(instance)
+        repre_inputs = self._prepare_inputs(filtered_repres)
+        convert_dirs = [
+            convert_dir
+            for _, _, _, convert_dir in repre_inputs
+            if convert_dir is not None
+        ]
+        try:
+            self._process_inputs(instance, repre_inputs)
+        finally:
+            # Cleanup temp folders
+            for convert_dir in convert_dirs:
+                if os.path.exists(convert_dir):
+                    shutil.rmtree(convert_dir)
+
+    def _prepare_inputs(self, filtered_repres):
+        """Find input file of representations and convert it if needed.
+
+        Inputs of all representations which require conversion for ffmpeg
+        are converted in one batch of parallel processes.
+
+        Returns:
+            list: Tuples with representation, input filename, path to input
+                for ffmpeg and directory of converted input (or None).
+        """
+        repre_inputs = []
+        convert_paths = []
+        convert_dirs = []
         for repre in filtered_repres:
             repre_files = repre["files"]
             if not isinstance(repre_files, (list, tuple)):
@@ -74,15 +101,29 @@ class ExtractJpegEXR(pyblish.api.InstancePlugin):
             if do_convert:
                 convert_dir = get_transcode_temp_directory()
                 filename = os.path.basename(full_input_path)
-                convert_for_ffmpeg(
-                    full_input_path,
-                    convert_dir,
-                    None,
-                    None,
-                    self.log
-                )
+                convert_paths.append(full_input_path)
+                convert_dirs.append(convert_dir)
                 full_input_path = os.path.join(convert_dir, filename)
 
+            repre_inputs.append(
+                (repre, input_file, full_input_path, convert_dir)
+            )
+
+        if convert_paths:
+            try:
+                convert_files_for_ffmpeg(
+                    convert_paths, convert_dirs, logger=self.log
+                )
+            except Exception:
+                for convert_dir in convert_dirs:
+                    shutil.rmtree(convert_dir)
+                raise
+        return repre_inputs
+
+    def _process_inputs(self, instance, repre_inputs):
+        for repre, input_file, full_input_path, _ in repre_inputs:
+            stagingdir = os.path.normpath(repre["stagingDir"])
+
             filename = os.path.splitext(input_file)[0]
             if not filename.endswith('.'):
                 filename += "."
@@ -144,10 +185,6 @@ class ExtractJpegEXR(pyblish.api.InstancePlugin):
             self.log.debug("Adding: {}".format(new_repre))
             instance.data["representations"].append(new_repre)
 
-            # Cleanup temp folder
-            if convert_dir is not None and os.path.exists(convert_dir):
-                shutil.rmtree(convert_dir)
-
     def _get_filtered_repres(self, instance):
         filtered_repres = []
         src_repres = instance.data.get("representations") or []
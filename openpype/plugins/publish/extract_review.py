@@ -3,6 +3,7 @@ import re
 import copy
 import json
 import shutil
+import fractions
 
 from abc import ABCMeta, abstractmethod
 import six
@@ -20,7 +21,15 @@ from openpype.lib import (
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
     get_transcode_temp_directory,
-    get_transcode_temp_directory
+    get_transcode_temp_directory,
+
+    get_burnin_profile,
+    filter_burnin_defs,
+    get_repre_burnin_defs,
+    prepare_basic_burnin_data,
+    prepare_repre_burnin_data,
+    fill_burnin_data,
+    get_burnin_filters
 )
 import speedcopy
 
@@ -34,6 +43,13 @@ class ExtractReview(pyblish.api.InstancePlugin):
     All new representations are created and encoded by ffmpeg following
     presets found in OpenPype Settings interface at
     `project_settings/global/publish/ExtractReview/profiles:outputs`.
+
+    With `combine_burnins` enabled are burnins of output, which has exactly
+    one matching burnin definition of ExtractBurnin, applied during encoding
+    of the output so ExtractBurnin does not have to encode it again.
+
+    With `shared_decode` enabled are outputs of representation with same
+    input arguments encoded by one ffmpeg process, input is decoded once.
     """
 
     label = "Extract Review"
@@ -67,6 +83,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    combine_burnins = False
+    # Hosts where burnins are not processed by ExtractBurnin
+    no_burnin_hosts = ["resolve"]
+    shared_decode = False
+    # Count of parallel processes converting sequences for ffmpeg
+    convert_workers = 0
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -188,6 +210,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
         outputs_per_repres = self._get_outputs_per_representations(
             instance, profile_outputs
         )
+        burnins_prep = None
+        if self.combine_burnins and outputs_per_repres:
+            burnins_prep = self.prepare_burnins(instance)
+
         fill_data = copy.deepcopy(instance.data["anatomyData"])
         for repre, outputs in outputs_per_repres:
             # Check if input should be preconverted before processing
@@ -228,96 +254,50 @@ class ExtractReview(pyblish.api.InstancePlugin):
             #   - change staging dir of source representation
             #   - must be set back after output definitions processing
             if do_convert:
-                new_staging_dir = get_transcode_temp_directory()
-                repre["stagingDir"] = new_staging_dir
-
-                frame_start = instance.data["frameStart"]
-                frame_end = instance.data["frameEnd"]
-                convert_for_ffmpeg(
-                    first_input_path,
-                    new_staging_dir,
-                    frame_start,
-                    frame_end,
-                    self.log
+                self.convert_repre_for_ffmpeg(repre, first_input_path)
+
+            # Fill gaps in sequence once for all output definitions
+            #   - converted sequence has gaps of source so gaps are filled
+            #       in staging dir of converted files
+            files_to_clean = []
+            if self.input_is_sequence(repre):
+                self.log.info("Filling gaps in sequence.")
+                files_to_clean = self.fill_sequence_gaps(
+                    repre["files"],
+                    repre["stagingDir"],
+                    instance.data["frameStart"],
+                    instance.data["frameEnd"]
                 )
 
-            for _output_def in outputs:
-                output_def = copy.deepcopy(_output_def)
-                # Make sure output definition has "tags" key
-                if "tags" not in output_def:
-                    output_def["tags"] = []
-
-                if "burnins" not in output_def:
-                    output_def["burnins"] = []
-
-                # Create copy of representation
-                new_repre = copy.deepcopy(repre)
-                # Make sure new representation has origin staging dir
-                #   - this is because source representation may change
-                #       it's staging dir because of ffmpeg conversion
-                new_repre["stagingDir"] = src_repre_staging_dir
-
-                # Remove "delete" tag from new repre if there is
-                if "delete" in new_repre["tags"]:
-                    new_repre["tags"].remove("delete")
-
-                # Add additional tags from output definition to representation
-                for tag in output_def["tags"]:
-                    if tag not in new_repre["tags"]:
-                        new_repre["tags"].append(tag)
-
-                # Add burnin link from output definition to representation
-                for burnin in output_def["burnins"]:
-                    if burnin not in new_repre.get("burnins", []):
-                        if not new_repre.get("burnins"):
-                            new_repre["burnins"] = []
-                        new_repre["burnins"].append(str(burnin))
-
-                self.log.debug(
-                    "Linked burnins: `{}`".format(new_repre.get("burnins"))
-                )
-
-                self.log.debug(
-                    "New representation tags: `{}`".format(
-                        new_repre.get("tags"))
-                )
-
-                temp_data = self.prepare_temp_data(
-                    instance, repre, output_def)
-                files_to_clean = []
-                if temp_data["input_is_sequence"]:
-                    self.log.info("Filling gaps in sequence.")
-                    files_to_clean = self.fill_sequence_gaps(
-                        temp_data["origin_repre"]["files"],
-                        new_repre["stagingDir"],
-                        temp_data["frame_start"],
-                        temp_data["frame_end"])
-
-                # create or update outputName
-                output_name = new_repre.get("outputName", "")
-                output_ext = new_repre["ext"]
-                if output_name:
-                    output_name += "_"
-                output_name += output_def["filename_suffix"]
-                if temp_data["without_handles"]:
-                    output_name += "_noHandles"
-
-                # add outputName to anatomy format fill_data
-                fill_data.update({
-                    "output": output_name,
-                    "ext": output_ext
-                })
-
+            output_items = []
+            for output_def in outputs:
                 try:  # temporary until oiiotool is supported cross platform
-                    ffmpeg_args = self._ffmpeg_arguments(
-                        output_def, instance, new_repre, temp_data, fill_data
+                    output_item = self.prepare_output_item(
+                        instance,
+                        repre,
+                        output_def,
+                        src_repre_staging_dir,
+                        burnins_prep,
+                        fill_data
                     )
                 except ZeroDivisionError:
-                    if 'exr' in temp_data["origin_repre"]["ext"]:
+                    if 'exr' in repre["ext"]:
                         self.log.debug("Unsupported compression on input " +
                                        "files. Skipping!!!")
                         return
                     raise NotImplementedError
+                output_items.append(output_item)
+
+            for items in self.group_output_items(output_items):
+                if len(items) == 1:
+                    ffmpeg_args = self.ffmpeg_full_args(
+                        **items[0]["ffmpeg_args_parts"]
+                    )
+                else:
+                    self.log.info((
+                        "Encoding {} outputs with shared input."
+                    ).format(len(items)))
+                    ffmpeg_args = self.ffmpeg_shared_input_args(items)
 
                 subprcs_cmd = " ".join(ffmpeg_args)
 
@@ -327,32 +307,16 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 openpype.api.run_subprocess(
                     subprcs_cmd, shell=True, logger=self.log
                 )
+                for item in items:
+                    item["ffmpeg_cmd"] = subprcs_cmd
 
-                # delete files added to fill gaps
-                if files_to_clean:
-                    for f in files_to_clean:
-                        os.unlink(f)
-
-                new_repre.update({
-                    "name": "{}_{}".format(output_name, output_ext),
-                    "outputName": output_name,
-                    "outputDef": output_def,
-                    "frameStartFtrack": temp_data["output_frame_start"],
-                    "frameEndFtrack": temp_data["output_frame_end"],
-                    "ffmpeg_cmd": subprcs_cmd
-                })
-
-                # Force to pop these key if are in new repre
-                new_repre.pop("preview", None)
-                new_repre.pop("thumbnail", None)
-                if "clean_name" in new_repre.get("tags", []):
-                    new_repre.pop("outputName")
-
-                # adding representation
-                self.log.debug(
-                    "Adding new representation: {}".format(new_repre)
-                )
-                instance.data["representations"].append(new_repre)
+            # delete files added to fill gaps
+            if files_to_clean:
+                for f in files_to_clean:
+                    os.unlink(f)
+
+            for output_item in output_items:
+                self.add_output_representation(instance, output_item)
 
             # Cleanup temp staging dir after procesisng of output definitions
             if do_convert:
@@ -362,6 +326,153 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 #   value
                 repre["stagingDir"] = src_repre_staging_dir
 
+    def prepare_output_item(
+        self,
+        instance,
+        repre,
+        output_def,
+        src_repre_staging_dir,
+        burnins_prep,
+        fill_data
+    ):
+        """Prepare new representation and ffmpeg arguments of output.
+
+        Returns:
+            dict: Output definition, output name and extension, new
+                representation, temp data and parts of ffmpeg arguments.
+        """
+        output_def = copy.deepcopy(output_def)
+        # Make sure output definition has "tags" key
+        if "tags" not in output_def:
+            output_def["tags"] = []
+
+        if "burnins" not in output_def:
+            output_def["burnins"] = []
+
+        # Create copy of representation
+        new_repre = copy.deepcopy(repre)
+        # Make sure new representation has origin staging dir
+        #   - this is because source representation may change
+        #       it's staging dir because of ffmpeg conversion
+        new_repre["stagingDir"] = src_repre_staging_dir
+
+        # Remove "delete" tag from new repre if there is
+        if "delete" in new_repre["tags"]:
+            new_repre["tags"].remove("delete")
+
+        # Add additional tags from output definition to representation
+        for tag in output_def["tags"]:
+            if tag not in new_repre["tags"]:
+                new_repre["tags"].append(tag)
+
+        # Add burnin link from output definition to representation
+        for burnin in output_def["burnins"]:
+            if burnin not in new_repre.get("burnins", []):
+                if not new_repre.get("burnins"):
+                    new_repre["burnins"] = []
+                new_repre["burnins"].append(str(burnin))
+
+        self.log.debug(
+            "Linked burnins: `{}`".format(new_repre.get("burnins"))
+        )
+
+        self.log.debug(
+            "New representation tags: `{}`".format(
+                new_repre.get("tags"))
+        )
+
+        temp_data = self.prepare_temp_data(
+            instance, repre, output_def)
+        if burnins_prep is not None:
+            temp_data["burnin"] = self.get_output_burnin(
+                burnins_prep, new_repre
+            )
+
+        # create or update outputName
+        output_name = new_repre.get("outputName", "")
+        output_ext = new_repre["ext"]
+        if output_name:
+            output_name += "_"
+        output_name += output_def["filename_suffix"]
+        if temp_data["without_handles"]:
+            output_name += "_noHandles"
+
+        # add outputName to anatomy format fill_data
+        fill_data.update({
+            "output": output_name,
+            "ext": output_ext
+        })
+
+        ffmpeg_args_parts = self._ffmpeg_arguments_parts(
+            output_def, instance, new_repre, temp_data, fill_data
+        )
+
+        return {
+            "output_def": output_def,
+            "output_name": output_name,
+            "output_ext": output_ext,
+            "new_repre": new_repre,
+            "temp_data": temp_data,
+            "ffmpeg_args_parts": ffmpeg_args_parts
+        }
+
+    def add_output_representation(self, instance, output_item):
+        """Finalize new representation of output and add it to instance."""
+        new_repre = output_item["new_repre"]
+        temp_data = output_item["temp_data"]
+        output_name = output_item["output_name"]
+        new_repre.update({
+            "name": "{}_{}".format(output_name, output_item["output_ext"]),
+            "outputName": output_name,
+            "outputDef": output_item["output_def"],
+            "frameStartFtrack": temp_data["output_frame_start"],
+            "frameEndFtrack": temp_data["output_frame_end"],
+            "ffmpeg_cmd": output_item["ffmpeg_cmd"]
+        })
+        # ExtractBurnin skips representations with applied burnins
+        if temp_data.get("burnin"):
+            new_repre["burnin_applied"] = True
+
+        # Force to pop these key if are in new repre
+        new_repre.pop("preview", None)
+        new_repre.pop("thumbnail", None)
+        if "clean_name" in new_repre.get("tags", []):
+            new_repre.pop("outputName")
+
+        # adding representation
+        self.log.debug(
+            "Adding new representation: {}".format(new_repre)
+        )
+        instance.data["representations"].append(new_repre)
+
+    def convert_repre_for_ffmpeg(self, repre, first_input_path):
+        """Convert representation files to temp dir readable by ffmpeg.
+
+        Staging dir of representation is changed to the temp dir. Only frames
+        of files in representation are converted, which includes handles and
+        skips missing frames.
+        """
+        new_staging_dir = get_transcode_temp_directory()
+        repre["stagingDir"] = new_staging_dir
+
+        frame_start = frame_end = frames = None
+        if self.input_is_sequence(repre):
+            collections = clique.assemble(repre["files"])[0]
+            assert len(collections) == 1, "Multiple collections found."
+            frames = list(collections[0].indexes)
+            frame_start = frames[0]
+            frame_end = frames[-1]
+
+        convert_for_ffmpeg(
+            first_input_path,
+            new_staging_dir,
+            frame_start,
+            frame_end,
+            self.log,
+            workers=self.convert_workers or None,
+            frames=frames
+        )
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -470,6 +581,21 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 process.
             temp_data (dict): Base data for successful process.
         """
+        return self.ffmpeg_full_args(**self._ffmpeg_arguments_parts(
+            output_def, instance, new_repre, temp_data, fill_data
+        ))
+
+    def _ffmpeg_arguments_parts(
+        self, output_def, instance, new_repre, temp_data, fill_data
+    ):
+        """Prepares ffmpeg arguments split to parts.
+
+        Same as '_ffmpeg_arguments' but arguments are not merged so they can
+        be combined with arguments of other outputs.
+
+        Returns:
+            dict: Keyword arguments for 'ffmpeg_full_args'.
+        """
 
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
@@ -599,6 +725,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
         lut_filters = self.lut_filters(new_repre, instance, ffmpeg_input_args)
         ffmpeg_video_filters.extend(lut_filters)
 
+        burnin_filters = []
+        if temp_data.get("burnin"):
+            burnin_filter = self.burnin_filters(
+                instance, new_repre, temp_data, fill_data
+            )
+            if burnin_filter:
+                burnin_filters.append(burnin_filter)
+
         bg_alpha = 0
         bg_color = output_def.get("bg_color")
         if bg_color:
@@ -640,12 +774,13 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
-            ffmpeg_input_args,
-            ffmpeg_video_filters,
-            ffmpeg_audio_filters,
-            ffmpeg_output_args
-        )
+        return {
+            "input_args": ffmpeg_input_args,
+            "video_filters": ffmpeg_video_filters,
+            "audio_filters": ffmpeg_audio_filters,
+            "output_args": ffmpeg_output_args,
+            "last_video_filters": burnin_filters
+        }
 
     def split_ffmpeg_args(self, in_args):
         """Makes sure all entered arguments are separated in individual items.
@@ -669,24 +804,13 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     splitted_args.append(arg)
         return splitted_args
 
-    def ffmpeg_full_args(
-        self, input_args, video_filters, audio_filters, output_args
+    def move_filters_from_output_args(
+        self, output_args, video_filters, audio_filters
     ):
-        """Post processing of collected FFmpeg arguments.
-
-        Just verify that output arguments does not contain video or audio
-        filters which may cause issues because of duplicated argument entry.
-        Filters found in output arguments are moved to list they belong to.
-
-        Args:
-            input_args (list): All collected ffmpeg arguments with inputs.
-            video_filters (list): All collected video filters.
-            audio_filters (list): All collected audio filters.
-            output_args (list): All collected ffmpeg output arguments with
-                output filepath.
+        """Move video and audio filters from output arguments to filters.
 
         Returns:
-            list: Containing all arguments ready to run in subprocess.
+            list: Output arguments without filters.
         """
         output_args = self.split_ffmpeg_args(output_args)
 
@@ -704,6 +828,36 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
+        return output_args
+
+    def ffmpeg_full_args(
+        self, input_args, video_filters, audio_filters, output_args,
+        last_video_filters=None
+    ):
+        """Post processing of collected FFmpeg arguments.
+
+        Just verify that output arguments does not contain video or audio
+        filters which may cause issues because of duplicated argument entry.
+        Filters found in output arguments are moved to list they belong to.
+
+        Args:
+            input_args (list): All collected ffmpeg arguments with inputs.
+            video_filters (list): All collected video filters.
+            audio_filters (list): All collected audio filters.
+            output_args (list): All collected ffmpeg output arguments with
+                output filepath.
+            last_video_filters (list): Video filters which must be applied
+                after all other filters (e.g. burnins).
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        output_args = self.move_filters_from_output_args(
+            output_args, video_filters, audio_filters
+        )
+
+        if last_video_filters:
+            video_filters.extend(last_video_filters)
 
         all_args = []
         all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
@@ -720,6 +874,248 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         return all_args
 
+    def can_share_input(self, ffmpeg_args_parts):
+        """Output can be encoded in ffmpeg process with other outputs.
+
+        Output is encoded by a branch of filter graph so it can't use it's
+        own filter graphs (labeled pads, '-filter_complex'), stream mapping,
+        audio filters or more than one audio input.
+        """
+        if ffmpeg_args_parts["audio_filters"]:
+            return False
+
+        input_args = ffmpeg_args_parts["input_args"]
+        inputs_count = len([
+            arg for arg in input_args if arg.startswith("-i ")
+        ])
+        if inputs_count > 2:
+            return False
+
+        for arg in ffmpeg_args_parts["output_args"]:
+            for identifier in ("-filter_complex", "-lavfi", "-map"):
+                if arg.startswith(identifier):
+                    return False
+
+        video_filters = (
+            ffmpeg_args_parts["video_filters"]
+            + ffmpeg_args_parts["last_video_filters"]
+        )
+        for video_filter in video_filters:
+            if "[" in video_filter:
+                return False
+        return True
+
+    def group_output_items(self, output_items):
+        """Group outputs which can be encoded by one ffmpeg process.
+
+        Outputs are grouped only if 'shared_decode' is enabled. Outputs with
+        same input arguments (input file, frame range, audio inputs) share
+        the decoding of input.
+
+        Returns:
+            list: Groups of output items in order of first item of group.
+        """
+        if not self.shared_decode:
+            return [[item] for item in output_items]
+
+        groups = []
+        groups_by_input = {}
+        for item in output_items:
+            parts = item["ffmpeg_args_parts"]
+            parts["output_args"] = self.move_filters_from_output_args(
+                parts["output_args"],
+                parts["video_filters"],
+                parts["audio_filters"]
+            )
+            if not self.can_share_input(parts):
+                groups.append([item])
+                continue
+
+            key = tuple(parts["input_args"])
+            group = groups_by_input.get(key)
+            if group is None:
+                group = groups_by_input[key] = []
+                groups.append(group)
+            group.append(item)
+        return groups
+
+    def ffmpeg_shared_input_args(self, output_items):
+        """Arguments of ffmpeg process encoding multiple outputs.
+
+        Input is decoded once and split to branches of filter graph, one for
+        each output. Expects output items grouped by 'group_output_items'.
+
+        Args:
+            output_items (list): Output items with same input arguments.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        input_args = output_items[0]["ffmpeg_args_parts"]["input_args"]
+        has_audio_input = len([
+            arg for arg in input_args if arg.startswith("-i ")
+        ]) > 1
+
+        split_labels = [
+            "[s{}]".format(idx)
+            for idx in range(len(output_items))
+        ]
+        filter_graph = ["[0:v]split={}{}".format(
+            len(split_labels), "".join(split_labels)
+        )]
+        all_output_args = []
+        for idx, item in enumerate(output_items):
+            parts = item["ffmpeg_args_parts"]
+            video_filters = (
+                parts["video_filters"] + parts["last_video_filters"]
+            )
+            output_label = split_labels[idx]
+            if video_filters:
+                output_label = "[v{}]".format(idx)
+                filter_graph.append("{}{}{}".format(
+                    split_labels[idx], ",".join(video_filters), output_label
+                ))
+
+            all_output_args.append("-map \"{}\"".format(output_label))
+            # Explicit mapping disables automatic selection of audio stream
+            if not item["temp_data"]["output_ext_is_image"]:
+                if has_audio_input:
+                    all_output_args.append("-map 1:a")
+                else:
+                    all_output_args.append("-map \"0:a?\"")
+            all_output_args.extend(parts["output_args"])
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_graph)))
+        all_args.extend(all_output_args)
+        return all_args
+
+    def _get_burnin_settings(self, instance):
+        """Settings of ExtractBurnin for current host.
+
+        Returns:
+            dict: Plugin settings or None if burnins are disabled or are not
+                used in current host.
+        """
+        host_name = instance.context.data["hostName"]
+        if host_name in self.no_burnin_hosts:
+            return None
+
+        project_settings = instance.context.data["project_settings"]
+        plugin_settings = (
+            project_settings
+            .get(host_name, {})
+            .get("publish", {})
+            .get("ExtractBurnin")
+        )
+        if plugin_settings is None:
+            plugin_settings = (
+                project_settings["global"]["publish"].get("ExtractBurnin")
+                or {}
+            )
+
+        if not plugin_settings.get("enabled", True):
+            return None
+        return plugin_settings
+
+    def prepare_burnins(self, instance):
+        """Prepare data to apply burnins during encoding of outputs.
+
+        Returns:
+            dict: Burnin options, burnin definitions of matching profile and
+                basic burnin data. None if burnins are not used.
+        """
+        burnin_settings = self._get_burnin_settings(instance)
+        if burnin_settings is None:
+            return None
+
+        host_name = instance.context.data["hostName"]
+        task_name = os.environ["AVALON_TASK"]
+        family = self.main_family_from_instance(instance)
+        profile = get_burnin_profile(
+            burnin_settings.get("profiles"), host_name, task_name, family,
+            self.log
+        )
+        if not profile:
+            return None
+
+        burnin_defs = filter_burnin_defs(
+            profile, self.families_from_instance(instance), self.log
+        )
+        if not burnin_defs:
+            return None
+
+        burnin_data, temp_data = prepare_basic_burnin_data(instance, self.log)
+        return {
+            "options": burnin_settings.get("options"),
+            "burnin_defs": burnin_defs,
+            "burnin_data": burnin_data,
+            "temp_data": temp_data
+        }
+
+    def get_output_burnin(self, burnins_prep, new_repre):
+        """Burnin definition which can be applied during encoding of output.
+
+        Burnins are applied only if output has exactly one matching burnin
+        definition. Outputs with multiple burnin definitions are processed
+        by ExtractBurnin.
+
+        Returns:
+            dict: Burnins preparation data with "burnin_def" or None.
+        """
+        if "burnin" not in new_repre["tags"]:
+            return None
+
+        burnin_defs = get_repre_burnin_defs(
+            new_repre, burnins_prep["burnin_defs"], self.log
+        )
+        if len(burnin_defs) != 1:
+            return None
+
+        output_burnin = dict(burnins_prep)
+        output_burnin["burnin_def"] = tuple(burnin_defs.values())[0]
+        return output_burnin
+
+    def burnin_filters(self, instance, new_repre, temp_data, fill_data):
+        """Drawtext filters of burnins for output.
+
+        Burnin data are prepared same way as in ExtractBurnin for
+        representation of this output. Resolution and framerate of output
+        are used to calculate position of burnins.
+        """
+        burnin = temp_data["burnin"]
+
+        burnin_repre = copy.deepcopy(new_repre)
+        burnin_repre["name"] = "{}_{}".format(
+            fill_data["output"], fill_data["ext"]
+        )
+        burnin_data = copy.deepcopy(burnin["burnin_data"])
+        burnin_temp_data = copy.deepcopy(burnin["temp_data"])
+        prepare_repre_burnin_data(
+            instance, burnin_repre, burnin_data, burnin_temp_data
+        )
+        fill_burnin_data(instance, burnin_repre, burnin_data)
+
+        fps = fractions.Fraction(temp_data["fps"]).limit_denominator(1001)
+        stream_data = {
+            "r_frame_rate": "{}/{}".format(fps.numerator, fps.denominator)
+        }
+        if new_repre.get("resolutionWidth"):
+            stream_data["width"] = new_repre["resolutionWidth"]
+            stream_data["height"] = new_repre["resolutionHeight"]
+
+        return get_burnin_filters(
+            temp_data["full_input_path_single_file"],
+            burnin_data,
+            burnin["burnin_def"],
+            stream_data,
+            burnin["options"],
+            self.log
+        )
+
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
@@ -4,7 +4,6 @@ import os
 import shutil
 
 import pyblish.api
-import openpype.api
 import openpype.lib
 
 
@@ -51,34 +50,41 @@ class ExtractScanlineExr(pyblish.api.InstancePlugin):
                     "OIIO tool not found in {}".format(oiio_tool_path))
                 raise AssertionError("OIIO tool not found")
 
+            input_paths = []
+            output_paths = []
             for file in input_files:
-
                 original_name = os.path.join(stagingdir, file)
                 temp_name = os.path.join(stagingdir, "__{}".format(file))
                 # move original render to temp location
                 shutil.move(original_name, temp_name)
-                oiio_cmd = [
-                    oiio_tool_path,
-                    os.path.join(stagingdir, temp_name), "--scanline", "-o",
-                    os.path.join(stagingdir, original_name)
-                ]
-
-                subprocess_exr = " ".join(oiio_cmd)
-                self.log.info(f"running: {subprocess_exr}")
-                openpype.api.run_subprocess(subprocess_exr, logger=self.log)
-
-                # raise error if there is no ouptput
-                if not os.path.exists(os.path.join(stagingdir, original_name)):
+                input_paths.append(temp_name)
+                output_paths.append(original_name)
+
+            # frames are converted in parallel, sequences by frame ranges
+            self.log.info(
+                "Converting {} files to scanline".format(len(input_paths)))
+            failed_paths = set(openpype.lib.run_oiio_for_files(
+                input_paths, output_paths, ["--scanline"], logger=self.log
+            ))
+
+            for temp_name, original_name in zip(input_paths, output_paths):
+                if temp_name in failed_paths:
                     self.log.error(
                         ("File {} was not converted "
                          "by oiio tool!").format(original_name))
-                    raise AssertionError("OIIO tool conversion failed")
-                else:
-                    try:
-                        os.remove(temp_name)
-                    except OSError as e:
-                        self.log.warning("Unable to delete temp file")
-                        self.log.warning(e)
+                    # put original render back
+                    shutil.move(temp_name, original_name)
+                    continue
+
+                try:
+                    os.remove(temp_name)
+                except OSError as e:
+                    self.log.warning("Unable to delete temp file")
+                    self.log.warning(e)
+
+            # raise error if there is no ouptput
+            if failed_paths:
+                raise AssertionError("OIIO tool conversion failed")
 
             repre['name'] = 'exr'
             try:
@@ -1,10 +1,8 @@
 import os
-from os.path import getsize
 import logging
 import sys
 import copy
 import clique
-import errno
 import six
 import re
 import shutil
@@ -13,18 +11,17 @@ from pymongo import DeleteOne, InsertOne
 import pyblish.api
 from avalon import io
 from avalon.api import format_template_with_optional_keys
-from avalon.vendor import filelink
 import openpype.api
 from datetime import datetime
 # from pype.modules import ModulesManager
 from openpype.lib.profiles_filtering import filter_profiles
 from openpype.lib import prepare_template_data
-
-# this is needed until speedcopy for linux is fixed
-if sys.platform == "win32":
-    from speedcopy import copyfile
-else:
-    from shutil import copyfile
+from openpype.lib import file_hash as file_hash_lib
+from openpype.lib.file_transfer import (
+    FileStatCache,
+    FileTransferEngine,
+    FileTransferError
+)
 
 log = logging.getLogger(__name__)
 
@@ -115,13 +112,20 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
     # file_url : file_size of all published and uploaded files
     integrated_file_sizes = {}
+    file_stat_cache = None
 
     # Attributes set by settings
     template_name_profiles = None
     subset_grouping_profiles = None
+    transfer_max_workers = 8
+    transfer_max_workers_per_root = 4
+    content_hash = False
 
     def process(self, instance):
         self.integrated_file_sizes = {}
+        # Stats of integrated files shared by transfers, hashing and
+        #   preparation of files information
+        self.file_stat_cache = FileStatCache()
         if [ef for ef in self.exclude_families
                 if instance.data["family"] in ef]:
             return
@@ -415,21 +419,22 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                 )
                 src_padding_exp = "%0{}d".format(padd_len)
 
-                test_dest_files = list()
-                for i in [1, 2]:
-                    template_data["representation"] = repre['ext']
-                    if not repre.get("udim"):
-                        template_data["frame"] = src_padding_exp % i
-                    else:
-                        template_data["udim"] = src_padding_exp % i
-
-                    anatomy_filled = anatomy.format(template_data)
-                    template_filled = anatomy_filled[template_name]["path"]
-                    if repre_context is None:
-                        repre_context = template_filled.used_values
-                    test_dest_files.append(
-                        os.path.normpath(template_filled)
-                    )
+                template_data["representation"] = repre['ext']
+                frame_key = "frame"
+                if repre.get("udim"):
+                    frame_key = "udim"
+
+                anatomy_filled = anatomy.format_batch(
+                    template_data,
+                    [src_padding_exp % i for i in (1, 2)],
+                    frame_key=frame_key
+                )
+                template_filled = anatomy_filled[template_name]["path"]
+                repre_context = template_filled.used_values
+                test_dest_files = [
+                    os.path.normpath(path)
+                    for path in template_filled.paths
+                ]
                 if not repre.get("udim"):
                     template_data["frame"] = repre_context["frame"]
                 else:
@@ -530,7 +535,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                 if repre.get("udim"):
                     template_data["udim"] = repre["udim"][0]
                 src = os.path.join(stagingdir, fname)
-                anatomy_filled = anatomy.format(template_data)
+                anatomy_filled = anatomy.format(template_data, lazy=True)
                 template_filled = anatomy_filled[template_name]["path"]
                 repre_context = template_filled.used_values
                 dst = os.path.normpath(template_filled)
@@ -639,7 +644,8 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
     def integrate(self, instance):
         """ Move the files.
 
-            Through `instance.data["transfers"]`
+            Through `instance.data["transfers"]` and
+            `instance.data["hardlinks"]`. Files are transferred in parallel.
 
             Args:
                 instance: the instance to integrate
@@ -647,15 +653,20 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                 integrated_file_sizes: dictionary of destination file url and
                 its size in bytes
         """
-        # store destination url and size for reporting and rollback
-        integrated_file_sizes = {}
+        anatomy = instance.context.data["anatomy"]
+        transfer_engine = FileTransferEngine(
+            max_workers=self.transfer_max_workers,
+            max_workers_per_root=self.transfer_max_workers_per_root,
+            roots=anatomy.all_root_paths(),
+            stat_cache=self.file_stat_cache,
+            log=self.log
+        )
         transfers = list(instance.data.get("transfers", list()))
         for src, dest in transfers:
             if os.path.normpath(src) != os.path.normpath(dest):
                 dest = self.get_dest_temp_url(dest)
-                self.copy_file(src, dest)
-                # TODO needs to be updated during site implementation
-                integrated_file_sizes[dest] = os.path.getsize(dest)
+                self.log.debug("Copying file ... {} -> {}".format(src, dest))
+                transfer_engine.add(src, dest)
 
         # Produce hardlinked copies
         # Note: hardlink can only be produced between two files on the same
@@ -666,68 +677,16 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         for src, dest in hardlinks:
             dest = self.get_dest_temp_url(dest)
             self.log.debug("Hardlinking file ... {} -> {}".format(src, dest))
-            if not os.path.exists(dest):
-                self.hardlink_file(src, dest)
-
-            # TODO needs to be updated during site implementation
-            integrated_file_sizes[dest] = os.path.getsize(dest)
-
-        return integrated_file_sizes
-
-    def copy_file(self, src, dst):
-        """ Copy given source to destination
-
-        Arguments:
-            src (str): the source file which needs to be copied
-            dst (str): the destination of the sourc file
-        Returns:
-            None
-        """
-        src = os.path.normpath(src)
-        dst = os.path.normpath(dst)
-        self.log.debug("Copying file ... {} -> {}".format(src, dst))
-        dirname = os.path.dirname(dst)
-        try:
-            os.makedirs(dirname)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                pass
-            else:
-                self.log.critical("An unexpected error occurred.")
-                six.reraise(*sys.exc_info())
-
-        # copy file with speedcopy and check if size of files are simetrical
-        while True:
-            if not shutil._samefile(src, dst):
-                copyfile(src, dst)
-            else:
-                self.log.critical(
-                    "files are the same {} to {}".format(src, dst)
-                )
-                os.remove(dst)
-                try:
-                    shutil.copyfile(src, dst)
-                    self.log.debug("Copying files with shutil...")
-                except OSError as e:
-                    self.log.critical("Cannot copy {} to {}".format(src, dst))
-                    self.log.critical(e)
-                    six.reraise(*sys.exc_info())
-            if str(getsize(src)) in str(getsize(dst)):
-                break
-
-    def hardlink_file(self, src, dst):
-        dirname = os.path.dirname(dst)
+            transfer_engine.add(src, dest, transfer_engine.MODE_HARDLINK)
 
+        # store destination url and size for reporting and rollback
         try:
-            os.makedirs(dirname)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                pass
-            else:
-                self.log.critical("An unexpected error occurred.")
-                six.reraise(*sys.exc_info())
-
-        filelink.create(src, dst, filelink.HARDLINK)
+            integrated_file_sizes = transfer_engine.process()
+        except FileTransferError as exc:
+            # Make sure already transferred files are removed on rollback
+            self.integrated_file_sizes.update(exc.transferred)
+            raise
+        return integrated_file_sizes
 
     def get_subset(self, asset, instance):
         subset_name = instance.data["subset"]
@@ -963,6 +922,15 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
+    @staticmethod
+    def get_file_hash_cache(context):
+        """Cache of content hashes shared by all instances of context."""
+        hash_cache = context.data.get("fileHashCache")
+        if hash_cache is None:
+            hash_cache = file_hash_lib.FileHashCache()
+            context.data["fileHashCache"] = hash_cache
+        return hash_cache
+
     def get_files_info(self, instance, integrated_file_sizes):
         """ Prepare 'files' portion for attached resources and main asset.
             Combining records from 'transfers' and 'hardlinks' parts from
@@ -984,12 +952,25 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         self.log.debug("get_resource_files_info.resources:{}".
                        format(resources))
 
+        # Content of destination is same as content of source so hash of
+        #   source can be taken from cache if source did not change
+        content_hashes = {}
+        if self.content_hash:
+            content_hashes = file_hash_lib.content_hashes(
+                set(src for src, _ in resources),
+                hash_cache=self.get_file_hash_cache(instance.context)
+            )
+
         output_resources = []
         anatomy = instance.context.data["anatomy"]
-        for _src, dest in resources:
+        for src, dest in resources:
             path = self.get_rootless_path(anatomy, dest)
-            dest = self.get_dest_temp_url(dest)
-            file_hash = openpype.api.source_hash(dest)
+            dest = os.path.normpath(self.get_dest_temp_url(dest))
+            file_hash = openpype.api.source_hash(
+                dest,
+                stat_result=self.file_stat_cache.stat(dest),
+                file_content_hash=content_hashes.get(src)
+            )
             if self.TMP_FILE_EXT and \
                ',{}'.format(self.TMP_FILE_EXT) in file_hash:
                 file_hash = file_hash.replace(',{}'.format(self.TMP_FILE_EXT),
@@ -1156,7 +1137,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         """
         if integrated_file_sizes:
             for file_url, _file_size in integrated_file_sizes.items():
-                if not os.path.exists(file_url):
+                if not self.file_stat_cache.exists(file_url):
                     self.log.debug(
                         "File {} was not found.".format(file_url)
                     )
@@ -1188,6 +1169,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                                 )
                             )
                             os.rename(file_url, new_name)
+                    self.file_stat_cache.invalidate(file_url)
                 except OSError:
                     self.log.error("Cannot {} file {}".format(mode, file_url),
                                    exc_info=True)
@@ -9,17 +9,12 @@ import openpype.lib
 
 
 ffmpeg_path = openpype.lib.get_ffmpeg_tool_path("ffmpeg")
-ffprobe_path = openpype.lib.get_ffmpeg_tool_path("ffprobe")
 
 
 FFMPEG = (
     '"{}"%(input_args)s -i "%(input)s" %(filters)s %(args)s%(output)s'
 ).format(ffmpeg_path)
 
-FFPROBE = (
-    '"{}" -v quiet -print_format json -show_format -show_streams "%(source)s"'
-).format(ffprobe_path)
-
 DRAWTEXT = (
     "drawtext=fontfile='%(font)s':text=\\'%(text)s\\':"
     "x=%(x)s:y=%(y)s:fontcolor=%(color)s@%(opacity).1f:fontsize=%(size)d"
@@ -42,12 +37,8 @@ def _get_ffprobe_data(source):
     :param str source: source media file
     :rtype: [{}, ...]
     """
-    command = FFPROBE % {'source': source}
-    proc = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE)
-    out = proc.communicate()[0]
-    if proc.returncode != 0:
-        raise RuntimeError("Failed to run: %s" % command)
-    return json.loads(out)
+    # Result may be already cached by publish process (on-disk probe cache)
+    return openpype.lib.get_ffprobe_data(source)
 
 
 def get_fps(str_value):
@@ -532,70 +523,25 @@ def example(input_path, output_path):
     burnin.render(output_path, overwrite=True)
 
 
-def burnins_from_data(
-    input_path, output_path, data,
-    codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+def prepare_burnins(
+    input_path, data, ffprobe_data=None, options=None, burnin_values=None,
+    first_frame=None
 ):
-    """This method adds burnins to video/image file based on presets setting.
-
-    Extension of output MUST be same as input. (mov -> mov, avi -> avi,...)
+    """Create burnins object with drawtext filters based on burnin values.
 
     Args:
         input_path (str): Full path to input file where burnins should be add.
-        output_path (str): Full path to output file where output will be
-            rendered.
-        data (dict): Data required for burnin settings (more info below).
-        codec_data (list): All codec related arguments in list.
+        data (dict): Data required for burnin settings (more info in
+            `burnins_from_data`).
+        ffprobe_data (dict): Ffprobe output of source. Input is probed
+            when not passed.
         options (dict): Options for burnins.
         burnin_values (dict): Contain positioned values.
-        overwrite (bool): Output will be overwritten if already exists,
-            True by default.
-
-    Presets must be set separately. Should be dict with 2 keys:
-    - "options" - sets look of burnins - colors, opacity,...(more info: ModifiedBurnins doc)
-                - *OPTIONAL* default values are used when not included
-    - "burnins" - contains dictionary with burnins settings
-                - *OPTIONAL* burnins won't be added (easier is not to use this)
-        - each key of "burnins" represents Alignment, there are 6 possibilities:
-            TOP_LEFT        TOP_CENTERED        TOP_RIGHT
-            BOTTOM_LEFT     BOTTOM_CENTERED     BOTTOM_RIGHT
-        - value must be string with text you want to burn-in
-        - text may contain specific formatting keys (exmplained below)
-
-    Requirement of *data* keys is based on presets.
-    - "frame_start" - is required when "timecode" or "current_frame" ins keys
-    - "frame_start_tc" - when "timecode" should start with different frame
-    - *keys for static text*
+        first_frame (int): First frame of input sequence.
 
-    EXAMPLE:
-    preset = {
-        "options": {*OPTIONS FOR LOOK*},
-        "burnins": {
-            "TOP_LEFT": "static_text",
-            "TOP_RIGHT": "{shot}",
-            "BOTTOM_LEFT": "TC: {timecode}",
-            "BOTTOM_RIGHT": "{frame_start}{current_frame}"
-        }
-    }
-
-    For this preset we'll need at least this data:
-    data = {
-        "frame_start": 1001,
-        "shot": "sh0010"
-    }
-
-    When Timecode should start from 1 then data need:
-    data = {
-        "frame_start": 1001,
-        "frame_start_tc": 1,
-        "shot": "sh0010"
-    }
+    Returns:
+        ModifiedBurnins: Burnins with filled filters.
     """
-    ffprobe_data = None
-    if full_input_path:
-        ffprobe_data = _get_ffprobe_data(full_input_path)
-
     burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
 
     frame_start = data.get("frame_start")
@@ -713,6 +659,77 @@ def burnins_from_data(
         text = value.format(**data)
         burnin.add_text(text, align, frame_start, frame_end)
 
+    return burnin
+
+
+def burnins_from_data(
+    input_path, output_path, data,
+    codec_data=None, options=None, burnin_values=None, overwrite=True,
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+):
+    """This method adds burnins to video/image file based on presets setting.
+
+    Extension of output MUST be same as input. (mov -> mov, avi -> avi,...)
+
+    Args:
+        input_path (str): Full path to input file where burnins should be add.
+        output_path (str): Full path to output file where output will be
+            rendered.
+        data (dict): Data required for burnin settings (more info below).
+        codec_data (list): All codec related arguments in list.
+        options (dict): Options for burnins.
+        burnin_values (dict): Contain positioned values.
+        overwrite (bool): Output will be overwritten if already exists,
+            True by default.
+
+    Presets must be set separately. Should be dict with 2 keys:
+    - "options" - sets look of burnins - colors, opacity,...(more info: ModifiedBurnins doc)
+                - *OPTIONAL* default values are used when not included
+    - "burnins" - contains dictionary with burnins settings
+                - *OPTIONAL* burnins won't be added (easier is not to use this)
+        - each key of "burnins" represents Alignment, there are 6 possibilities:
+            TOP_LEFT        TOP_CENTERED        TOP_RIGHT
+            BOTTOM_LEFT     BOTTOM_CENTERED     BOTTOM_RIGHT
+        - value must be string with text you want to burn-in
+        - text may contain specific formatting keys (exmplained below)
+
+    Requirement of *data* keys is based on presets.
+    - "frame_start" - is required when "timecode" or "current_frame" ins keys
+    - "frame_start_tc" - when "timecode" should start with different frame
+    - *keys for static text*
+
+    EXAMPLE:
+    preset = {
+        "options": {*OPTIONS FOR LOOK*},
+        "burnins": {
+            "TOP_LEFT": "static_text",
+            "TOP_RIGHT": "{shot}",
+            "BOTTOM_LEFT": "TC: {timecode}",
+            "BOTTOM_RIGHT": "{frame_start}{current_frame}"
+        }
+    }
+
+    For this preset we'll need at least this data:
+    data = {
+        "frame_start": 1001,
+        "shot": "sh0010"
+    }
+
+    When Timecode should start from 1 then data need:
+    data = {
+        "frame_start": 1001,
+        "frame_start_tc": 1,
+        "shot": "sh0010"
+    }
+    """
+    ffprobe_data = None
+    if full_input_path:
+        ffprobe_data = _get_ffprobe_data(full_input_path)
+
+    burnin = prepare_burnins(
+        input_path, data, ffprobe_data, options, burnin_values, first_frame
+    )
+
     ffmpeg_args = []
     if codec_data:
         # Use codec definition from method arguments
@@ -743,21 +760,64 @@ def burnins_from_data(
     )
 
 
+def burnin_filters_from_data(
+    full_input_path, data, stream_data=None, options=None, burnin_values=None
+):
+    """Drawtext filters of burnins without rendering.
+
+    Used when burnins are applied by another ffmpeg process, e.g. during
+    review encoding.
+
+    Args:
+        full_input_path (str): Full path to source file which is probed.
+        data (dict): Data required for burnin settings.
+        stream_data (dict): Values overriding probed video stream, e.g.
+            resolution and frame rate of final output.
+        options (dict): Options for burnins.
+        burnin_values (dict): Contain positioned values.
+
+    Returns:
+        str: Video filters joined with comma.
+    """
+    ffprobe_data = _get_ffprobe_data(full_input_path)
+    if stream_data:
+        ffprobe_data["streams"][0].update(stream_data)
+
+    burnin = prepare_burnins(
+        full_input_path, data, ffprobe_data, options, burnin_values
+    )
+    return burnin.filter_string
+
+
 if __name__ == "__main__":
     print("* Burnin script started")
     in_data_json_path = sys.argv[-1]
     with open(in_data_json_path, "r") as file_stream:
         in_data = json.load(file_stream)
 
-    burnins_from_data(
-        in_data["input"],
-        in_data["output"],
-        in_data["burnin_data"],
-        codec_data=in_data.get("codec"),
-        options=in_data.get("options"),
-        burnin_values=in_data.get("values"),
-        full_input_path=in_data.get("full_input_path"),
-        first_frame=in_data.get("first_frame"),
-        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
-    )
+    # Only store filters to json file
+    filters_output = in_data.get("filters_output")
+    if filters_output:
+        filter_string = burnin_filters_from_data(
+            in_data["full_input_path"],
+            in_data["burnin_data"],
+            stream_data=in_data.get("stream_data"),
+            options=in_data.get("options"),
+            burnin_values=in_data.get("values")
+        )
+        with open(filters_output, "w") as file_stream:
+            json.dump({"filters": filter_string}, file_stream)
+
+    else:
+        burnins_from_data(
+            in_data["input"],
+            in_data["output"],
+            in_data["burnin_data"],
+            codec_data=in_data.get("codec"),
+            options=in_data.get("options"),
+            burnin_values=in_data.get("values"),
+            full_input_path=in_data.get("full_input_path"),
+            first_frame=in_data.get("first_frame"),
+            source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
+        )
     print("* Burnin script has finished")
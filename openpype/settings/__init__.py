@@ -20,6 +20,7 @@ from .lib import (
     get_general_environments,
     get_system_settings,
     get_project_settings,
+    get_projects_settings,
     get_current_project_settings,
     get_anatomy_settings,
     get_environments,
@@ -52,6 +53,7 @@ __all__ = (
     "get_general_environments",
     "get_system_settings",
     "get_project_settings",
+    "get_projects_settings",
     "get_current_project_settings",
     "get_anatomy_settings",
     "get_environments",
@@ -1,6 +1,8 @@
 import os
 import json
 import copy
+import uuid
+import itertools
 import collections
 import datetime
 from abc import ABCMeta, abstractmethod
@@ -94,6 +96,53 @@ class SettingsHandler:
         """
         pass
 
+    def get_projects_settings_overrides(self, project_names):
+        """Studio overrides of project settings for multiple projects.
+
+        Args:
+            project_names(Iterable[str]): Names of projects.
+
+        Returns:
+            dict: Overrides of each project by project name.
+        """
+        return {
+            project_name: self.get_project_settings_overrides(
+                project_name, False
+            )
+            for project_name in project_names
+        }
+
+    def get_projects_settings_revisions(self, project_names):
+        """Revisions of project settings overrides of multiple projects.
+
+        Args:
+            project_names(Iterable[str]): Names of projects.
+
+        Returns:
+            dict: Revision of each project by project name. Revision may be
+                None if handler can't determine it.
+        """
+        return {
+            project_name: self.get_project_settings_revision(project_name)
+            for project_name in project_names
+        }
+
+    def get_project_settings_revision(self, project_name):
+        """Revision of project settings overrides of a project.
+
+        Revision changes each time studio overrides of default project
+        settings or overrides of the project are changed. Can be used to
+        validate cached project settings.
+
+        Args:
+            project_name(str): Name of project.
+
+        Returns:
+            Union[Hashable, None]: Revision of overrides or None if handler
+                can't determine the revision.
+        """
+        return None
+
     @abstractmethod
     def get_project_anatomy_overrides(self, project_name, return_version):
         """Studio overrides of project anatomy for specific project.
@@ -275,14 +324,42 @@ class LocalSettingsHandler:
         """Studio overrides of system settings."""
         pass
 
+    def get_local_settings_revision(self):
+        """Revision of local settings.
+
+        Returns:
+            Union[Hashable, None]: Revision of local settings or None if
+                handler can't determine the revision.
+        """
+        return None
+
 
 class CacheValues:
+    """Cached settings data.
+
+    Data are considered outdated after `cache_lifetime` seconds. Caches of
+    documents with known revision are outdated after
+    `revision_check_interval` seconds, but data are reloaded only when
+    revision of the documents changed.
+
+    Attribute `data_id` is changed each time data are changed so it can be
+    used to validate values calculated from the data.
+    """
     cache_lifetime = 10
+    revision_check_interval = 1
+    _data_ids = itertools.count()
 
     def __init__(self):
         self.data = None
         self.creation_time = None
         self.version = None
+        self.revision = None
+        self.data_id = next(self._data_ids)
+
+    @staticmethod
+    def create_revision():
+        """New unique revision stored to saved settings document."""
+        return uuid.uuid4().hex
 
     def data_copy(self):
         if not self.data:
@@ -291,7 +368,10 @@ class CacheValues:
 
     def update_data(self, data, version=None):
         self.data = data
+        self.data_id = next(self._data_ids)
         self.creation_time = datetime.datetime.now()
+        # Revision of stored document is not known
+        self.revision = None
         if version is not None:
             self.version = version
 
@@ -305,9 +385,17 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
         self.data = data
+        self.data_id = next(self._data_ids)
+        self.creation_time = datetime.datetime.now()
+        self.revision = None
         if version is not None:
             self.version = version
 
+    def update_revision(self, revision):
+        """Mark data as up to date with passed revision."""
+        self.revision = revision
+        self.creation_time = datetime.datetime.now()
+
     def to_json_string(self):
         return json.dumps(self.data or {})
 
@@ -315,8 +403,11 @@ class CacheValues:
     def is_outdated(self):
         if self.creation_time is None:
             return True
-        delta = (datetime.datetime.now() - self.creation_time).seconds
-        return delta > self.cache_lifetime
+        lifetime = self.cache_lifetime
+        if self.revision is not None:
+            lifetime = self.revision_check_interval
+        delta = datetime.datetime.now() - self.creation_time
+        return delta.total_seconds() > lifetime
 
 
 class MongoSettingsHandler(SettingsHandler):
@@ -677,7 +768,8 @@ class MongoSettingsHandler(SettingsHandler):
             "type": doc_type,
             "data": data_cache.data,
             "is_default": is_default,
-            "version": self._current_version
+            "version": self._current_version,
+            "revision": data_cache.create_revision()
         }
         if not is_default:
             replace_filter["project_name"] = project_name
@@ -853,10 +945,32 @@ class MongoSettingsHandler(SettingsHandler):
         if versioned_doc is None:
             versioned_doc = self._get_versions_order_doc()
 
+        return self._select_closest_settings_id(
+            other_versions, key, legacy_key, versioned_doc
+        )
+
+    def _select_closest_settings_id(
+        self, docs, key, legacy_key, versioned_doc
+    ):
+        """Select closest settings document from documents of all versions.
+
+        Args:
+            docs(Iterable[dict]): Settings documents of all versions with
+                "_id", "type" and "version" keys.
+            key(str): Settings key under which are settings stored ("type").
+            legacy_key(str): Settings key under which were stored not versioned
+                settings.
+            versioned_doc(dict): Document with list of sorted versions.
+
+        Returns:
+            Union[ObjectId, None]: Id of closest settings document.
+        """
+        versioned_doc = versioned_doc or {}
+
         # Separate queried docs
         legacy_settings_doc = None
         versioned_settings_by_version = {}
-        for doc in other_versions:
+        for doc in docs:
             if doc["type"] == legacy_key:
                 legacy_settings_doc = doc
             elif doc["type"] == key:
@@ -1041,26 +1155,77 @@ class MongoSettingsHandler(SettingsHandler):
             return data, cache.version
         return data
 
-    def _get_project_settings_overrides(self, project_name, return_version):
-        if self.project_settings_cache[project_name].is_outdated:
-            document = self._get_project_settings_overrides_for_version(
-                project_name
-            )
-            if document is None:
-                document = self._find_closest_project_settings(project_name)
+    def _get_settings_revision(self, key, legacy_key, additional_filters):
+        """Revision of all settings documents of a settings key.
 
-            version = None
-            if document:
-                if document["type"] == self._project_settings_key:
-                    version = document["version"]
-                else:
-                    version = LEGACY_SETTINGS_VERSION
+        Revision is combined from ids and revisions of documents of all
+        versions, so it changes also when settings for another version are
+        created or removed.
 
-            self.project_settings_cache[project_name].update_from_document(
-                document, version
-            )
+        Returns:
+            Union[tuple, None]: Revision or None if any of documents was
+                stored by older build which did not store revision.
+        """
+        doc_filters = {
+            "type": {"$in": [key, legacy_key]}
+        }
+        doc_filters.update(additional_filters)
+        docs = self.collection.find(
+            doc_filters,
+            {"_id": True, "revision": True}
+        )
+        return self._get_revision_from_docs(docs)
 
+    @staticmethod
+    def _get_revision_from_docs(docs):
+        revisions = []
+        for doc in docs:
+            revision = doc.get("revision")
+            if revision is None:
+                return None
+            revisions.append((str(doc["_id"]), revision))
+        return tuple(sorted(revisions))
+
+    def _get_project_settings_doc_revision(self, project_name):
+        if project_name is None:
+            additional_filters = {"is_default": True}
+        else:
+            additional_filters = {"project_name": project_name}
+        return self._get_settings_revision(
+            self._project_settings_key,
+            PROJECT_SETTINGS_KEY,
+            additional_filters
+        )
+
+    def _update_project_settings_cache(self, project_name):
         cache = self.project_settings_cache[project_name]
+        if not cache.is_outdated:
+            return cache
+
+        revision = self._get_project_settings_doc_revision(project_name)
+        if revision is not None and cache.revision == revision:
+            cache.update_revision(revision)
+            return cache
+
+        document = self._get_project_settings_overrides_for_version(
+            project_name
+        )
+        if document is None:
+            document = self._find_closest_project_settings(project_name)
+
+        version = None
+        if document:
+            if document["type"] == self._project_settings_key:
+                version = document["version"]
+            else:
+                version = LEGACY_SETTINGS_VERSION
+
+        cache.update_from_document(document, version)
+        cache.update_revision(revision)
+        return cache
+
+    def _get_project_settings_overrides(self, project_name, return_version):
+        cache = self._update_project_settings_cache(project_name)
         data = cache.data_copy()
         if return_version:
             return data, cache.version
@@ -1087,6 +1252,144 @@ class MongoSettingsHandler(SettingsHandler):
             project_name, return_version
         )
 
+    def _update_projects_settings_caches(self, project_names):
+        """Update outdated caches of project settings of multiple projects.
+
+        Settings documents of all projects are queried at once so the
+        number of queries does not depend on number of projects.
+        """
+        project_names = [
+            project_name
+            for project_name in set(project_names)
+            if project_name
+            and self.project_settings_cache[project_name].is_outdated
+        ]
+        if not project_names:
+            return
+
+        self._check_version_order()
+
+        docs_by_project = collections.defaultdict(list)
+        docs = self.collection.find(
+            {
+                "type": {
+                    "$in": [self._project_settings_key, PROJECT_SETTINGS_KEY]
+                },
+                "project_name": {"$in": project_names}
+            },
+            {
+                "_id": True,
+                "version": True,
+                "type": True,
+                "project_name": True,
+                "revision": True
+            }
+        )
+        for doc in docs:
+            docs_by_project[doc["project_name"]].append(doc)
+
+        versioned_doc = None
+        revisions = {}
+        doc_ids_by_project = {}
+        for project_name in project_names:
+            cache = self.project_settings_cache[project_name]
+            project_docs = docs_by_project[project_name]
+            revision = self._get_revision_from_docs(project_docs)
+            revisions[project_name] = revision
+            if revision is not None and cache.revision == revision:
+                cache.update_revision(revision)
+                continue
+
+            doc_id = None
+            for doc in project_docs:
+                if (
+                    doc["type"] == self._project_settings_key
+                    and doc["version"] == self._current_version
+                ):
+                    doc_id = doc["_id"]
+                    break
+
+            if doc_id is None and project_docs:
+                if versioned_doc is None:
+                    versioned_doc = self._get_versions_order_doc() or {}
+                doc_id = self._select_closest_settings_id(
+                    project_docs,
+                    self._project_settings_key,
+                    PROJECT_SETTINGS_KEY,
+                    versioned_doc
+                )
+            doc_ids_by_project[project_name] = doc_id
+
+        doc_ids = [
+            doc_id
+            for doc_id in doc_ids_by_project.values()
+            if doc_id is not None
+        ]
+        docs_by_id = {}
+        if doc_ids:
+            for doc in self.collection.find({"_id": {"$in": doc_ids}}):
+                docs_by_id[doc["_id"]] = doc
+
+        for project_name, doc_id in doc_ids_by_project.items():
+            document = docs_by_id.get(doc_id)
+            version = None
+            if document:
+                if document["type"] == self._project_settings_key:
+                    version = document["version"]
+                else:
+                    version = LEGACY_SETTINGS_VERSION
+
+            cache = self.project_settings_cache[project_name]
+            cache.update_from_document(document, version)
+            cache.update_revision(revisions[project_name])
+
+    def get_projects_settings_overrides(self, project_names):
+        """Studio overrides of project settings for multiple projects.
+
+        Args:
+            project_names(Iterable[str]): Names of projects.
+
+        Returns:
+            dict: Overrides of each project by project name.
+        """
+        project_names = list(project_names)
+        self._update_projects_settings_caches(project_names)
+        output = {}
+        for project_name in project_names:
+            if project_name:
+                output[project_name] = self._get_project_settings_overrides(
+                    project_name, False
+                )
+            else:
+                output[project_name] = {}
+        return output
+
+    def get_projects_settings_revisions(self, project_names):
+        """Revisions of project settings overrides of multiple projects.
+
+        Outdated caches of all projects are updated at once.
+        """
+        project_names = list(project_names)
+        self._update_projects_settings_caches(project_names)
+        return {
+            project_name: self.get_project_settings_revision(project_name)
+            for project_name in project_names
+        }
+
+    def get_project_settings_revision(self, project_name):
+        """Revision of studio and project overrides of project settings.
+
+        Revision is based on identifiers of cached data which change only
+        when data are reloaded from database. Revisions of documents are
+        validated only when cached data are outdated.
+        """
+        revision = [self._update_project_settings_cache(None).data_id]
+        if project_name:
+            revision.append(
+                self._update_project_settings_cache(project_name).data_id
+            )
+        return tuple(revision)
+
     def project_doc_to_anatomy_data(self, project_doc):
         """Convert project document to anatomy data.
 
@@ -1419,19 +1722,42 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             {
                 "type": LOCAL_SETTING_KEY,
                 "site_id": self.local_site_id,
-                "data": self.local_settings_cache.data
+                "data": self.local_settings_cache.data,
+                "revision": self.local_settings_cache.create_revision()
             },
             upsert=True
         )
 
+    def _update_local_settings_cache(self):
+        cache = self.local_settings_cache
+        if not cache.is_outdated:
+            return cache
+
+        doc_filter = {
+            "type": LOCAL_SETTING_KEY,
+            "site_id": self.local_site_id
+        }
+        revision_doc = self.collection.find_one(
+            doc_filter, {"_id": True, "revision": True}
+        )
+        revision = ""
+        if revision_doc:
+            revision = revision_doc.get("revision")
+            if revision is not None:
+                revision = (str(revision_doc["_id"]), revision)
+
+        if revision is None or cache.revision != revision:
+            cache.update_from_document(self.collection.find_one(doc_filter))
+        cache.update_revision(revision)
+        return cache
+
     def get_local_settings(self):
         """Local settings for local site id."""
-        if self.local_settings_cache.is_outdated:
-            document = self.collection.find_one({
-                "type": LOCAL_SETTING_KEY,
-                "site_id": self.local_site_id
-            })
+        return self._update_local_settings_cache().data_copy()
 
-            self.local_settings_cache.update_from_document(document)
-
-        return self.local_settings_cache.data_copy()
+    def get_local_settings_revision(self):
+        """Revision of local settings for local site id."""
+        return (
+            self.local_site_id,
+            self._update_local_settings_cache().data_id
+        )
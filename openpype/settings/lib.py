@@ -4,6 +4,9 @@ import functools
 import logging
 import platform
 import copy
+
+import pymongo
+
 from .exceptions import (
     SaveWarningExc
 )
@@ -40,6 +43,19 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Cache of calculated project settings
+_PROJECT_SETTINGS_CACHE = {}
+
+
+def _invalidate_mongo_client():
+    """Force validation of mongo connection after connection error.
+
+    'AutoReconnect' is raised also on server selection timeout.
+    """
+    from openpype.lib import OpenPypeMongoConnection
+
+    OpenPypeMongoConnection.invalidate_client()
+
 
 def require_handler(func):
     @functools.wraps(func)
@@ -47,7 +63,13 @@ def require_handler(func):
         global _SETTINGS_HANDLER
         if _SETTINGS_HANDLER is None:
             _SETTINGS_HANDLER = create_settings_handler()
-        return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        except pymongo.errors.AutoReconnect:
+            # Handler is recreated with validated connection on next call
+            _SETTINGS_HANDLER = None
+            _invalidate_mongo_client()
+            raise
     return wrapper
 
 
@@ -57,7 +79,12 @@ def require_local_handler(func):
         global _LOCAL_SETTINGS_HANDLER
         if _LOCAL_SETTINGS_HANDLER is None:
             _LOCAL_SETTINGS_HANDLER = create_local_settings_handler()
-        return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        except pymongo.errors.AutoReconnect:
+            _LOCAL_SETTINGS_HANDLER = None
+            _invalidate_mongo_client()
+            raise
     return wrapper
 
 
@@ -298,6 +325,21 @@ def get_project_anatomy_overrides(project_name):
     return _SETTINGS_HANDLER.get_project_anatomy_overrides(project_name)
 
 
+@require_handler
+def get_project_settings_revision(project_name):
+    return _SETTINGS_HANDLER.get_project_settings_revision(project_name)
+
+
+@require_handler
+def get_projects_settings_overrides(project_names):
+    return _SETTINGS_HANDLER.get_projects_settings_overrides(project_names)
+
+
+@require_handler
+def get_projects_settings_revisions(project_names):
+    return _SETTINGS_HANDLER.get_projects_settings_revisions(project_names)
+
+
 @require_handler
 def get_studio_system_settings_overrides_for_version(version):
     return (
@@ -425,6 +467,11 @@ def get_local_settings():
     return _LOCAL_SETTINGS_HANDLER.get_local_settings()
 
 
+@require_local_handler
+def get_local_settings_revision():
+    return _LOCAL_SETTINGS_HANDLER.get_local_settings_revision()
+
+
 class DuplicatedEnvGroups(Exception):
     def __init__(self, duplicated):
         self.origin_duplicated = duplicated
@@ -452,6 +499,7 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    _PROJECT_SETTINGS_CACHE.clear()
 
 
 def _get_default_settings():
@@ -1000,20 +1048,250 @@ def get_anatomy_settings(
     return result
 
 
+def _readonly_error(*args, **kwargs):
+    raise TypeError((
+        "Cached settings are read-only."
+        " Use 'copy.deepcopy' to get modifiable copy."
+    ))
+
+
+class ReadOnlySettingsDict(dict):
+    """Dictionary of settings which can't be modified.
+
+    Copy or deepcopy of the object returns modifiable dictionary.
+    """
+    __setitem__ = __delitem__ = _readonly_error
+    clear = pop = popitem = setdefault = update = _readonly_error
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {
+            key: copy.deepcopy(value, memo)
+            for key, value in self.items()
+        }
+
+    def __reduce__(self):
+        return (dict, (dict(self), ))
+
+
+class ReadOnlySettingsList(list):
+    """List of settings values which can't be modified.
+
+    Copy or deepcopy of the object returns modifiable list.
+    """
+    __setitem__ = __delitem__ = __setslice__ = __delslice__ = _readonly_error
+    __iadd__ = __imul__ = _readonly_error
+    append = extend = insert = pop = remove = _readonly_error
+    reverse = sort = clear = _readonly_error
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (list, (list(self), ))
+
+
+def _to_readonly_settings(value):
+    if isinstance(value, dict):
+        return ReadOnlySettingsDict(
+            (key, _to_readonly_settings(subvalue))
+            for key, subvalue in value.items()
+        )
+    if isinstance(value, list):
+        return ReadOnlySettingsList(
+            _to_readonly_settings(item)
+            for item in value
+        )
+    return value
+
+
+def _get_project_settings_cache_revision(revision, exclude_locals):
+    """Revision of all sources of project settings.
+
+    Revision of local settings contains local site id so cached settings
+    are not shared across sites.
+
+    Args:
+        revision (Hashable): Revision of project settings overrides.
+        exclude_locals (bool): Local settings are not applied.
+
+    Returns:
+        Union[tuple, None]: Revision or None if revision of any source can't
+            be determined.
+    """
+    if revision is None:
+        return None
+
+    local_revision = None
+    if not exclude_locals:
+        local_revision = get_local_settings_revision()
+        if local_revision is None:
+            return None
+    return revision, local_revision
+
+
 def get_project_settings(
-    project_name, clear_metadata=True, exclude_locals=None
+    project_name, clear_metadata=True, exclude_locals=None, readonly=False
 ):
-    """Project settings with applied studio and project overrides."""
+    """Project settings with applied studio and project overrides.
+
+    Calculated settings are cached for the process. Cache is validated
+    with revision of studio overrides, project overrides and local settings
+    so settings are calculated again only when any of them changed.
+
+    Args:
+        project_name (str): Name of project.
+        clear_metadata (bool): Remove metadata of overrides.
+        exclude_locals (bool): Do not apply local settings. Default value
+            is based on `clear_metadata`.
+        readonly (bool): Return cached settings shared with other callers
+            which can't be modified. Faster if settings are only read.
+            Modifiable copy is returned otherwise.
+
+    Returns:
+        dict: Project settings.
+    """
     if not project_name:
         raise ValueError(
             "Must enter project name."
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    cache_key = (project_name, clear_metadata, exclude_locals)
+    revision = _get_project_settings_cache_revision(
+        get_project_settings_revision(project_name), exclude_locals
     )
+    result = _get_cached_project_settings(cache_key, revision)
+    if result is None:
+        result = _to_readonly_settings(_calculate_project_settings(
+            project_name, clear_metadata, exclude_locals
+        ))
+        _set_cached_project_settings(cache_key, revision, result)
+
+    if readonly:
+        return result
+    return copy.deepcopy(result)
+
+
+def get_projects_settings(
+    project_names, clear_metadata=True, exclude_locals=None, readonly=False
+):
+    """Project settings of multiple projects.
+
+    Overrides of all projects are loaded at once and are applied on the
+    same studio overrides. Much faster than calling `get_project_settings`
+    for each project when settings of many projects are needed.
+
+    Args:
+        project_names (Iterable[str]): Names of projects.
+        clear_metadata (bool): Remove metadata of overrides.
+        exclude_locals (bool): Do not apply local settings. Default value
+            is based on `clear_metadata`.
+        readonly (bool): Return cached settings shared with other callers
+            which can't be modified.
+
+    Returns:
+        dict: Project settings by project name.
+    """
+    project_names = list(project_names)
+    if not all(project_names):
+        raise ValueError(
+            "Must enter project names."
+            " Call `get_default_project_settings` to get project defaults."
+        )
+
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    output = {}
+    revisions = {}
+    missing_project_names = []
+    revisions_by_project = get_projects_settings_revisions(project_names)
+    for project_name in project_names:
+        cache_key = (project_name, clear_metadata, exclude_locals)
+        revision = _get_project_settings_cache_revision(
+            revisions_by_project.get(project_name), exclude_locals
+        )
+        result = _get_cached_project_settings(cache_key, revision)
+        if result is None:
+            revisions[project_name] = revision
+            missing_project_names.append(project_name)
+        else:
+            output[project_name] = result
+
+    if missing_project_names:
+        studio_overrides = get_default_project_settings(False)
+        local_settings = None
+        if not exclude_locals:
+            local_settings = get_local_settings()
+
+        overrides_by_project = get_projects_settings_overrides(
+            missing_project_names
+        )
+        for project_name in missing_project_names:
+            result = _to_readonly_settings(_calculate_project_settings(
+                project_name,
+                clear_metadata,
+                exclude_locals,
+                studio_overrides,
+                overrides_by_project.get(project_name),
+                local_settings
+            ))
+            cache_key = (project_name, clear_metadata, exclude_locals)
+            _set_cached_project_settings(
+                cache_key, revisions[project_name], result
+            )
+            output[project_name] = result
+
+    if readonly:
+        return output
+    return {
+        project_name: copy.deepcopy(result)
+        for project_name, result in output.items()
+    }
+
+
+def _get_cached_project_settings(cache_key, revision):
+    if revision is None:
+        return None
+    cache_item = _PROJECT_SETTINGS_CACHE.get(cache_key)
+    if cache_item is None or cache_item[0] != revision:
+        return None
+    return cache_item[1]
+
+
+def _set_cached_project_settings(cache_key, revision, result):
+    if revision is not None:
+        _PROJECT_SETTINGS_CACHE[cache_key] = (revision, result)
+
+
+def _calculate_project_settings(
+    project_name,
+    clear_metadata,
+    exclude_locals,
+    studio_overrides=None,
+    project_overrides=None,
+    local_settings=None
+):
+    if studio_overrides is None:
+        studio_overrides = get_default_project_settings(False)
+
+    if project_overrides is None:
+        project_overrides = get_project_settings_overrides(
+            project_name
+        )
+
+    if not project_overrides:
+        # Studio overrides may be shared across projects
+        studio_overrides = copy.deepcopy(studio_overrides)
 
     result = apply_overrides(studio_overrides, project_overrides)
 
@@ -1022,11 +1300,9 @@ def get_project_settings(
         clear_metadata_from_settings(result)
 
     # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
-        local_settings = get_local_settings()
+        if local_settings is None:
+            local_settings = get_local_settings()
         apply_local_settings_on_project_settings(
             result, local_settings, project_name
         )
@@ -1081,9 +1357,35 @@ def get_general_environments():
 
     clear_metadata_from_settings(environments)
 
+    mongo_connection = result["general"].get("mongo_connection")
+    if mongo_connection:
+        environments.update(
+            _get_mongo_connection_environments(mongo_connection)
+        )
+
     return environments
 
 
+def _get_mongo_connection_environments(mongo_connection):
+    """Convert mongo connection settings to environments.
+
+    Mongo connection can't be configured from settings directly because
+    settings are loaded using the connection.
+    """
+    env_keys = {
+        "health_check_interval": "OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL",
+        "max_pool_size": "OPENPYPE_MONGO_MAX_POOL_SIZE",
+        "min_pool_size": "OPENPYPE_MONGO_MIN_POOL_SIZE",
+        "max_idle_time": "OPENPYPE_MONGO_MAX_IDLE_TIME_MS"
+    }
+    output = {}
+    for key, env_key in env_keys.items():
+        value = mongo_connection.get(key)
+        if value is not None:
+            output[env_key] = str(value)
+    return output
+
+
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
     if isinstance(values, dict):
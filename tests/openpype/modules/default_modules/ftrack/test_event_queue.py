@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""Test suite for mongo queue of ftrack events.
+
+Uses in-memory stand-in of mongo collection which counts database
+round-trips and synthetic ftrack events.
+"""
+import os
+import datetime
+import itertools
+import importlib.util
+
+import pytest
+
+import openpype
+
+
+def _load_event_queue_module():
+    # Module is loaded by path because importing through 'openpype_modules'
+    #   requires 'load_modules' which reads system settings from database
+    module_path = os.path.join(
+        os.path.dirname(openpype.__file__),
+        "modules", "default_modules", "ftrack", "ftrack_server",
+        "event_queue.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "ftrack_event_queue", module_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+MongoEventQueue = _load_event_queue_module().MongoEventQueue
+
+
+class FakeCursor(object):
+    def __init__(self, documents):
+        self._documents = documents
+
+    def sort(self, sort_items):
+        for key, direction in reversed(sort_items):
+            self._documents.sort(
+                key=lambda doc: doc["pype_data"]["stored"],
+                reverse=direction < 0
+            )
+        return self
+
+    def limit(self, limit):
+        self._documents = self._documents[:limit]
+        return self
+
+    def __iter__(self):
+        return iter(self._documents)
+
+
+class FakeCollection(object):
+    """Stand-in of mongo collection supporting queries of event queue."""
+
+    def __init__(self):
+        self.documents = {}
+        self.calls = {
+            "find": 0, "update_many": 0, "delete_many": 0, "replace_one": 0
+        }
+        self._ids = itertools.count()
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def replace_one(self, query, document, upsert=False):
+        self.calls["replace_one"] += 1
+        document = dict(document)
+        document["_id"] = next(self._ids)
+        self.documents[document["_id"]] = document
+
+    def find(self, query):
+        self.calls["find"] += 1
+        is_processed = query["pype_data.is_processed"]
+        exclude_ids = query.get("_id", {}).get("$nin") or []
+        return FakeCursor([
+            doc for doc in self.documents.values()
+            if doc["pype_data"]["is_processed"] is is_processed
+            and doc["_id"] not in exclude_ids
+        ])
+
+    def update_many(self, query, update):
+        self.calls["update_many"] += 1
+        for mongo_id in query["_id"]["$in"]:
+            self.documents[mongo_id]["pype_data"].update({
+                "is_processed": update["$set"]["pype_data.is_processed"]
+            })
+
+    def delete_many(self, query):
+        self.calls["delete_many"] += 1
+        limit_date = query["pype_data.stored"]["$lte"]
+        for mongo_id, doc in tuple(self.documents.items()):
+            if (
+                doc["pype_data"]["is_processed"]
+                and doc["pype_data"]["stored"] <= limit_date
+            ):
+                self.documents.pop(mongo_id)
+
+
+def _synthetic_event(idx):
+    return {
+        "id": "event_{}".format(idx),
+        "topic": "ftrack.update",
+        "data": {"entities": [{"entityId": str(idx), "action": "update"}]}
+    }
+
+
+@pytest.fixture
+def event_queue():
+    event_queue = MongoEventQueue(FakeCollection())
+    # do not depend on speed of machine
+    event_queue.ack_interval = 3600
+    return event_queue
+
+
+def test_events_are_processed_in_bulk(event_queue):
+    collection = event_queue.collection
+    event_count = 1000
+    for idx in range(event_count):
+        event_queue.store(_synthetic_event(idx))
+
+    processed = []
+    while True:
+        event_queue.cleanup()
+        documents = event_queue.fetch()
+        if not documents:
+            break
+        for document in documents:
+            processed.append(document["id"])
+            event_queue.ack(document["_id"])
+
+    # each event processed once in order of storing
+    assert processed == [
+        "event_{}".format(idx) for idx in range(event_count)
+    ]
+    batch_count = event_count // event_queue.fetch_batch_size
+    assert collection.calls["find"] == batch_count + 1
+    assert collection.calls["update_many"] == (
+        event_count // event_queue.ack_batch_size
+    )
+    assert collection.calls["delete_many"] == 1
+
+
+def test_cleanup_removes_old_processed_events(event_queue):
+    collection = event_queue.collection
+    for idx in range(3):
+        event_queue.store(_synthetic_event(idx))
+
+    old_date = datetime.datetime.utcnow() - datetime.timedelta(days=10)
+    for document in collection.documents.values():
+        document["pype_data"]["stored"] = old_date
+
+    documents = event_queue.fetch()
+    event_queue.ack(documents[0]["_id"])
+    event_queue.flush_acks()
+    event_queue.cleanup(force=True)
+
+    assert len(collection.documents) == 2
+
+
+def test_fetch_skips_events_in_progress(event_queue):
+    for idx in range(3):
+        event_queue.store(_synthetic_event(idx))
+
+    in_progress = {
+        document["_id"] for document in event_queue.fetch()[:2]
+    }
+    documents = event_queue.fetch(in_progress)
+
+    assert [document["id"] for document in documents] == ["event_2"]
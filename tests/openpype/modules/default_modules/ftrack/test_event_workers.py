@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Test suite for concurrent handling of ftrack events by workers.
+
+Workers are not started, events submitted to a worker are only queued.
+"""
+import os
+import queue
+import threading
+
+import pytest
+
+from openpype.lib.mongo import validate_mongo_connection
+from openpype.modules import load_modules
+
+
+def _is_settings_db_available():
+    mongo_url = os.environ.get("OPENPYPE_MONGO")
+    if not mongo_url:
+        return False
+    try:
+        validate_mongo_connection(mongo_url)
+    except Exception:
+        return False
+    return True
+
+
+# Loading of modules reads system settings from database
+if not _is_settings_db_available():
+    pytest.skip(
+        "Settings database is not available.", allow_module_level=True
+    )
+
+load_modules()
+
+from openpype_modules.ftrack.ftrack_server import (  # noqa: E402
+    event_workers
+)
+
+
+class FakeWorker(object):
+    def __init__(self):
+        self.events = queue.Queue()
+
+
+class FakeEventHub(object):
+    def __init__(self, publish_lock):
+        self.publish_lock = publish_lock
+        self.published = []
+
+    def publish(self, event, synchronous=False, on_reply=None,
+                on_error="raise"):
+        # Lock of workers must be held during publishing
+        assert not self.publish_lock.acquire(False)
+        self.published.append((event, synchronous, on_reply, on_error))
+        return "published"
+
+
+def _event(project_id, entity_id="entity"):
+    return {
+        "topic": "ftrack.update",
+        "data": {"entities": [{
+            "entityId": entity_id,
+            "entityType": "task",
+            "parents": [
+                {"entityId": entity_id, "entityType": "task"},
+                {"entityId": project_id, "entityType": "show"}
+            ]
+        }]}
+    }
+
+
+def test_partition_key():
+    get_event_partition_key = event_workers.get_event_partition_key
+    assert get_event_partition_key(_event("project_a")) == "project_a"
+
+    project_event = {"data": {"entities": [
+        {"entityId": "project_b", "entityType": "show", "parents": []}
+    ]}}
+    assert get_event_partition_key(project_event) == "project_b"
+
+    entity_event = {"data": {"entities": [
+        {"entityId": "user_id", "entityType": "user"}
+    ]}}
+    assert get_event_partition_key(entity_event) == "user_id"
+
+    topic_event = {"topic": "openpype.custom", "data": {}}
+    assert get_event_partition_key(topic_event) == "openpype.custom"
+
+
+@pytest.fixture
+def worker_pool():
+    worker_pool = event_workers.EventWorkerPool(None, 2, None)
+    worker_pool._workers = [FakeWorker(), FakeWorker()]
+    return worker_pool
+
+
+def _get_worker_keys(worker):
+    keys = []
+    while not worker.events.empty():
+        key, _ = worker.events.get_nowait()
+        keys.append(key)
+    return keys
+
+
+def test_project_events_stay_on_worker(worker_pool):
+    worker_a, worker_b = worker_pool._workers
+    for _ in range(3):
+        worker_pool.submit(_event("project_a"))
+    # Less busy worker is used for other project
+    worker_pool.submit(_event("project_b"))
+    assert _get_worker_keys(worker_a) == ["project_a"] * 3
+    assert _get_worker_keys(worker_b) == ["project_b"]
+
+    # Worker keeps the project until all its events are handled
+    worker_pool._on_event_done("project_a", _event("project_a"))
+    worker_pool._on_event_done("project_a", _event("project_a"))
+    worker_a.events.put(("busy", None))
+    worker_a.events.put(("busy", None))
+    worker_pool.submit(_event("project_a"))
+    assert _get_worker_keys(worker_a) == ["busy", "busy", "project_a"]
+    assert worker_b.events.empty()
+
+    # Project is released when its last pending event is handled
+    for _ in range(2):
+        worker_pool._on_event_done("project_a", _event("project_a"))
+    assert "project_a" not in worker_pool._workers_by_key
+    assert len(worker_pool.get_done_events()) == 4
+
+    worker_a.events.put(("busy", None))
+    worker_pool.submit(_event("project_a"))
+    assert _get_worker_keys(worker_b) == ["project_a"]
+
+
+def test_worker_hub_publishes_with_main_hub():
+    publish_lock = threading.Lock()
+    main_event_hub = FakeEventHub(publish_lock)
+    event_hub = event_workers.WorkerEventHub(
+        "https://ftrack.example.com", "user", "api_key",
+        main_event_hub=main_event_hub,
+        publish_lock=publish_lock
+    )
+    event = {"topic": "openpype.test"}
+
+    assert event_hub.publish(event, on_error="ignore") == "published"
+    assert main_event_hub.published == [(event, False, None, "ignore")]
+    assert publish_lock.acquire(False)
+    publish_lock.release()
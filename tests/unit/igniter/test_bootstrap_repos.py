@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test suite for repos bootstrapping (install)."""
 import os
+import platform
 import sys
 from collections import namedtuple
 from pathlib import Path
@@ -12,6 +13,7 @@ import pytest
 
 from igniter.bootstrap_repos import BootstrapRepos
 from igniter.bootstrap_repos import OpenPypeVersion
+from igniter.bootstrap_repos import sha256sum
 from igniter.user_settings import OpenPypeSettingsRegistry
 
 
@@ -388,3 +390,58 @@ def test_find_openpype(fix_bootstrap, tmp_path_factory, monkeypatch, printer):
     )
     assert result[-1].path == expected_path, ("not a latest version of "
                                               "OpenPype 4")
+
+
+def _create_version_dir(version_dir):
+    version_dir.mkdir()
+    (version_dir / "openpype").mkdir()
+    checksums = []
+    for name in ("LICENSE", "openpype/version.py"):
+        (version_dir / name).write_text(name)
+        checksums.append(
+            "{}:{}".format(sha256sum((version_dir / name).as_posix()), name))
+    (version_dir / "checksums").write_text("\n".join(checksums) + "\n")
+
+
+def test_validate_dir_is_cached(tmp_path, printer):
+    version_dir = tmp_path / "openpype-v3.0.0"
+    _create_version_dir(version_dir)
+
+    printer("testing full validation of version directory ...")
+    assert BootstrapRepos._validate_dir(version_dir) == (True, "All ok")
+
+    printer("testing cached validation of unchanged directory ...")
+    assert BootstrapRepos._validate_dir(version_dir) == (
+        True, "All ok (cached)")
+
+    printer("testing changed file invalidates cache ...")
+    (version_dir / "openpype" / "version.py").write_text("changed")
+    result = BootstrapRepos._validate_dir(version_dir)
+    assert not result[0], "changed file was not detected"
+
+
+def test_validate_zip_is_cached(tmp_path, printer):
+    version_dir = tmp_path / "openpype-v3.0.0"
+    _create_version_dir(version_dir)
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    with ZipFile(zip_path, "w") as zip_file:
+        for name in ("checksums", "LICENSE", "openpype/version.py"):
+            zip_file.write(version_dir / name, name)
+
+    printer("testing zip validation is cached ...")
+    assert BootstrapRepos._validate_zip(zip_path) == (True, "All ok")
+    assert BootstrapRepos._validate_zip(zip_path) == (
+        True, "All ok (cached)")
+
+
+def test_validate_zip_on_windows(tmp_path, printer, monkeypatch):
+    version_dir = tmp_path / "openpype-v3.0.0"
+    _create_version_dir(version_dir)
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    with ZipFile(zip_path, "w") as zip_file:
+        for name in ("checksums", "LICENSE", "openpype/version.py"):
+            zip_file.write(version_dir / name, name)
+
+    printer("testing zip members in subfolders are found on windows ...")
+    monkeypatch.setattr(platform, "system", lambda: "Windows")
+    assert BootstrapRepos._validate_zip(zip_path) == (True, "All ok")
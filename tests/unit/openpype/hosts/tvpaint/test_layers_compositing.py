@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Test suite for compositing of layers rendered from TVPaint."""
+import os
+
+import pytest
+from PIL import Image
+
+from openpype.hosts.tvpaint import lib
+
+SIZE = (8, 8)
+LAYERS_DATA = [
+    {"position": 0, "layer_id": 1},
+    {"position": 1, "layer_id": 2},
+    {"position": 2, "layer_id": 3},
+]
+
+
+def _create_image(path, color):
+    Image.new("RGBA", SIZE, color).save(path)
+    return path
+
+
+def _link(src_path, dst_path):
+    os.link(src_path, dst_path)
+    return dst_path
+
+
+def _read_image(path):
+    return Image.open(path).convert("RGBA").tobytes()
+
+
+def _expected_image(paths):
+    result = None
+    for path in paths:
+        img_obj = Image.open(path).convert("RGBA")
+        if result is None:
+            result = img_obj
+        else:
+            result = Image.alpha_composite(result, img_obj)
+    return result.tobytes()
+
+
+@pytest.fixture
+def render_dir(tmpdir):
+    return str(tmpdir.mkdir("render"))
+
+
+@pytest.fixture
+def output_paths(tmpdir):
+    output_dir = str(tmpdir.mkdir("output"))
+    return {
+        frame: os.path.join(output_dir, "out.{}.png".format(frame))
+        for frame in range(1, 5)
+    }
+
+
+@pytest.fixture
+def compositor_calls(monkeypatch):
+    calls = {"composite": [], "open": []}
+    composite = lib._LayersCompositor.composite
+    open_rgba_image = lib._open_rgba_image
+
+    def _composite(self, src_items, output_filepath):
+        calls["composite"].append(output_filepath)
+        return composite(self, src_items, output_filepath)
+
+    def _open_rgba(filepath):
+        calls["open"].append(filepath)
+        return open_rgba_image(filepath)
+
+    monkeypatch.setattr(lib._LayersCompositor, "composite", _composite)
+    monkeypatch.setattr(lib, "_open_rgba_image", _open_rgba)
+    return calls
+
+
+def test_held_frames_are_composited_once(
+    render_dir, output_paths, compositor_calls
+):
+    filepaths_by_layer_id = {}
+    for layer_id, color in ((1, (255, 0, 0, 255)), (2, (0, 0, 255, 128))):
+        first_path = _create_image(
+            os.path.join(render_dir, "{}.1.png".format(layer_id)), color
+        )
+        filepaths_by_layer_id[layer_id] = {1: first_path}
+        for frame in range(2, 5):
+            filepaths_by_layer_id[layer_id][frame] = _link(
+                first_path,
+                os.path.join(render_dir, "{}.{}.png".format(layer_id, frame))
+            )
+
+    lib.composite_rendered_layers(
+        LAYERS_DATA[:2], filepaths_by_layer_id, 1, 4, output_paths,
+        cleanup=False, workers=2
+    )
+
+    assert compositor_calls["composite"] == [output_paths[1]]
+    expected = _expected_image([
+        filepaths_by_layer_id[1][1], filepaths_by_layer_id[2][1]
+    ])
+    first_stat = os.stat(output_paths[1])
+    for frame in range(1, 5):
+        assert _read_image(output_paths[frame]) == expected
+        stat = os.stat(output_paths[frame])
+        assert (stat.st_dev, stat.st_ino) == (
+            first_stat.st_dev, first_stat.st_ino
+        )
+
+
+def test_partial_results_are_reused(
+    render_dir, output_paths, compositor_calls
+):
+    filepaths_by_layer_id = {1: {}, 2: {}, 3: {}}
+    bottom_path = _create_image(
+        os.path.join(render_dir, "1.1.png"), (255, 0, 0, 255)
+    )
+    middle_path = _create_image(
+        os.path.join(render_dir, "2.1.png"), (0, 255, 0, 100)
+    )
+    for frame in range(1, 5):
+        if frame == 1:
+            filepaths_by_layer_id[1][frame] = bottom_path
+            filepaths_by_layer_id[2][frame] = middle_path
+        else:
+            filepaths_by_layer_id[1][frame] = _link(
+                bottom_path, os.path.join(render_dir, "1.{}.png".format(frame))
+            )
+            filepaths_by_layer_id[2][frame] = _link(
+                middle_path, os.path.join(render_dir, "2.{}.png".format(frame))
+            )
+        filepaths_by_layer_id[3][frame] = _create_image(
+            os.path.join(render_dir, "3.{}.png".format(frame)),
+            (0, 0, 60 * frame, 50 * frame)
+        )
+
+    lib.composite_rendered_layers(
+        LAYERS_DATA, filepaths_by_layer_id, 1, 4, output_paths,
+        cleanup=False, workers=1
+    )
+
+    # Images of layers which did not change are opened only once
+    assert len(compositor_calls["composite"]) == 4
+    assert len(compositor_calls["open"]) == 2 + 4
+    for frame in range(1, 5):
+        assert _read_image(output_paths[frame]) == _expected_image([
+            filepaths_by_layer_id[layer_id][frame]
+            for layer_id in (1, 2, 3)
+        ])
+
+
+def test_cleanup_renames_single_sources(render_dir, output_paths):
+    bottom_path = _create_image(
+        os.path.join(render_dir, "1.1.png"), (255, 0, 0, 255)
+    )
+    top_path = _create_image(
+        os.path.join(render_dir, "2.1.png"), (0, 0, 255, 128)
+    )
+    single_path = _create_image(
+        os.path.join(render_dir, "1.2.png"), (0, 255, 0, 255)
+    )
+    filepaths_by_layer_id = {
+        1: {1: bottom_path, 2: single_path, 3: None, 4: None},
+        2: {1: top_path, 2: None, 3: None, 4: None},
+    }
+    expected_composite = _expected_image([bottom_path, top_path])
+    expected_single = _read_image(single_path)
+
+    lib.composite_rendered_layers(
+        LAYERS_DATA[:2], filepaths_by_layer_id, 1, 4, output_paths,
+        cleanup=True
+    )
+
+    assert _read_image(output_paths[1]) == expected_composite
+    assert _read_image(output_paths[2]) == expected_single
+    transparent = Image.new("RGBA", SIZE, (0, 0, 0, 0)).tobytes()
+    for frame in (3, 4):
+        assert _read_image(output_paths[frame]) == transparent
+    # All rendered layer files were moved or removed
+    assert not os.listdir(render_dir)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Test suite for Anatomy templates formatting."""
+import copy
+
+import pytest
+
+from openpype.lib.anatomy import (
+    Templates,
+    CompiledTemplate,
+    TemplateUnsolved
+)
+
+TEMPLATES = {
+    "version_padding": 3,
+    "version": "v{version:0>{@version_padding}}",
+    "frame_padding": 4,
+    "frame": "{frame:0>{@frame_padding}}",
+    "work": {
+        "folder": (
+            "{root[work]}/{project[name]}/{hierarchy}/{asset}/work/{task}"
+        ),
+        "file": "{project[code]}_{asset}_{task}_{@version}<_{comment}>.{ext}",
+        "path": "{@folder}/{@file}"
+    },
+    "publish": {
+        "folder": (
+            "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish"
+            "/{family}/{subset}/{@version}"
+        ),
+        "file": (
+            "{project[code]}_{asset}_{subset}_{@version}"
+            "<_{output}><.{@frame}>.{ext}"
+        ),
+        "path": "{@folder}/{@file}"
+    },
+    "others": {}
+}
+
+
+class FakeAnatomy(object):
+    project_name = "test_project"
+    roots = {"work": "/mnt/work"}
+
+    def __getitem__(self, key):
+        return copy.deepcopy({"templates": TEMPLATES}[key])
+
+
+@pytest.fixture
+def templates():
+    yield Templates(FakeAnatomy())
+
+
+@pytest.fixture
+def data():
+    yield {
+        "project": {"name": "test_project", "code": "tp"},
+        "hierarchy": "seq/sh010",
+        "asset": "sh010",
+        "task": "comp",
+        "version": 3,
+        "subset": "renderMain",
+        "family": "render",
+        "ext": "exr",
+        "frame": 12
+    }
+
+
+def _result_values(result):
+    return (
+        str(result), result.template, result.solved, result.rootless,
+        result.used_values, sorted(result.missing_keys), result.invalid_types
+    )
+
+
+def test_compiled_matches_string_format(templates, data):
+    for template in (
+        templates.templates["publish"]["path"],
+        templates.templates["work"]["path"].replace(
+            "{task}", "{task[name]}"
+        ),
+    ):
+        expected = templates._format(template, dict(data))
+        result = templates._format(CompiledTemplate(template), dict(data))
+        assert _result_values(result) == _result_values(expected)
+
+
+def test_format_does_not_modify_input(templates, data):
+    orig_data = copy.deepcopy(data)
+    filled = templates.format(data)
+
+    assert data == orig_data
+    assert filled["publish"]["path"] == (
+        "/mnt/work/test_project/seq/sh010/sh010/publish/render/renderMain"
+        "/v003/tp_sh010_renderMain_v003.0012.exr"
+    )
+    assert filled["work"]["file"] == "tp_sh010_comp_v003.exr"
+
+
+def test_compiled_templates_are_reused(templates, data):
+    compiled = templates.compiled_templates
+    templates.format(data)
+    assert templates.compiled_templates is compiled
+
+    templates.reset()
+    assert templates.compiled_templates is not compiled
+
+
+def test_unsolved_template_raises(templates, data):
+    data.pop("ext")
+    filled = templates.format(data)
+    with pytest.raises(TemplateUnsolved):
+        filled["publish"]["path"]
+
+    filled_all = templates.format_all(data)
+    assert not filled_all["publish"]["path"].solved
+    assert "ext" in filled_all["publish"]["path"].missing_keys
+
+
+def test_lazy_format_solves_only_accessed(templates, data):
+    filled = templates.format(data, lazy=True)
+    publish = filled["publish"]
+    assert isinstance(dict.get(publish, "path"), CompiledTemplate)
+    assert isinstance(dict.get(filled["work"], "path"), CompiledTemplate)
+
+    path = publish["path"]
+    assert path is publish["path"]
+    assert isinstance(dict.get(filled["work"], "path"), CompiledTemplate)
+
+    eager = templates.format(data)
+    assert _result_values(path) == _result_values(eager["publish"]["path"])
+    filled.solve_all()
+    for key in ("folder", "file", "path"):
+        assert (
+            _result_values(filled["work"][key])
+            == _result_values(eager["work"][key])
+        )
+
+
+def test_format_batch_matches_per_frame_format(templates, data):
+    frames = [1001, 1002, 1010]
+    batch = templates.format_batch(data, frames)
+    batch_result = batch["publish"]["path"]
+    assert batch_result.frames == frames
+    for frame, path, rootless_path in zip(
+        frames, batch_result.paths, batch_result.rootless_paths
+    ):
+        frame_data = dict(data)
+        frame_data["frame"] = frame
+        expected = templates.format(frame_data)["publish"]["path"]
+        assert path == expected
+        assert rootless_path == expected.rootless
+
+    frame_data = dict(data)
+    frame_data["frame"] = frames[0]
+    expected = templates.format(frame_data)["publish"]["path"]
+    assert _result_values(batch_result) == _result_values(expected)
+
+    # Template without frame key
+    work_file = batch["work"]["file"]
+    assert work_file.paths == [str(work_file)] * len(frames)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Test suite for content hashing of files."""
+import os
+
+from openpype.lib import file_hash
+from openpype.lib.file_hash import (
+    FileHashCache,
+    content_hash,
+    content_hashes,
+    validate_file_content
+)
+from openpype.lib.plugin_tools import source_hash
+
+
+def _write(path, content):
+    with open(path, "wb") as stream:
+        stream.write(content)
+
+
+def test_content_hash_does_not_depend_on_mtime(tmpdir):
+    filepath = str(tmpdir.join("texture.exr"))
+    _write(filepath, b"content")
+    first_hash = source_hash(filepath, content=True)
+
+    stat_result = os.stat(filepath)
+    os.utime(filepath, (stat_result.st_atime, stat_result.st_mtime + 100))
+    assert source_hash(filepath, content=True) == first_hash
+    assert source_hash(filepath) != first_hash
+
+    assert validate_file_content(filepath, first_hash)
+    _write(filepath, b"changed")
+    assert not validate_file_content(filepath, first_hash)
+    assert validate_file_content(filepath, source_hash(filepath)) is None
+
+
+def test_hash_cache(tmpdir):
+    cache_path = str(tmpdir.join("cache", "hashes.json"))
+    filepaths = []
+    for idx in range(4):
+        filepath = str(tmpdir.join("file_{}.bin".format(idx)))
+        _write(filepath, os.urandom(1024))
+        filepaths.append(filepath)
+
+    hashes = content_hashes(
+        filepaths, hash_cache=FileHashCache(cache_path), max_workers=2
+    )
+    assert os.path.exists(cache_path)
+
+    cache = FileHashCache(cache_path)
+    for filepath in filepaths:
+        assert cache.get(filepath, os.stat(filepath)) == hashes[filepath]
+
+    # Changed file is not taken from cache
+    _write(filepaths[0], b"changed")
+    assert cache.get(filepaths[0], os.stat(filepaths[0])) is None
+    assert content_hash(filepaths[0], cache) != hashes[filepaths[0]]
+
+
+def test_hash_cache_is_pruned(tmpdir, monkeypatch):
+    cache_path = str(tmpdir.join("cache", "hashes.json"))
+    filepaths = []
+    for idx in range(4):
+        filepath = str(tmpdir.join("file_{}.bin".format(idx)))
+        _write(filepath, os.urandom(1024))
+        filepaths.append(filepath)
+
+    now = [1000000.0]
+    monkeypatch.setattr(file_hash.time, "time", lambda: now[0])
+    monkeypatch.setattr(FileHashCache, "max_age", 100)
+    monkeypatch.setattr(FileHashCache, "max_items", 2)
+
+    cache = FileHashCache(cache_path)
+    content_hashes(filepaths[:1], hash_cache=cache)
+    now[0] += 50
+    content_hashes(filepaths[1:2], hash_cache=cache)
+
+    # Usage of cached hash is stored so the item is not pruned
+    now[0] += 60
+    content_hashes(filepaths[1:2], hash_cache=cache)
+    data = FileHashCache(cache_path).data
+    assert list(data.keys()) == [cache._key(filepaths[1])]
+
+    # Only most recently used items are kept
+    for filepath in filepaths[2:]:
+        now[0] += 1
+        content_hashes([filepath], hash_cache=cache)
+    data = FileHashCache(cache_path).data
+    assert set(data.keys()) == {
+        cache._key(filepath) for filepath in filepaths[2:]
+    }
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""Test suite for parallel transfers of published files."""
+import os
+import time
+import shutil
+import logging
+import threading
+import collections
+
+import pytest
+
+from openpype.lib import file_transfer
+from openpype.lib.file_transfer import (
+    FileStatCache,
+    FileTransferEngine,
+    FileTransferError
+)
+from openpype.lib.plugin_tools import source_hash
+
+log = logging.getLogger(__name__)
+
+
+def _create_file(path, content="data"):
+    dirpath = os.path.dirname(path)
+    if not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+    with open(path, "w") as stream:
+        stream.write(content)
+    return path
+
+
+@pytest.fixture
+def sources(tmpdir):
+    src_dir = str(tmpdir.mkdir("src"))
+    return [
+        _create_file(os.path.join(src_dir, "file_{}.txt".format(idx)))
+        for idx in range(8)
+    ]
+
+
+def test_concurrency_per_root(tmpdir, sources, monkeypatch):
+    roots = [str(tmpdir.join("root_a")), str(tmpdir.join("root_b"))]
+    active = collections.Counter()
+    max_active = collections.Counter()
+    lock = threading.Lock()
+
+    def copyfile(src, dst):
+        root = os.path.dirname(os.path.dirname(dst))
+        with lock:
+            active[root] += 1
+            max_active[root] = max(max_active[root], active[root])
+        time.sleep(0.05)
+        shutil.copyfile(src, dst)
+        with lock:
+            active[root] -= 1
+
+    monkeypatch.setattr(file_transfer, "copyfile", copyfile)
+
+    engine = FileTransferEngine(
+        max_workers=8, max_workers_per_root=2, roots=roots, log=log
+    )
+    for idx, src in enumerate(sources):
+        root = roots[idx % 2]
+        engine.add(src, os.path.join(root, "publish", os.path.basename(src)))
+    result = engine.process()
+
+    assert len(result) == len(sources)
+    assert set(max_active.keys()) == set(roots)
+    assert all(count <= 2 for count in max_active.values())
+
+
+def test_saturated_root_does_not_block_other_roots(
+    tmpdir, sources, monkeypatch
+):
+    roots = [str(tmpdir.join("root_a")), str(tmpdir.join("root_b"))]
+    copied = []
+    lock = threading.Lock()
+
+    def copyfile(src, dst):
+        if dst.startswith(roots[0]):
+            time.sleep(0.05)
+        shutil.copyfile(src, dst)
+        with lock:
+            copied.append(dst)
+
+    monkeypatch.setattr(file_transfer, "copyfile", copyfile)
+
+    engine = FileTransferEngine(
+        max_workers=4, max_workers_per_root=1, roots=roots, log=log
+    )
+    # Transfers to first root are added first
+    dst_paths_a = []
+    for src in sources[:6]:
+        dst_path = os.path.join(roots[0], os.path.basename(src))
+        engine.add(src, dst_path)
+        dst_paths_a.append(dst_path)
+    dst_paths_b = []
+    for src in sources[6:]:
+        dst_path = os.path.join(roots[1], os.path.basename(src))
+        engine.add(src, dst_path)
+        dst_paths_b.append(dst_path)
+    engine.process()
+
+    # Second root is not waiting for transfers to the first root
+    assert set(copied[:2]) == set(dst_paths_b)
+    assert copied[2:] == dst_paths_a
+
+
+def test_directories_created_once(tmpdir, sources, monkeypatch):
+    dst_dir = str(tmpdir.mkdir("dst"))
+    created = []
+    makedirs = os.makedirs
+
+    def _makedirs(path, *args, **kwargs):
+        created.append(path)
+        return makedirs(path, *args, **kwargs)
+
+    monkeypatch.setattr(file_transfer.os, "makedirs", _makedirs)
+
+    engine = FileTransferEngine(max_workers=4, log=log)
+    for idx, src in enumerate(sources):
+        dirname = "even" if idx % 2 == 0 else "odd"
+        engine.add(src, os.path.join(dst_dir, dirname, os.path.basename(src)))
+    engine.process()
+
+    assert sorted(created) == [
+        os.path.join(dst_dir, "even"), os.path.join(dst_dir, "odd")
+    ]
+
+
+def test_copy_size_mismatch(tmpdir, sources, monkeypatch):
+    attempts = []
+
+    def copyfile(src, dst):
+        attempts.append(dst)
+        # Simulate incomplete copy
+        _create_file(dst, "d")
+
+    monkeypatch.setattr(file_transfer, "copyfile", copyfile)
+
+    dst = str(tmpdir.join("dst", "file.txt"))
+    engine = FileTransferEngine(max_workers=1, copy_retries=2, log=log)
+    engine.add(sources[0], dst)
+    with pytest.raises(FileTransferError) as exc_info:
+        engine.process()
+
+    assert len(attempts) == 3
+    assert [item[1] for item in exc_info.value.errors] == [dst]
+    assert not exc_info.value.transferred
+
+
+def test_rollback_of_transferred_files(tmpdir, sources):
+    dst_dir = str(tmpdir.join("dst"))
+    engine = FileTransferEngine(max_workers=1, log=log)
+    dst_paths = []
+    for src in sources[:3]:
+        dst_path = os.path.join(dst_dir, os.path.basename(src))
+        engine.add(src, dst_path)
+        dst_paths.append(dst_path)
+    engine.add(
+        str(tmpdir.join("src", "missing.txt")),
+        os.path.join(dst_dir, "missing.txt")
+    )
+
+    with pytest.raises(FileTransferError) as exc_info:
+        engine.process()
+
+    transferred = exc_info.value.transferred
+    assert list(transferred.keys()) == dst_paths
+    assert all(size == len("data") for size in transferred.values())
+
+    for path in transferred:
+        os.remove(path)
+    assert not os.listdir(dst_dir)
+
+
+@pytest.fixture
+def stat_calls(monkeypatch):
+    """Count `os.stat` calls per file path."""
+    calls = collections.Counter()
+    stat = os.stat
+
+    def _stat(path, *args, **kwargs):
+        calls[os.path.normpath(str(path))] += 1
+        return stat(path, *args, **kwargs)
+
+    def copyfile(src, dst):
+        # Copy without stat-ing files so only stats of the engine are counted
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                dst_stream.write(src_stream.read())
+
+    monkeypatch.setattr(os, "stat", _stat)
+    monkeypatch.setattr(file_transfer, "copyfile", copyfile)
+    return calls
+
+
+def test_stat_shared_by_engine_and_source_hash(tmpdir, sources, stat_calls):
+    stat_cache = FileStatCache()
+    engine = FileTransferEngine(max_workers=2, stat_cache=stat_cache, log=log)
+    dst_paths = []
+    for src in sources:
+        dst_path = str(tmpdir.join("dst", os.path.basename(src)))
+        engine.add(src, dst_path)
+        dst_paths.append(dst_path)
+    engine.process()
+
+    file_hashes = [
+        source_hash(dst_path, stat_result=stat_cache.stat(dst_path))
+        for dst_path in dst_paths
+    ]
+    for src in sources:
+        assert stat_calls[src] == 1
+    for dst_path in dst_paths:
+        # Missing destination before copy and copied file after copy
+        assert stat_calls[dst_path] == 2
+
+    # Stat of copied file is stored to cache
+    for dst_path, file_hash in zip(dst_paths, file_hashes):
+        assert stat_cache.stat(dst_path) == os.stat(dst_path)
+        assert file_hash == source_hash(dst_path)
+
+
+def test_stat_cache_invalidate_after_rename(tmpdir, stat_calls):
+    stat_cache = FileStatCache()
+    temp_path = _create_file(str(tmpdir.join("file.txt.tmp")))
+    path = str(tmpdir.join("file.txt"))
+
+    assert stat_cache.exists(temp_path)
+    assert not stat_cache.exists(path)
+    # Missing files are not cached
+    assert not stat_cache.exists(path)
+    assert stat_calls[path] == 2
+
+    os.rename(temp_path, path)
+    stat_cache.invalidate(temp_path)
+    stat_cache.invalidate(path)
+    assert not stat_cache.exists(temp_path)
+    assert stat_cache.exists(path)
+    assert stat_cache.getsize(path) == len("data")
+
+    stat_cache.invalidate()
+    assert stat_cache.exists(path)
+    assert stat_calls[path] == 4
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "link"), reason="Hardlinks are not supported"
+)
+def test_copy_to_hardlink_of_source(tmpdir, sources, monkeypatch):
+    src = sources[0]
+    dst = str(tmpdir.mkdir("dst").join(os.path.basename(src)))
+    os.link(src, dst)
+    copied = []
+    monkeypatch.setattr(
+        file_transfer, "copyfile", lambda *args: copied.append(args)
+    )
+
+    engine = FileTransferEngine(max_workers=1, log=log)
+    engine.add(src, dst)
+    result = engine.process()
+
+    assert result == {dst: len("data")}
+    assert not copied
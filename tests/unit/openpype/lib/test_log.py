@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Test suite for buffered mongo log handler."""
+import os
+import logging
+
+from openpype.lib import log as log_lib
+
+
+class FakeCollection(object):
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+
+    def insert_many(self, documents, ordered=True):
+        if self.fail:
+            raise RuntimeError("Connection failed")
+        self.batches.append(list(documents))
+
+
+def _get_logger(handler, name):
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_documents_are_written_in_batches():
+    collection = FakeCollection()
+    handler = log_lib.PypeMongoBufferHandler(lambda: collection)
+    handler.batch_size = 10
+    logger = _get_logger(handler, "test_mongo_batches")
+
+    for idx in range(25):
+        logger.debug("message %s", idx)
+    handler.close()
+    logger.removeHandler(handler)
+
+    documents = [doc for batch in collection.batches for doc in batch]
+    assert [doc["message"] for doc in documents] == [
+        "message {}".format(idx) for idx in range(25)
+    ]
+    assert all(len(batch) <= 10 for batch in collection.batches)
+
+
+def test_failed_documents_are_spilled(tmpdir, monkeypatch):
+    spill_path = str(tmpdir.join("logs", "spill.json"))
+    monkeypatch.setattr(
+        log_lib, "get_mongo_log_spill_path", lambda: spill_path
+    )
+    handler = log_lib.PypeMongoBufferHandler(
+        lambda: FakeCollection(fail=True)
+    )
+    logger = _get_logger(handler, "test_mongo_spill")
+
+    logger.info("lost connection")
+    handler.close()
+    logger.removeHandler(handler)
+
+    assert os.path.exists(spill_path)
+    with open(spill_path, "r") as stream:
+        assert "lost connection" in stream.read()
+    assert handler.dropped_count == 0
+
+
+def test_connection_error_invalidates_client(tmpdir, monkeypatch):
+    class DisconnectedCollection(object):
+        def insert_many(self, documents, ordered=True):
+            raise log_lib.pymongo.errors.AutoReconnect("Connection lost")
+
+    invalidated = []
+    monkeypatch.setattr(
+        log_lib, "get_mongo_log_spill_path",
+        lambda: str(tmpdir.join("spill.json"))
+    )
+    monkeypatch.setattr(
+        log_lib.OpenPypeMongoConnection, "invalidate_client",
+        lambda mongo_url=None: invalidated.append(mongo_url)
+    )
+    handler = log_lib.PypeMongoBufferHandler(DisconnectedCollection)
+    logger = _get_logger(handler, "test_mongo_reconnect")
+
+    logger.info("lost connection")
+    handler.close()
+    logger.removeHandler(handler)
+
+    assert invalidated
+
+
+def test_only_failed_documents_are_spilled(tmpdir, monkeypatch):
+    class PartiallyFailingCollection(FakeCollection):
+        def insert_many(self, documents, ordered=True):
+            errors = []
+            for idx, document in enumerate(documents):
+                if document["message"].startswith("invalid"):
+                    errors.append({"index": idx, "code": 2})
+                else:
+                    self.batches.append([document])
+            if errors:
+                raise log_lib.pymongo.errors.BulkWriteError(
+                    {"writeErrors": errors}
+                )
+
+    spill_path = str(tmpdir.join("spill.json"))
+    monkeypatch.setattr(
+        log_lib, "get_mongo_log_spill_path", lambda: spill_path
+    )
+    collection = PartiallyFailingCollection()
+    handler = log_lib.PypeMongoBufferHandler(lambda: collection)
+    logger = _get_logger(handler, "test_mongo_partial_spill")
+
+    for message in ("valid 1", "invalid 1", "valid 2", "invalid 2"):
+        logger.info(message)
+    handler.close()
+    logger.removeHandler(handler)
+
+    assert [batch[0]["message"] for batch in collection.batches] == [
+        "valid 1", "valid 2"
+    ]
+    with open(spill_path, "r") as stream:
+        lines = stream.readlines()
+    assert len(lines) == 2
+    assert "invalid 1" in lines[0]
+    assert "invalid 2" in lines[1]
+
+
+def test_dropped_documents_are_logged_on_close(tmpdir, monkeypatch, caplog):
+    spill_path = str(tmpdir.join("spill.json"))
+    with open(spill_path, "w") as stream:
+        stream.write("full")
+    monkeypatch.setattr(
+        log_lib, "get_mongo_log_spill_path", lambda: spill_path
+    )
+    handler = log_lib.PypeMongoBufferHandler(
+        lambda: FakeCollection(fail=True)
+    )
+    handler.max_spill_size = 1
+    logger = _get_logger(handler, "test_mongo_dropped")
+
+    logger.info("dropped 1")
+    logger.info("dropped 2")
+    with caplog.at_level(logging.WARNING, logger=log_lib.__name__):
+        handler.close()
+    logger.removeHandler(handler)
+
+    assert handler.dropped_count == 2
+    assert "2 log documents" in caplog.text
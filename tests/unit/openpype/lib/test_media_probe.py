@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of media probes."""
+import json
+
+import pytest
+
+from openpype.lib import media_probe
+from openpype.lib import vendor_bin_utils
+
+
+class FakeProbe(object):
+    def __init__(self):
+        self.probed = []
+
+    def __call__(self, path):
+        self.probed.append(path)
+        with open(path, "r") as stream:
+            return {"streams": [{"content": stream.read()}]}
+
+
+def _write(path, content):
+    with open(path, "w") as stream:
+        stream.write(content)
+
+
+def test_probe_is_cached_until_file_changes(tmpdir):
+    path = str(tmpdir.join("input.mov"))
+    _write(path, "first")
+    probe = FakeProbe()
+    probe_cache = media_probe.MediaProbeCache()
+
+    for _ in range(3):
+        result = media_probe.cached_probe(
+            "ffprobe", path, probe, probe_cache
+        )
+        # Changes of result must not affect cache
+        result["streams"].append({})
+    assert probe.probed == [path]
+    assert media_probe.cached_probe(
+        "ffprobe", path, probe, probe_cache
+    ) == {"streams": [{"content": "first"}]}
+
+    _write(path, "changed")
+    result = media_probe.cached_probe("ffprobe", path, probe, probe_cache)
+    assert result == {"streams": [{"content": "changed"}]}
+    assert len(probe.probed) == 2
+
+
+def test_least_recently_used_are_dropped(tmpdir):
+    probe = FakeProbe()
+    probe_cache = media_probe.MediaProbeCache(max_items=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = str(tmpdir.join(name))
+        _write(path, name)
+        paths.append(path)
+
+    for path in paths:
+        media_probe.cached_probe("ffprobe", path, probe, probe_cache)
+    media_probe.cached_probe("ffprobe", paths[0], probe, probe_cache)
+    assert probe.probed == paths + [paths[0]]
+
+
+def test_disk_cache_is_shared(tmpdir):
+    path = str(tmpdir.join("input.exr"))
+    _write(path, "exr")
+    cache_dir = str(tmpdir.join("cache"))
+    probe = FakeProbe()
+
+    media_probe.cached_probe(
+        "oiio_info", path, probe, media_probe.MediaProbeCache(cache_dir)
+    )
+    # Other process (new cache object) uses result stored on disk
+    result = media_probe.cached_probe(
+        "oiio_info", path, probe, media_probe.MediaProbeCache(cache_dir)
+    )
+    assert result == {"streams": [{"content": "exr"}]}
+    assert probe.probed == [path]
+
+
+def test_missing_file_is_not_cached(tmpdir):
+    path = str(tmpdir.join("input.%04d.exr"))
+    probe_cache = media_probe.MediaProbeCache()
+    calls = []
+    for _ in range(2):
+        media_probe.cached_probe(
+            "oiio_info", path, calls.append, probe_cache
+        )
+    assert calls == [path, path]
+
+
+def test_batch_probe(tmpdir):
+    paths = []
+    for idx in range(10):
+        path = str(tmpdir.join("{}.mov".format(idx)))
+        _write(path, str(idx))
+        paths.append(path)
+    probe = FakeProbe()
+    probe_cache = media_probe.MediaProbeCache()
+
+    results = media_probe.cached_probes(
+        "ffprobe", paths, probe, max_workers=4, probe_cache=probe_cache
+    )
+    assert sorted(probe.probed) == sorted(paths)
+    for idx, path in enumerate(paths):
+        assert results[path] == {"streams": [{"content": str(idx)}]}
+
+    media_probe.cached_probes("ffprobe", paths, probe, probe_cache=probe_cache)
+    assert len(probe.probed) == len(paths)
+
+
+class FakePopen(object):
+    def __init__(self, returncode, output):
+        self.returncode = returncode
+        self._output = output
+
+    def __call__(self, args, **kwargs):
+        return self
+
+    def communicate(self):
+        return json.dumps(self._output).encode("utf-8"), b""
+
+
+@pytest.mark.parametrize("returncode,output", [
+    (1, {"error": {"code": -1, "string": "Invalid data"}}),
+    (0, {"format": {}}),
+])
+def test_failed_ffprobe_is_not_cached(tmpdir, monkeypatch, returncode, output):
+    path = str(tmpdir.join("input.mov"))
+    _write(path, "broken")
+    monkeypatch.setattr(media_probe, "_probe_cache", None)
+    monkeypatch.delenv(media_probe.CACHE_DIR_ENV_KEY, raising=False)
+    monkeypatch.setattr(
+        vendor_bin_utils, "get_ffmpeg_tool_path", lambda tool: tool
+    )
+    monkeypatch.setattr(
+        vendor_bin_utils.subprocess, "Popen", FakePopen(returncode, output)
+    )
+
+    with pytest.raises(RuntimeError):
+        vendor_bin_utils.get_ffprobe_data(path)
+
+    # File is probed again after failure
+    streams = [{"codec_type": "video"}]
+    monkeypatch.setattr(
+        vendor_bin_utils.subprocess, "Popen",
+        FakePopen(0, {"streams": streams})
+    )
+    assert vendor_bin_utils.ffprobe_streams(path) == streams
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Test suite for validation and arguments of cached mongo connections."""
+import pytest
+
+from openpype.lib import mongo
+from openpype.lib.mongo import OpenPypeMongoConnection
+
+MONGO_URL = "mongodb://localhost:27017"
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    monkeypatch.setattr(OpenPypeMongoConnection, "_last_validations", {})
+    monkeypatch.delenv("OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL", raising=False)
+    for env_key in OpenPypeMongoConnection.pool_kwargs_env_keys.values():
+        monkeypatch.delenv(env_key, raising=False)
+    return OpenPypeMongoConnection
+
+
+@pytest.mark.parametrize("value,expected", [
+    (None, OpenPypeMongoConnection.default_health_check_interval),
+    ("", OpenPypeMongoConnection.default_health_check_interval),
+    ("invalid", OpenPypeMongoConnection.default_health_check_interval),
+    ("0", 0),
+    ("2.5", 2.5),
+    ("-1", -1),
+])
+def test_health_check_interval(connection, monkeypatch, value, expected):
+    if value is not None:
+        monkeypatch.setenv("OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL", value)
+    assert connection.get_health_check_interval() == expected
+
+
+def test_pool_kwargs(connection, monkeypatch):
+    assert connection.get_pool_kwargs() == {}
+
+    monkeypatch.setenv("OPENPYPE_MONGO_MAX_POOL_SIZE", "50")
+    monkeypatch.setenv("OPENPYPE_MONGO_MIN_POOL_SIZE", "0")
+    monkeypatch.setenv("OPENPYPE_MONGO_MAX_IDLE_TIME_MS", "invalid")
+    # Zero and invalid values are not passed to pymongo
+    assert connection.get_pool_kwargs() == {"maxPoolSize": 50}
+
+
+def test_validation_required(connection, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(mongo.time, "time", lambda: now[0])
+    monkeypatch.setenv("OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL", "30")
+
+    # Not validated connection
+    assert connection._is_validation_required(MONGO_URL) is True
+
+    connection._last_validations[MONGO_URL] = now[0]
+    assert connection._is_validation_required(MONGO_URL) is False
+    now[0] += 30
+    assert connection._is_validation_required(MONGO_URL) is True
+
+    # Zero interval validates on each request
+    monkeypatch.setenv("OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL", "0")
+    connection._last_validations[MONGO_URL] = now[0]
+    assert connection._is_validation_required(MONGO_URL) is True
+
+    # Negative interval disables validation until client is invalidated
+    monkeypatch.setenv("OPENPYPE_MONGO_HEALTH_CHECK_INTERVAL", "-1")
+    now[0] += 1000
+    assert connection._is_validation_required(MONGO_URL) is False
+    connection.invalidate_client(MONGO_URL)
+    assert connection._is_validation_required(MONGO_URL) is True
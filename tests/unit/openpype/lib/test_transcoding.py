@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""Test suite for conversion of sequences for ffmpeg."""
+import os
+import threading
+
+import pytest
+
+from openpype.lib import transcoding
+
+
+def test_sequence_path_pattern():
+    path = os.path.join("renders", "sh010_beauty.1001.exr")
+    assert transcoding.get_sequence_path_pattern(path) == os.path.join(
+        "renders", "sh010_beauty.%04d.exr"
+    )
+    path = os.path.join("renders", "beauty.exr")
+    assert transcoding.get_sequence_path_pattern(path) == path
+
+
+def test_frame_chunks_cover_range():
+    chunks = transcoding.get_frame_chunks(1001, 1100, 2)
+    assert chunks[0][0] == 1001
+    assert chunks[-1][1] == 1100
+    assert len(chunks) == 8
+    for (_, prev_end), (start, _) in zip(chunks, chunks[1:]):
+        assert start == prev_end + 1
+
+    # Short sequence is not split to chunks smaller than minimum
+    assert transcoding.get_frame_chunks(1, 5, 8) == [(1, 5)]
+
+
+def test_frame_chunks_skip_missing_frames():
+    frames = [
+        frame for frame in range(995, 1106) if frame not in (1050, 1051)
+    ]
+    chunks = transcoding.get_frame_chunks(995, 1105, 2, frames)
+    chunk_frames = []
+    for start, end in chunks:
+        chunk_frames.extend(range(start, end + 1))
+    assert chunk_frames == frames
+
+
+@pytest.fixture
+def fake_oiio(tmpdir, monkeypatch):
+    input_path = str(tmpdir.join("beauty.1001.exr"))
+    with open(input_path, "w") as stream:
+        stream.write("exr")
+
+    probes = []
+    commands = []
+    lock = threading.Lock()
+
+    def get_oiio_info_xml(filepath, logger=None):
+        probes.append(filepath)
+        return (
+            "<ImageSpec version=\"20\">\n"
+            "<attrib name=\"compression\" type=\"string\">dwaa</attrib>\n"
+            "<channelnames><channelname>R</channelname>"
+            "<channelname>G</channelname><channelname>B</channelname>"
+            "<channelname>A</channelname></channelnames>\n"
+            "</ImageSpec>"
+        )
+
+    def run_subprocess(args, logger=None):
+        with lock:
+            commands.append(args)
+        return ""
+
+    monkeypatch.setattr(transcoding, "is_oiio_supported", lambda: True)
+    monkeypatch.setattr(transcoding, "get_oiio_tools_path", lambda: "oiio")
+    monkeypatch.setattr(
+        transcoding, "_get_oiio_info_xml", get_oiio_info_xml
+    )
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+    return input_path, probes, commands
+
+
+def test_convert_sequence_in_chunks(tmpdir, fake_oiio):
+    input_path, probes, commands = fake_oiio
+    output_dir = str(tmpdir.mkdir("output"))
+
+    assert transcoding.should_convert_for_ffmpeg(input_path) is True
+    transcoding.convert_for_ffmpeg(
+        input_path, output_dir, 1001, 1100, workers=4
+    )
+
+    # Input is probed only once
+    assert probes == [input_path]
+
+    frame_ranges = []
+    for args in commands:
+        assert args[-2:] == ["-o", os.path.join(output_dir, "beauty.%04d.exr")]
+        assert os.path.join(str(tmpdir), "beauty.%04d.exr") in args
+        frame_ranges.append(args[args.index("--frames") + 1])
+
+    converted_frames = set()
+    for frame_range in frame_ranges:
+        start, end = frame_range.split("-")
+        converted_frames.update(range(int(start), int(end) + 1))
+    assert converted_frames == set(range(1001, 1101))
+    assert len(commands) > 1
+
+
+def test_batch_collects_failures(monkeypatch):
+    def run_subprocess(args, logger=None):
+        if "fail" in args:
+            raise RuntimeError("Failed")
+        return ""
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+    commands = [
+        (idx, ["oiio", "fail" if idx in (3, 7) else "ok"])
+        for idx in range(10)
+    ]
+    failures = transcoding.run_oiio_batch(commands, workers=3)
+    assert sorted(failures) == [3, 7]
+
+
+def _fake_oiio_outputs(failing_frames):
+    def run_subprocess(args, logger=None):
+        output_path = args[args.index("-o") + 1]
+        if "--frames" not in args:
+            output_paths = [output_path]
+        else:
+            start, end = args[args.index("--frames") + 1].split("-")
+            output_paths = [
+                output_path % frame
+                for frame in range(int(start), int(end) + 1)
+            ]
+        for frame in failing_frames:
+            if any(str(frame) in path for path in output_paths):
+                raise RuntimeError("Failed")
+        for path in output_paths:
+            open(path, "w").close()
+        return ""
+    return run_subprocess
+
+
+def test_files_sequence_uses_frame_ranges(tmpdir, monkeypatch):
+    commands = []
+    run_subprocess = _fake_oiio_outputs([1025])
+
+    def _run_subprocess(args, logger=None):
+        commands.append(args)
+        return run_subprocess(args, logger)
+
+    monkeypatch.setattr(transcoding, "get_oiio_tools_path", lambda: "oiio")
+    monkeypatch.setattr(transcoding, "run_subprocess", _run_subprocess)
+    staging_dir = str(tmpdir)
+    input_paths = [
+        os.path.join(staging_dir, "__beauty.{}.exr".format(frame))
+        for frame in range(1001, 1101)
+    ]
+    output_paths = [
+        os.path.join(staging_dir, "beauty.{}.exr".format(frame))
+        for frame in range(1001, 1101)
+    ]
+    failed_paths = transcoding.run_oiio_for_files(
+        input_paths, output_paths, ["--scanline"], workers=2
+    )
+
+    assert len(commands) < len(input_paths)
+    assert all("--frames" in args for args in commands)
+    # All frames of failed chunk are reported
+    assert os.path.join(staging_dir, "__beauty.1025.exr") in failed_paths
+    for input_path, output_path in zip(input_paths, output_paths):
+        assert (input_path in failed_paths) != os.path.exists(output_path)
+
+
+def test_files_without_sequence_are_processed_one_by_one(
+    tmpdir, monkeypatch
+):
+    monkeypatch.setattr(transcoding, "get_oiio_tools_path", lambda: "oiio")
+    monkeypatch.setattr(
+        transcoding, "run_subprocess", _fake_oiio_outputs(["second"])
+    )
+    input_paths = [
+        str(tmpdir.join("in_first.exr")), str(tmpdir.join("in_second.exr"))
+    ]
+    output_paths = [
+        str(tmpdir.join("first.exr")), str(tmpdir.join("second.exr"))
+    ]
+    failed_paths = transcoding.run_oiio_for_files(
+        input_paths, output_paths, ["--scanline"]
+    )
+    assert failed_paths == [input_paths[1]]
+
+
+def test_convert_sequence_with_handles_and_gap(tmpdir, fake_oiio):
+    input_path, _, commands = fake_oiio
+    output_dir = str(tmpdir.mkdir("output"))
+    # Frames with handles 996-1105 where frame 1050 is missing
+    frames = [frame for frame in range(996, 1106) if frame != 1050]
+
+    transcoding.convert_for_ffmpeg(
+        input_path, output_dir, 996, 1105, workers=4, frames=frames
+    )
+
+    converted_frames = []
+    for args in commands:
+        start, end = args[args.index("--frames") + 1].split("-")
+        converted_frames.extend(range(int(start), int(end) + 1))
+    assert sorted(converted_frames) == frames
@@ -0,0 +1,229 @@
+"""Test file for queries of Log Viewer.
+
+Uses fake log collection which evaluates only operators used by queries.
+"""
+import datetime
+
+import pytest
+
+from openpype.modules.log_viewer.lib import LogsQuery
+
+NOW = datetime.datetime.now()
+
+
+def _value(doc, expression):
+    return doc.get(expression[1:])
+
+
+def _matches(doc, query):
+    for key, condition in query.items():
+        value = doc.get(key)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+
+        for operator, arg in condition.items():
+            if operator == "$in" and value not in arg:
+                return False
+            if operator == "$nin" and value in arg:
+                return False
+            if operator == "$gte" and (value is None or value < arg):
+                return False
+    return True
+
+
+def _group(docs, stage):
+    groups = {}
+    for doc in docs:
+        group_id = _value(doc, stage["_id"])
+        group = groups.get(group_id)
+        if group is None:
+            group = {"_id": group_id, "_docs": []}
+            groups[group_id] = group
+        group["_docs"].append(doc)
+
+    output = []
+    for group in groups.values():
+        group_docs = group.pop("_docs")
+        for key, accumulator in stage.items():
+            if key == "_id":
+                continue
+            ((operator, expression), ) = accumulator.items()
+            if operator == "$sum":
+                group[key] = expression * len(group_docs)
+                continue
+            values = [_value(doc, expression) for doc in group_docs]
+            if operator == "$min":
+                group[key] = min(values)
+            elif operator == "$max":
+                group[key] = max(values)
+            elif operator == "$first":
+                group[key] = values[0]
+        output.append(group)
+    return output
+
+
+def _sort(docs, sort_items):
+    for key, direction in reversed(sort_items):
+        docs = sorted(docs, key=lambda doc: doc[key], reverse=direction < 0)
+    return docs
+
+
+class FakeLogCollection(object):
+    def __init__(self, docs):
+        self.docs = docs
+        self.pipelines = []
+        self.indexes = []
+
+    def create_index(self, keys, **kwargs):
+        self.indexes.append(keys)
+
+    def distinct(self, key, query_filter):
+        values = []
+        for doc in self.docs:
+            if _matches(doc, query_filter) and doc.get(key) not in values:
+                values.append(doc.get(key))
+        return values
+
+    def aggregate(self, pipeline, allowDiskUse=False):
+        self.pipelines.append(pipeline)
+        docs = list(self.docs)
+        for stage in pipeline:
+            ((operator, arg), ) = stage.items()
+            if operator == "$match":
+                docs = [doc for doc in docs if _matches(doc, arg)]
+            elif operator == "$group":
+                docs = _group(docs, arg)
+            elif operator == "$sort":
+                docs = _sort(docs, list(arg.items()))
+            elif operator == "$limit":
+                docs = docs[:arg]
+        return iter(docs)
+
+    def find(self, query_filter, projection=None, sort=None):
+        docs = [doc for doc in self.docs if _matches(doc, query_filter)]
+        if sort:
+            docs = _sort(docs, sort)
+        if projection:
+            docs = [
+                {
+                    key: value
+                    for key, value in doc.items()
+                    if key == "_id" or projection.get(key)
+                }
+                for doc in docs
+            ]
+        return docs
+
+
+def _log(process_id, minutes_ago, level="INFO", username="john",
+         message="message"):
+    return {
+        "_id": "{}_{}".format(process_id, minutes_ago),
+        "process_id": process_id,
+        "hostname": "host_{}".format(process_id),
+        "hostip": "127.0.0.1",
+        "username": username,
+        "system_name": "Linux",
+        "process_name": "tray",
+        "timestamp": NOW - datetime.timedelta(minutes=minutes_ago),
+        "level": level,
+        "message": message,
+    }
+
+
+@pytest.fixture
+def collection():
+    return FakeLogCollection([
+        _log("a", 60),
+        _log("a", 50, "ERROR"),
+        _log("a", 40),
+        _log("b", 30, username="jane"),
+        _log("b", 20, "WARNING", username="jane"),
+        _log("c", 10, "DEBUG"),
+        # logs without process id are ignored
+        _log(None, 5),
+        _log("", 5),
+    ])
+
+
+def test_build_filter():
+    query = LogsQuery(FakeLogCollection([]))
+    assert query.build_filter() == {}
+
+    query_filter = query.build_filter(
+        usernames=("john", ), levels=("ERROR", ),
+        time_window=datetime.timedelta(hours=1)
+    )
+    timestamp = query_filter.pop("timestamp")["$gte"]
+    assert query_filter == {
+        "username": {"$in": ["john"]},
+        "level": {"$in": ["ERROR"]},
+    }
+    expected = datetime.datetime.now() - datetime.timedelta(hours=1)
+    assert abs(expected - timestamp) < datetime.timedelta(seconds=5)
+
+
+def test_get_processes_groups_by_process_id(collection):
+    query = LogsQuery(collection)
+    processes = query.get_processes()
+
+    assert [item["process_id"] for item in processes] == ["c", "b", "a"]
+    process_a = processes[-1]
+    assert process_a["count"] == 3
+    assert process_a["started"] == NOW - datetime.timedelta(minutes=60)
+    assert process_a["finished"] == NOW - datetime.timedelta(minutes=40)
+    assert process_a["hostname"] == "host_a"
+    assert set(process_a.keys()) == (
+        set(LogsQuery.process_keys) | {"started", "finished", "count"}
+    )
+    assert collection.indexes
+
+
+@pytest.mark.parametrize("kwargs,expected", [
+    ({"usernames": ["jane"]}, {"b": 2}),
+    ({"levels": ["ERROR", "WARNING"]}, {"a": 1, "b": 1}),
+    (
+        {"time_window": datetime.timedelta(minutes=45)},
+        {"a": 1, "b": 2, "c": 1}
+    ),
+    (
+        {"usernames": ["john"], "time_window": datetime.timedelta(minutes=45)},
+        {"a": 1, "c": 1}
+    ),
+])
+def test_get_processes_filters(collection, kwargs, expected):
+    processes = LogsQuery(collection).get_processes(**kwargs)
+    assert {
+        item["process_id"]: item["count"] for item in processes
+    } == expected
+
+
+def test_get_processes_limit(collection):
+    query = LogsQuery(collection)
+    processes = query.get_processes(limit=2)
+    assert [item["process_id"] for item in processes] == ["c", "b"]
+    # Limit is applied in the query
+    assert collection.pipelines[-1][-1] == {"$limit": 2}
+
+    query.get_processes()
+    assert not [
+        stage for stage in collection.pipelines[-1] if "$limit" in stage
+    ]
+
+
+def test_get_process_logs(collection):
+    query = LogsQuery(collection)
+    logs = query.get_process_logs("a")
+    assert [doc["_id"] for doc in logs] == ["a_60", "a_50", "a_40"]
+    assert "hostname" not in logs[0]
+    assert logs[0]["message"] == "message"
+
+    logs = query.get_process_logs("a", levels=["ERROR"])
+    assert [doc["_id"] for doc in logs] == ["a_50"]
+
+    logs = query.get_process_logs(
+        "a", time_window=datetime.timedelta(minutes=45)
+    )
+    assert [doc["_id"] for doc in logs] == ["a_40"]
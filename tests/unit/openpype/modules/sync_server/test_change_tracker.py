@@ -0,0 +1,139 @@
+"""Test file for tracker of representations changed since last sync loop.
+
+Uses fake project collection, polling is used when 'watch' fails.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from bson.objectid import ObjectId
+from pymongo.errors import PyMongoError
+
+from openpype.modules.sync_server import change_tracker
+from openpype.modules.sync_server.change_tracker import (
+    RepresentationChangeTracker
+)
+
+
+class FakeChangeStream(object):
+    def __init__(self, changes):
+        self.changes = list(changes)
+        self.closed = False
+
+    def try_next(self):
+        if self.changes:
+            return self.changes.pop(0)
+        return None
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCollection(object):
+    name = "test_project"
+
+    def __init__(self, change_stream=None):
+        self.change_stream = change_stream
+        self.indexes = []
+
+    def watch(self, pipeline):
+        if self.change_stream is None:
+            raise PyMongoError("Change streams are not supported")
+        return self.change_stream
+
+    def create_index(self, key, **kwargs):
+        self.indexes.append(key)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(change_tracker.time, "time", lambda: now[0])
+    return now
+
+
+def _get_ids_clause(query):
+    if "$or" in query:
+        query = query["$or"][0]
+    return set(query["_id"]["$in"])
+
+
+def test_full_scan_scheduling(clock):
+    collection = FakeCollection()
+    tracker = RepresentationChangeTracker(full_scan_interval=600)
+
+    assert tracker.get_filter(collection) is None
+    clock[0] += 300
+    assert tracker.get_filter(collection) is not None
+    clock[0] += 301
+    assert tracker.get_filter(collection) is None
+    assert tracker.get_filter(collection) is not None
+
+    tracker.reset()
+    assert tracker.get_filter(collection) is None
+    # Index for polling is created only once
+    assert collection.indexes == ["files.sites.created_dt"]
+
+
+def test_pending_and_changed_ids(clock):
+    collection = FakeCollection()
+    tracker = RepresentationChangeTracker()
+    tracker.get_filter(collection)
+
+    pending_id = ObjectId()
+    changed_id = ObjectId()
+    tracker.set_pending([pending_id])
+    tracker.mark_changed(str(changed_id))
+    query = tracker.get_filter(collection)
+    assert _get_ids_clause(query) == {pending_id, changed_id}
+
+    # Changed ids are examined once, pending until they're replaced
+    query = tracker.get_filter(collection)
+    assert _get_ids_clause(query) == {pending_id}
+    tracker.set_pending([])
+    assert _get_ids_clause(tracker.get_filter(collection)) == set()
+
+
+def test_polling_filter_uses_watermark_margin(clock):
+    collection = FakeCollection()
+    tracker = RepresentationChangeTracker()
+    margin = tracker.watermark_margin
+    tolerance = timedelta(seconds=5)
+
+    start = datetime.now()
+    utc_start = datetime.utcnow()
+    tracker.get_filter(collection)
+    query = tracker.get_filter(collection)
+
+    ids_clause, oid_clause, sites_clause = query["$or"]
+    oid_time = oid_clause["_id"]["$gte"].generation_time.replace(tzinfo=None)
+    assert utc_start - margin - tolerance <= oid_time
+    assert oid_time <= utc_start - margin + tolerance
+
+    created_dt = sites_clause["files.sites.created_dt"]["$gte"]
+    assert start - margin - tolerance <= created_dt
+    assert created_dt <= start - margin + tolerance
+
+
+def test_change_stream(clock):
+    changed_ids = [ObjectId() for _ in range(3)]
+    change_stream = FakeChangeStream(
+        {"documentKey": {"_id": changed_id}}
+        for changed_id in changed_ids
+    )
+    collection = FakeCollection(change_stream)
+    tracker = RepresentationChangeTracker()
+    assert tracker.get_filter(collection) is None
+
+    pending_id = ObjectId()
+    tracker.set_pending([pending_id])
+    query = tracker.get_filter(collection)
+    assert query == {"_id": {"$in": query["_id"]["$in"]}}
+    assert set(query["_id"]["$in"]) == set(changed_ids) | {pending_id}
+
+    # Too many changes require full scan
+    tracker.max_changed_ids = 1
+    change_stream.changes = [
+        {"documentKey": {"_id": ObjectId()}} for _ in range(3)
+    ]
+    assert tracker.get_filter(collection) is None
+    assert change_stream.closed
@@ -0,0 +1,243 @@
+"""Test file for chunked and resumable transfers of sync server providers.
+
+    Uses plain directories in temporary folder as source and target sites,
+    SFTP connection is faked by local file operations.
+"""
+import os
+
+import pytest
+
+from openpype.modules.sync_server.providers.chunked_transfer import (
+    get_partial_path
+)
+from openpype.modules.sync_server.providers.local_drive import (
+    LocalDriveHandler
+)
+from openpype.modules.sync_server.providers.sftp import SFTPHandler
+
+
+class FakeServer(object):
+    LOG_PROGRESS_SEC = 0
+
+    def __init__(self):
+        self.updates = []
+
+    def is_representation_paused(self, representation_id,
+                                 check_parents=False, project_name=None):
+        return False
+
+    def update_db(self, **kwargs):
+        self.updates.append(kwargs)
+
+
+class FakeSFTPFile(object):
+    def __init__(self, stream, calls):
+        self._stream = stream
+        self._calls = calls
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._stream.close()
+
+    def set_pipelined(self, pipelined=True):
+        self._calls.append(("set_pipelined", pipelined))
+
+    def prefetch(self, file_size=None):
+        self._calls.append(("prefetch", file_size))
+
+
+class FakeSFTPConnection(object):
+    """Connection to 'remote' which is local temporary directory."""
+    modes = {"r": "rb", "w": "wb", "r+": "r+b"}
+
+    def __init__(self):
+        self.calls = []
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def stat(self, path):
+        return os.stat(path)
+
+    def truncate(self, path, size):
+        self.calls.append(("truncate", path, size))
+        with open(path, "r+b") as stream:
+            stream.truncate(size)
+
+    def open(self, path, mode="r"):
+        self.calls.append(("open", path, mode))
+        return FakeSFTPFile(open(path, self.modes[mode]), self.calls)
+
+    def remove(self, path):
+        os.remove(path)
+
+    def rename(self, src, dst):
+        self.calls.append(("rename", src, dst))
+        os.rename(src, dst)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def source_file(tmpdir):
+    path = str(tmpdir.join("source.bin"))
+    with open(path, "wb") as stream:
+        stream.write(os.urandom(1024 * 10))
+    return path
+
+
+def _copy(source_path, target_path, server, file):
+    handler = LocalDriveHandler("test_project", "studio")
+    handler.CHUNK_SIZE = 1024
+    return handler.upload_file(source_path, target_path, server,
+                               "test_project", file, {"_id": "repre"},
+                               "studio", overwrite=True)
+
+
+def test_transfer_reports_offset(tmpdir, source_file):
+    target_path = str(tmpdir.join("target.bin"))
+    server = FakeServer()
+    _copy(source_file, target_path, server, {"sites": []})
+
+    with open(source_file, "rb") as src, open(target_path, "rb") as dst:
+        assert src.read() == dst.read()
+    assert not os.path.exists(get_partial_path(target_path))
+
+    offsets = [update["resume"]["offset"] for update in server.updates]
+    assert offsets
+    assert offsets[-1] == os.path.getsize(source_file)
+
+
+def test_transfer_resumes_from_offset(tmpdir, source_file):
+    target_path = str(tmpdir.join("target.bin"))
+    with open(source_file, "rb") as stream:
+        content = stream.read()
+
+    # interrupted transfer, garbage after stored offset is discarded
+    with open(get_partial_path(target_path), "wb") as stream:
+        stream.write(content[:4096] + b"garbage")
+
+    file = {"sites": [{
+        "name": "studio",
+        "resume": {
+            "offset": 4096,
+            "size": len(content),
+            "mtime": int(os.path.getmtime(source_file))
+        }
+    }]}
+    _copy(source_file, target_path, FakeServer(), file)
+
+    with open(target_path, "rb") as stream:
+        assert stream.read() == content
+
+
+@pytest.mark.parametrize("resume", [
+    {"size": 1},
+    # source with same size was rewritten
+    {"mtime_offset": -10},
+])
+def test_transfer_restarts_on_changed_source(tmpdir, source_file, resume):
+    target_path = str(tmpdir.join("target.bin"))
+    with open(get_partial_path(target_path), "wb") as stream:
+        stream.write(b"x" * 4096)
+
+    file = {"sites": [{
+        "name": "studio",
+        "resume": {
+            "offset": 4096,
+            "size": resume.get("size", os.path.getsize(source_file)),
+            "mtime": (
+                int(os.path.getmtime(source_file))
+                + resume.get("mtime_offset", 0)
+            )
+        }
+    }]}
+    _copy(source_file, target_path, FakeServer(), file)
+
+    with open(source_file, "rb") as src, open(target_path, "rb") as dst:
+        assert src.read() == dst.read()
+
+
+@pytest.fixture
+def sftp_conn(monkeypatch):
+    conn = FakeSFTPConnection()
+    monkeypatch.setattr(SFTPHandler, "_get_conn", lambda self: conn)
+    return conn
+
+
+def _sftp_transfer(method, source_path, target_path, server, file):
+    handler = SFTPHandler("test_project", "sftp")
+    handler.CHUNK_SIZE = 1024
+    getattr(handler, method)(source_path, target_path, server,
+                             "test_project", file, {"_id": "repre"}, "sftp")
+
+
+def _resume_file(source_path, offset):
+    return {"sites": [{
+        "name": "sftp",
+        "resume": {
+            "offset": offset,
+            "size": os.path.getsize(source_path),
+            "mtime": int(os.path.getmtime(source_path))
+        }
+    }]}
+
+
+@pytest.mark.parametrize("method", ["_upload", "_download"])
+def test_sftp_transfer(tmpdir, source_file, sftp_conn, method):
+    target_path = str(tmpdir.join("target.bin"))
+    partial_path = get_partial_path(target_path)
+    server = FakeServer()
+    _sftp_transfer(method, source_file, target_path, server, {"sites": []})
+
+    with open(source_file, "rb") as src, open(target_path, "rb") as dst:
+        assert src.read() == dst.read()
+    assert not os.path.exists(partial_path)
+    assert server.updates[-1]["resume"] == {
+        "offset": os.path.getsize(source_file),
+        "size": os.path.getsize(source_file),
+        "mtime": int(os.path.getmtime(source_file))
+    }
+
+    if method == "_upload":
+        assert ("open", partial_path, "w") in sftp_conn.calls
+        assert ("set_pipelined", True) in sftp_conn.calls
+        assert sftp_conn.calls[-1] == ("rename", partial_path, target_path)
+    else:
+        assert ("open", source_file, "r") in sftp_conn.calls
+        assert (
+            "prefetch", os.path.getsize(source_file)
+        ) in sftp_conn.calls
+
+
+@pytest.mark.parametrize("method", ["_upload", "_download"])
+def test_sftp_transfer_resumes_from_offset(tmpdir, source_file, sftp_conn,
+                                           method):
+    target_path = str(tmpdir.join("target.bin"))
+    partial_path = get_partial_path(target_path)
+    with open(source_file, "rb") as stream:
+        content = stream.read()
+    with open(partial_path, "wb") as stream:
+        stream.write(content[:4096] + b"garbage")
+
+    _sftp_transfer(method, source_file, target_path, FakeServer(),
+                   _resume_file(source_file, 4096))
+
+    with open(target_path, "rb") as stream:
+        assert stream.read() == content
+    if method == "_upload":
+        assert sftp_conn.calls[:2] == [
+            ("truncate", partial_path, 4096),
+            ("open", partial_path, "r+")
+        ]
+    else:
+        # whole file is not prefetched when part is already downloaded
+        assert not [
+            call for call in sftp_conn.calls if call[0] == "prefetch"
+        ]
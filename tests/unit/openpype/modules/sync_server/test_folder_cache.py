@@ -0,0 +1,44 @@
+"""Test file for persistent folder tree cache of sync server providers."""
+from openpype.modules.sync_server.providers.folder_cache import (
+    FolderTreeCache
+)
+
+
+def test_loaded_folders_are_not_verified(tmpdir):
+    filepath = str(tmpdir.join("tree.json"))
+    cache = FolderTreeCache(filepath)
+    cache.set("/My Drive/project", "1234")
+    cache.save(force=True)
+    assert cache.is_verified("/My Drive/project")
+
+    # Folders loaded from file must be checked on provider
+    loaded_cache = FolderTreeCache(filepath)
+    assert loaded_cache.get("/My Drive/project") == "1234"
+    assert not loaded_cache.is_verified("/My Drive/project")
+
+    loaded_cache.mark_verified("/My Drive/project")
+    assert loaded_cache.is_verified("/My Drive/project")
+
+
+def test_removed_subfolders(tmpdir):
+    cache = FolderTreeCache(str(tmpdir.join("tree.json")))
+    cache.update({
+        "/My Drive/project": {"id": "1"},
+        "/My Drive/project/assets": {"id": "2"},
+        "/My Drive/project_b": {"id": "3"},
+    })
+    cache.remove("/My Drive/project")
+    assert list(cache.folders.keys()) == ["/My Drive/project_b"]
+    assert not cache.is_verified("/My Drive/project/assets")
+
+
+def test_not_persistent_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(FolderTreeCache, "_caches", {})
+    cache = FolderTreeCache.get_cache(
+        "sftp", "test_project", "studio", persistent=False
+    )
+    assert cache.filepath is None
+
+    cache.set("/project/assets", "/project/assets")
+    cache.save(force=True)
+    assert cache.is_verified("/project/assets")
@@ -0,0 +1,151 @@
+"""Test file for scheduling of sync server transfers by limits."""
+import time
+import asyncio
+
+import pytest
+
+from openpype.modules.sync_server.scheduler import TransferScheduler
+
+
+async def _transfer(scheduler, name, started, priority=0, size=0,
+                    duration=0.01, site_name="studio"):
+    async with scheduler.transfer(site_name, "sftp", size, priority):
+        started.append((name, time.time()))
+        await asyncio.sleep(duration)
+
+
+async def _hold_slot(scheduler, release_event):
+    async with scheduler.transfer("studio", "sftp"):
+        await release_event.wait()
+
+
+def test_priority_ordering():
+    async def main():
+        scheduler = TransferScheduler({"studio": {"max_parallel": 1}})
+        release_event = asyncio.Event()
+        holder = asyncio.ensure_future(_hold_slot(scheduler, release_event))
+        await asyncio.sleep(0)
+
+        started = []
+        tasks = [
+            asyncio.ensure_future(
+                _transfer(scheduler, name, started, priority=priority)
+            )
+            for name, priority in (("low", 0), ("high", 5), ("mid", 1))
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.get_stats()["queued"] == 3
+
+        release_event.set()
+        await asyncio.gather(holder, *tasks)
+        return [name for name, _ in started]
+
+    assert asyncio.run(main()) == ["high", "mid", "low"]
+
+
+def test_max_parallel():
+    async def main():
+        scheduler = TransferScheduler(provider_limits={
+            "sftp": {"max_parallel": 2}
+        })
+        active = [0]
+        max_active = [0]
+
+        async def transfer():
+            async with scheduler.transfer("studio", "sftp"):
+                active[0] += 1
+                max_active[0] = max(max_active[0], active[0])
+                await asyncio.sleep(0.01)
+                active[0] -= 1
+
+        await asyncio.gather(*[transfer() for _ in range(6)])
+        return max_active[0], scheduler.get_stats()
+
+    max_active, stats = asyncio.run(main())
+    assert max_active == 2
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+
+
+def test_bandwidth_pacing():
+    async def main():
+        # 1 MB/s
+        scheduler = TransferScheduler({"studio": {"max_bandwidth": 1}})
+        size = int(0.1 * 1024 * 1024)
+        started = []
+        await asyncio.gather(*[
+            _transfer(scheduler, idx, started, size=size, duration=0)
+            for idx in range(3)
+        ])
+        return [start_time for _, start_time in started]
+
+    start_times = asyncio.run(main())
+    # Each transfer reserves 0.1 second of bandwidth
+    assert start_times[1] - start_times[0] >= 0.09
+    assert start_times[2] - start_times[0] >= 0.18
+
+
+def test_slot_is_released_on_failure():
+    async def main():
+        scheduler = TransferScheduler({"studio": {"max_parallel": 1}})
+        with pytest.raises(RuntimeError):
+            async with scheduler.transfer("studio", "sftp", 100):
+                raise RuntimeError("Transfer failed")
+
+        stats = scheduler.get_stats()["sites"]["studio"]
+        assert stats["active"] == 0
+        # Failed transfer is not counted to transferred bytes
+        assert stats["transferred"] == 0
+
+        started = []
+        await asyncio.wait_for(_transfer(scheduler, "next", started), 1)
+        assert started
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiting_transfer():
+    async def main():
+        scheduler = TransferScheduler({"studio": {"max_parallel": 1}})
+        release_event = asyncio.Event()
+        holder = asyncio.ensure_future(_hold_slot(scheduler, release_event))
+        await asyncio.sleep(0)
+
+        started = []
+        waiting = asyncio.ensure_future(_transfer(scheduler, "a", started))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert scheduler.get_stats()["sites"]["studio"]["queued"] == 0
+
+        release_event.set()
+        await holder
+        assert not started
+        assert scheduler.get_stats()["sites"]["studio"]["active"] == 0
+
+    asyncio.run(main())
+
+
+def test_cancelled_transfer_with_reserved_slot():
+    async def main():
+        scheduler = TransferScheduler({"studio": {"max_parallel": 1}})
+        holder = scheduler.transfer("studio", "sftp")
+        await holder.__aenter__()
+
+        started = []
+        waiting = asyncio.ensure_future(_transfer(scheduler, "a", started))
+        await asyncio.sleep(0)
+
+        # Release the slot so it's reserved for waiting transfer, then
+        #   cancel the transfer before it's resumed
+        await holder.__aexit__(None, None, None)
+        assert scheduler.get_stats()["sites"]["studio"]["active"] == 1
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        assert not started
+        assert scheduler.get_stats()["sites"]["studio"]["active"] == 0
+
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""Test file for batched writes of site updates of sync server."""
+import pytest
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from openpype.modules.sync_server import update_queue
+from openpype.modules.sync_server.update_queue import SiteUpdateQueue
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.batches = []
+        self.errors = []
+        self.on_write = None
+
+    def bulk_write(self, requests, ordered=True):
+        if self.on_write is not None:
+            self.on_write()
+        if self.errors:
+            raise self.errors.pop(0)
+        self.batches.append([request._doc for request in requests])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(update_queue.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def collection():
+    return FakeCollection()
+
+
+@pytest.fixture
+def site_queue(collection, clock):
+    return SiteUpdateQueue(
+        lambda name: collection, flush_interval=10, max_batch_size=100
+    )
+
+
+def _add(site_queue, value, file_id=None, progress=False):
+    file_key = None
+    if file_id is not None:
+        file_key = ("repre_id", file_id, "studio")
+    site_queue.add(
+        "test_project", {"_id": value}, {"$set": {"value": value}},
+        [{"s.name": "studio"}], file_key=file_key, progress=progress
+    )
+
+
+def _written_values(collection):
+    return [
+        doc["$set"]["value"]
+        for batch in collection.batches
+        for doc in batch
+    ]
+
+
+def test_progress_is_debounced_per_file(site_queue, collection):
+    for progress in (0.1, 0.2, 0.3):
+        _add(site_queue, "a_{}".format(progress), "a", progress=True)
+    _add(site_queue, "b_0.5", "b", progress=True)
+    assert len(site_queue) == 2
+
+    site_queue.flush()
+    assert _written_values(collection) == ["a_0.3", "b_0.5"]
+
+
+def test_final_update_drops_pending_progress(site_queue, collection):
+    _add(site_queue, "a_progress", "a", progress=True)
+    _add(site_queue, "b_progress", "b", progress=True)
+    _add(site_queue, "a_synced", "a")
+
+    site_queue.flush()
+    assert _written_values(collection) == ["b_progress", "a_synced"]
+
+
+def test_flush_on_size_and_age(site_queue, collection, clock):
+    site_queue.max_batch_size = 3
+    _add(site_queue, 1)
+    _add(site_queue, 2)
+    assert not collection.batches
+    _add(site_queue, 3)
+    assert _written_values(collection) == [1, 2, 3]
+
+    _add(site_queue, 4)
+    clock[0] += 5
+    _add(site_queue, 5)
+    assert len(collection.batches) == 1
+    clock[0] += 5
+    _add(site_queue, 6)
+    assert _written_values(collection) == [1, 2, 3, 4, 5, 6]
+    assert len(site_queue) == 0
+
+
+def test_failed_write_is_queued_again(site_queue, collection):
+    _add(site_queue, "a_progress_1", "a", progress=True)
+    _add(site_queue, "b_progress", "b", progress=True)
+    _add(site_queue, "c_synced", "c")
+
+    def on_write():
+        # Updates added by other threads during the write
+        collection.on_write = None
+        _add(site_queue, "a_progress_2", "a", progress=True)
+        _add(site_queue, "b_synced", "b")
+
+    collection.on_write = on_write
+    collection.errors.append(AutoReconnect("Connection lost"))
+    site_queue.flush()
+    assert not collection.batches
+
+    site_queue.flush()
+    # Newer progress and final update are not overwritten
+    assert _written_values(collection) == [
+        "c_synced", "a_progress_2", "b_synced"
+    ]
+
+
+def test_rejected_update_is_dropped(site_queue, collection):
+    for value in (1, 2, 3):
+        _add(site_queue, value)
+    collection.errors.append(BulkWriteError({
+        "writeErrors": [{"index": 1, "errmsg": "Invalid update"}]
+    }))
+    site_queue.flush()
+
+    # First update was written, second is rejected
+    assert len(site_queue) == 1
+    site_queue.flush()
+    assert _written_values(collection) == [3]
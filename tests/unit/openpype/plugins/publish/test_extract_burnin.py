@@ -0,0 +1,18 @@
+from openpype.plugins.publish.extract_burnin import ExtractBurnin
+
+
+def test_repres_is_valid():
+    plugin = ExtractBurnin()
+    repre = {"name": "h264", "tags": ["burnin"], "files": ["review.mp4"]}
+    assert plugin.repres_is_valid(repre)
+
+    # Burnins were applied during encoding by ExtractReview
+    repre["burnin_applied"] = True
+    assert not plugin.repres_is_valid(repre)
+
+    assert not plugin.repres_is_valid(
+        {"name": "h264", "tags": ["review"], "files": ["review.mp4"]}
+    )
+    assert not plugin.repres_is_valid(
+        {"name": "h264", "tags": ["burnin"], "files": []}
+    )
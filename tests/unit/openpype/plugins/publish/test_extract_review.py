@@ -1,3 +1,6 @@
+import os
+
+from openpype.plugins.publish import extract_review
 from openpype.plugins.publish.extract_review import ExtractReview
 
 
@@ -27,3 +30,171 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def _output_item(input_args, video_filters, output_args, is_image=False):
+    return {
+        "temp_data": {"output_ext_is_image": is_image},
+        "ffmpeg_args_parts": {
+            "input_args": list(input_args),
+            "video_filters": list(video_filters),
+            "audio_filters": [],
+            "output_args": list(output_args),
+            "last_video_filters": []
+        }
+    }
+
+
+def test_shared_decode_groups_outputs_by_input():
+    plugin = ExtractReview()
+    plugin.shared_decode = True
+    input_args = ["-start_number 1001", "-to 4.0", "-i /in.%04d.exr"]
+    items = [
+        _output_item(input_args, ["scale=1920:1080"], ["-y", "/out.mp4"]),
+        _output_item(input_args, [], ["-y", "/out.mov"]),
+        # Labeled pads can't be used in branch of filter graph
+        _output_item(input_args, ["split=2[bg][fg]"], ["-y", "/bg.mov"]),
+        # Different frame range
+        _output_item(
+            ["-start_number 1001", "-to 0.04", "-i /in.%04d.exr"],
+            [],
+            ["-y", "/out.jpg"],
+            is_image=True
+        )
+    ]
+    groups = plugin.group_output_items(items)
+    assert [len(group) for group in groups] == [2, 1, 1]
+
+    plugin.shared_decode = False
+    groups = plugin.group_output_items(items)
+    assert [len(group) for group in groups] == [1, 1, 1, 1]
+
+
+def test_shared_decode_args():
+    plugin = ExtractReview()
+    plugin.shared_decode = True
+    input_args = ["-i /in.%04d.exr"]
+    items = [
+        _output_item(input_args, ["scale=1920:1080"], [
+            "-vf eq=gamma=1.2", "-y", "/out.mp4"
+        ]),
+        _output_item(input_args, [], ["-y", "/out.jpg"], is_image=True)
+    ]
+    groups = plugin.group_output_items(items)
+    ret = plugin.ffmpeg_shared_input_args(groups[0])
+    assert ret[1:] == [
+        "-i /in.%04d.exr",
+        "-filter_complex",
+        '"[0:v]split=2[s0][s1];[s0]scale=1920:1080,eq=gamma=1.2[v0]"',
+        '-map "[v0]"',
+        '-map "0:a?"',
+        "-y",
+        "/out.mp4",
+        '-map "[s1]"',
+        "-y",
+        "/out.jpg"
+    ]
+
+
+def _burnins_prep():
+    burnin_defs = {
+        "burnin": {
+            "top_left": "{asset}",
+            "filter": {"families": [], "tags": []}
+        },
+        "slate": {
+            "bottom_left": "{frame_start}",
+            "filter": {"families": [], "tags": ["slate-frame"]}
+        }
+    }
+    return {
+        "options": None,
+        "burnin_defs": burnin_defs,
+        "burnin_data": {},
+        "temp_data": {}
+    }
+
+
+def test_output_burnin_with_single_definition():
+    plugin = ExtractReview()
+    burnins_prep = _burnins_prep()
+
+    output_burnin = plugin.get_output_burnin(
+        burnins_prep, {"tags": ["review", "burnin"]}
+    )
+    assert output_burnin["burnin_def"]["top_left"] == "{asset}"
+    # Preparation data are not modified
+    assert "burnin_def" not in burnins_prep
+
+    # Definition linked to representation
+    output_burnin = plugin.get_output_burnin(
+        burnins_prep,
+        {"tags": ["burnin", "slate-frame"], "burnins": ["slate"]}
+    )
+    assert output_burnin["burnin_def"]["bottom_left"] == "{frame_start}"
+
+
+def test_output_burnin_skipped():
+    plugin = ExtractReview()
+    burnins_prep = _burnins_prep()
+
+    # Multiple matching definitions are processed by ExtractBurnin
+    assert plugin.get_output_burnin(
+        burnins_prep, {"tags": ["burnin", "slate-frame"]}
+    ) is None
+    assert plugin.get_output_burnin(
+        burnins_prep, {"tags": ["review"]}
+    ) is None
+
+
+def test_convert_sequence_with_handles_and_gap(tmpdir, monkeypatch):
+    """Handle frames are converted and gaps are filled in converted dir."""
+    src_dir = str(tmpdir.mkdir("src"))
+    temp_dir = str(tmpdir.mkdir("converted"))
+    # Frames 1001-1010 with handles of 5 frames, frame 1004 is missing
+    files = [
+        "beauty.{}.exr".format(frame)
+        for frame in range(996, 1016)
+        if frame != 1004
+    ]
+    for filename in files:
+        open(os.path.join(src_dir, filename), "w").close()
+
+    convert_calls = []
+
+    def convert_for_ffmpeg(
+        first_input_path, output_dir, frame_start, frame_end, logger=None,
+        workers=None, frames=None
+    ):
+        convert_calls.append((frame_start, frame_end, frames))
+        for frame in frames:
+            filename = "beauty.{}.exr".format(frame)
+            assert os.path.exists(os.path.join(src_dir, filename))
+            open(os.path.join(output_dir, filename), "w").close()
+
+    monkeypatch.setattr(
+        extract_review, "get_transcode_temp_directory", lambda: temp_dir
+    )
+    monkeypatch.setattr(
+        extract_review, "convert_for_ffmpeg", convert_for_ffmpeg
+    )
+
+    plugin = ExtractReview()
+    repre = {"files": files, "stagingDir": src_dir}
+    plugin.convert_repre_for_ffmpeg(
+        repre, os.path.join(src_dir, files[0])
+    )
+    assert repre["stagingDir"] == temp_dir
+    frame_start, frame_end, frames = convert_calls[0]
+    assert (frame_start, frame_end) == (996, 1015)
+    assert 1004 not in frames
+    assert len(frames) == len(files)
+
+    files_to_clean = plugin.fill_sequence_gaps(
+        repre["files"], repre["stagingDir"], 1001, 1010
+    )
+    assert files_to_clean == [os.path.join(temp_dir, "beauty.1004.exr")]
+    for frame in range(996, 1016):
+        assert os.path.exists(
+            os.path.join(temp_dir, "beauty.{}.exr".format(frame))
+        )
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cached project settings."""
+import copy
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.constants import PROJECT_SETTINGS_KEY
+
+
+class FakeSettingsHandler(object):
+    def __init__(self):
+        self.revision = 1
+        self.project_overrides = {"global": {"value": 2}}
+        self.calls = 0
+        self.bulk_calls = 0
+
+    def get_studio_project_settings_overrides(self, return_version):
+        return {}
+
+    def get_project_settings_overrides(self, project_name, return_version):
+        self.calls += 1
+        return copy.deepcopy(self.project_overrides)
+
+    def get_project_settings_revision(self, project_name):
+        return self.revision
+
+    def get_projects_settings_overrides(self, project_names):
+        self.bulk_calls += 1
+        return {
+            project_name: copy.deepcopy(self.project_overrides)
+            for project_name in project_names
+        }
+
+    def get_projects_settings_revisions(self, project_names):
+        return {
+            project_name: self.revision
+            for project_name in project_names
+        }
+
+
+class FakeLocalSettingsHandler(object):
+    revision = ("site", 1)
+
+    def get_local_settings(self):
+        return {}
+
+    def get_local_settings_revision(self):
+        return self.revision
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    handler = FakeSettingsHandler()
+    defaults = {
+        PROJECT_SETTINGS_KEY: {
+            "global": {"value": 1, "items": [1, 2]}
+        }
+    }
+    monkeypatch.setattr(lib, "_SETTINGS_HANDLER", handler)
+    monkeypatch.setattr(
+        lib, "_LOCAL_SETTINGS_HANDLER", FakeLocalSettingsHandler()
+    )
+    monkeypatch.setattr(lib, "get_default_settings", lambda: defaults)
+    monkeypatch.setattr(lib, "_PROJECT_SETTINGS_CACHE", {})
+    yield handler
+
+
+def test_project_settings_are_cached(handler):
+    settings = lib.get_project_settings("test_project")
+    assert settings == {"global": {"value": 2, "items": [1, 2]}}
+    assert handler.calls == 1
+
+    # Returned copy can be modified without affecting cache
+    settings["global"]["value"] = 3
+    assert lib.get_project_settings("test_project")["global"]["value"] == 2
+    assert handler.calls == 1
+
+    # Change of revision invalidates cache
+    handler.revision = 2
+    handler.project_overrides["global"]["value"] = 4
+    assert lib.get_project_settings("test_project")["global"]["value"] == 4
+    assert handler.calls == 2
+
+
+def test_readonly_project_settings(handler):
+    settings = lib.get_project_settings("test_project", readonly=True)
+    assert settings is lib.get_project_settings("test_project", readonly=True)
+    with pytest.raises(TypeError):
+        settings["global"]["value"] = 3
+    with pytest.raises(TypeError):
+        settings["global"]["items"].append(3)
+
+    settings_copy = copy.deepcopy(settings)
+    assert type(settings_copy["global"]) is dict
+    assert type(settings_copy["global"]["items"]) is list
+    assert settings_copy == settings
+
+
+def test_unknown_revision_is_not_cached(handler):
+    handler.revision = None
+    lib.get_project_settings("test_project")
+    lib.get_project_settings("test_project")
+    assert handler.calls == 2
+
+
+def test_projects_settings_use_one_bulk_query(handler):
+    project_names = ["project_{}".format(idx) for idx in range(5)]
+    settings_by_project = lib.get_projects_settings(project_names)
+    assert handler.bulk_calls == 1
+    assert handler.calls == 0
+    assert set(settings_by_project) == set(project_names)
+    for project_name in project_names:
+        assert settings_by_project[project_name] == (
+            lib.get_project_settings(project_name)
+        )
+    # Settings of projects are cached
+    assert handler.calls == 0
+
+    lib.get_projects_settings(project_names)
+    assert handler.bulk_calls == 1